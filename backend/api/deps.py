@@ -1,21 +1,52 @@
+import math
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated, AsyncGenerator
 
-from fastapi import Depends, HTTPException, Path, status
+from fastapi import Depends, HTTPException, Path, Query, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.utils import check_board_access
-from core.database import AsyncSessionLocal
+from core import rate_limit
+from core.config import settings
+from core.database import (
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    read_engine,
+    wrote_recently,
+)
+from core.rate_limit import RATE_LIMITED, BucketLimit
 from core.security import decode_access_token
+from core.share_links import (
+    InvalidShareLinkError,
+    ShareLinkClaims,
+    verify_share_link,
+)
 from models.board import Board
+from models.group import Group
 from models.permission import Permission
 from models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
+# Для эндпоинтов, куда можно прийти и без входа (по ссылке на доску)
+optional_oauth2_scheme = OAuth2PasswordBearer(
+    tokenUrl="/api/v1/auth/login", auto_error=False
+)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Сессия основной БД на время обработки запроса.
+
+    Создание сессии не занимает соединение: оно берётся из пула при первом
+    запросе к БД, поэтому запросы, отклонённые до обращения к БД (например,
+    с невалидным токеном), пул не трогают. Зависимость объявлена со
+    scope="function": сессия закрывается, и соединение возвращается в пул
+    сразу после того, как эндпоинт сформировал ответ, — до отправки ответа
+    клиенту и выполнения фоновых задач.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -23,7 +54,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-SessionDep = Annotated[AsyncSession, Depends(get_db)]
+SessionDep = Annotated[AsyncSession, Depends(get_db, scope="function")]
 
 
 async def get_current_user(
@@ -68,12 +99,181 @@ async def get_current_user(
     if user is None:
         raise credentials_exception
 
+    # По этому ключу сессия после коммита включает read-your-writes
+    db.info["user_id"] = user.user_id
+
     return user
 
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
 
+async def get_current_admin(current_user: CurrentUser) -> User:
+    """
+    Проверяет, что текущий пользователь — администратор (его логин в ADMIN_LOGINS).
+
+    Raises:
+        HTTPException: Если пользователь не администратор
+    """
+    if current_user.login not in settings.ADMIN_LOGINS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
+    return current_user
+
+
+AdminUser = Annotated[User, Depends(get_current_admin)]
+
+
+@asynccontextmanager
+async def _read_session(
+    db: AsyncSession, user_id: int | None
+) -> AsyncIterator[AsyncSession]:
+    """Реплика, если она настроена и пользователь user_id недавно не писал."""
+    if read_engine is None or (user_id is not None and wrote_recently(user_id)):
+        yield db
+        return
+
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def get_read_db(
+    db: SessionDep,
+    current_user: CurrentUser,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Сессия для эндпоинтов, которые только читают.
+
+    Если настроена реплика, запросы идут на неё, кроме случая, когда пользователь
+    сам недавно писал (READ_YOUR_WRITES_SECONDS) — тогда используется основная БД,
+    чтобы он увидел собственные изменения. Без реплики возвращается та же сессия,
+    что и SessionDep.
+    """
+    async with _read_session(db, current_user.user_id) as session:
+        yield session
+
+
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db, scope="function")]
+
+
+async def _consume_buckets(
+    response: Response,
+    buckets: list[tuple[str, str, BucketLimit]],
+    spend: bool = True,
+) -> None:
+    """
+    Списывает по токену из каждой корзины (scope, ключ, лимит) — из всех
+    сразу или ни из одной. С spend=False только проверяет, что токены есть.
+
+    Raises:
+        HTTPException: 429 с Retry-After, если какая-то корзина пуста
+    """
+    limiter = rate_limit.rate_limiter
+    if limiter is None:
+        return
+
+    keys = [(key, limit) for _, key, limit in buckets]
+    if spend:
+        results = await limiter.consume_all(keys)
+    else:
+        results = [await limiter.check(key, limit) for key, limit in keys]
+
+    for (scope, _, limit), result in zip(buckets, results):
+        if not result.allowed:
+            RATE_LIMITED.labels(scope).inc()
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail={
+                    "error": "RATE_LIMITED",
+                    "message": "Слишком много запросов, повторите позже",
+                },
+                headers={
+                    "Retry-After": str(math.ceil(result.retry_after)),
+                    "X-RateLimit-Limit": str(limit.burst),
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Scope": scope,
+                },
+            )
+
+    if spend and results:
+        limit, result = min(
+            zip((limit for _, _, limit in buckets), results),
+            key=lambda pair: pair[1].remaining,
+        )
+        response.headers["X-RateLimit-Limit"] = str(limit.burst)
+        response.headers["X-RateLimit-Remaining"] = str(result.remaining)
+
+
+def _token_subject(token: str) -> str | None:
+    payload = decode_access_token(token)
+    if payload is None or payload.get("sub") is None:
+        return None
+    return str(payload["sub"])
+
+
+def _user_write_bucket(user_id: int | str) -> tuple[str, str, BucketLimit]:
+    return (
+        "user",
+        f"user:{user_id}",
+        BucketLimit(
+            settings.RATE_LIMIT_USER_PER_SECOND, settings.RATE_LIMIT_USER_BURST
+        ),
+    )
+
+
+async def check_user_writes(
+    response: Response,
+    token: str = Depends(oauth2_scheme),
+) -> None:
+    """
+    Ранняя проверка корзины пользователя по JWT, без обращения к БД:
+    пользователь, исчерпавший лимит, получает 429, не занимая соединение.
+    Токен не списывается — это делает limit_board_writes после проверки прав.
+
+    Raises:
+        HTTPException: 429 с Retry-After, если корзина пуста
+    """
+    subject = _token_subject(token)
+    if subject is not None:
+        await _consume_buckets(response, [_user_write_bucket(subject)], spend=False)
+
+
+async def limit_user_lookups(
+    response: Response,
+    token: str = Depends(oauth2_scheme),
+) -> None:
+    """
+    Ограничивает частоту подсказок логинов: корзина токенов на пользователя.
+
+    Как и check_user_writes, не обращается к БД; запрос с невалидным
+    токеном отклонит следующая зависимость.
+
+    Raises:
+        HTTPException: 429 с Retry-After, если корзина пуста
+    """
+    subject = _token_subject(token)
+    if subject is None:
+        return
+    await _consume_buckets(
+        response,
+        [
+            (
+                "lookup",
+                f"lookup:{subject}",
+                BucketLimit(
+                    settings.RATE_LIMIT_LOOKUP_PER_SECOND,
+                    settings.RATE_LIMIT_LOOKUP_BURST,
+                ),
+            )
+        ],
+    )
+
+
 async def get_board_by_id(
     db: SessionDep,
     board_id: int = Path(..., description="ID доски"),
@@ -91,7 +291,9 @@ async def get_board_by_id(
     Raises:
         HTTPException: Если доска не найдена
     """
-    result = await db.execute(select(Board).where(Board.board_id == board_id))
+    result = await db.execute(
+        select(Board).where(Board.board_id == board_id, Board.deleted_at.is_(None))
+    )
     board = result.scalar_one_or_none()
 
     if board is None:
@@ -161,6 +363,158 @@ async def require_board_edit(
     return board, permission
 
 
+async def get_board_reader(
+    db: SessionDep,
+    board_id: int = Path(..., description="ID доски"),
+    link: str | None = Query(
+        default=None,
+        max_length=512,
+        description="Токен ссылки на доску; заменяет авторизацию",
+    ),
+    token: str | None = Depends(optional_oauth2_scheme),
+) -> tuple[Board, Permission] | ShareLinkClaims:
+    """
+    Доступ на чтение доски: по ссылке или как get_board_with_access.
+
+    Ссылка проверяется только по подписи, сроку и deny-list, без обращения
+    к БД: ни пользователь, ни права, ни сама доска не загружаются.
+
+    Returns:
+        ShareLinkClaims для ссылки, иначе доска и уровень прав пользователя
+
+    Raises:
+        HTTPException: 401, если ссылка недействительна или выдана на другую
+            доску, а без ссылки — как get_board_with_access
+    """
+    if link is not None:
+        try:
+            claims = verify_share_link(link)
+        except InvalidShareLinkError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail={"error": "INVALID_SHARE_LINK", "message": str(exc)},
+            ) from exc
+        if claims.board_id != board_id:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail={
+                    "error": "INVALID_SHARE_LINK",
+                    "message": "Ссылка выдана на другую доску",
+                },
+            )
+        return claims
+
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    current_user = await get_current_user(db, token)
+    board = await get_board_by_id(db, board_id)
+    return await get_board_with_access(db, current_user, board)
+
+
 BoardWithAccess = Annotated[tuple[Board, Permission], Depends(get_board_with_access)]
 BoardWithOwner = Annotated[tuple[Board, Permission], Depends(require_board_owner)]
 BoardWithEdit = Annotated[tuple[Board, Permission], Depends(require_board_edit)]
+BoardReader = Annotated[
+    tuple[Board, Permission] | ShareLinkClaims, Depends(get_board_reader)
+]
+
+
+async def limit_board_writes(
+    user_checked: Annotated[None, Depends(check_user_writes)],
+    response: Response,
+    board_with_edit: BoardWithEdit,
+    current_user: CurrentUser,
+) -> None:
+    """
+    Ограничивает частоту записи на доску: корзина токенов на пользователя
+    и на доску.
+
+    Подключается через dependencies=[...] маршрута. Сначала без БД
+    проверяется корзина пользователя (check_user_writes), а списываются
+    обе корзины только после того, как пользователь прошёл авторизацию и
+    проверку прав на запись: запросы без доступа к доске не расходуют её
+    лимит. В ответ добавляются X-RateLimit-Limit и X-RateLimit-Remaining
+    самой исчерпанной корзины.
+
+    Raises:
+        HTTPException: 429 с Retry-After, если корзина пуста
+    """
+    board, _ = board_with_edit
+    await _consume_buckets(
+        response,
+        [
+            _user_write_bucket(current_user.user_id),
+            (
+                "board",
+                f"board:{board.board_id}",
+                BucketLimit(
+                    settings.RATE_LIMIT_BOARD_PER_SECOND,
+                    settings.RATE_LIMIT_BOARD_BURST,
+                ),
+            ),
+        ],
+    )
+
+
+async def get_board_read_db(
+    db: SessionDep,
+    reader: BoardReader,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Сессия для чтения доски, как get_read_db. Держатель ссылки ничего не
+    пишет, поэтому ему всегда подходит реплика.
+    """
+    user_id = None if isinstance(reader, ShareLinkClaims) else db.info.get("user_id")
+    async with _read_session(db, user_id) as session:
+        yield session
+
+
+BoardReadSessionDep = Annotated[
+    AsyncSession, Depends(get_board_read_db, scope="function")
+]
+
+
+async def get_public_read_db(db: SessionDep) -> AsyncGenerator[AsyncSession, None]:
+    """Сессия для чтения без входа: анонимный читатель не пишет, ему подходит реплика."""
+    async with _read_session(db, None) as session:
+        yield session
+
+
+PublicReadSessionDep = Annotated[
+    AsyncSession, Depends(get_public_read_db, scope="function")
+]
+
+
+async def get_owned_group(
+    db: SessionDep,
+    current_user: CurrentUser,
+    group_id: int = Path(..., description="ID группы"),
+) -> Group:
+    """
+    Получает группу и проверяет, что пользователь ей управляет.
+
+    Raises:
+        HTTPException: Если группа не найдена или пользователь не владелец
+    """
+    group = await db.get(Group, group_id)
+    if group is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "GROUP_NOT_FOUND", "message": "Группа не найдена"},
+        )
+    if group.owner_id != current_user.user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "error": "NOT_GROUP_OWNER",
+                "message": "Группой управляет только её владелец",
+            },
+        )
+    return group
+
+
+OwnedGroup = Annotated[Group, Depends(get_owned_group)]
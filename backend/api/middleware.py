@@ -0,0 +1,442 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sys
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core import admission
+from core.config import settings
+from core.idempotency import (
+    IDEMPOTENCY_REQUESTS,
+    IDEMPOTENT_PATHS,
+    MAX_KEY_LENGTH,
+    REPLAYED_HEADERS,
+    StoredResponse,
+    idempotency_store,
+)
+from core.metrics import Counter, Gauge, Histogram
+from core.profiling import RequestProfiler, profile_store
+from core.query_stats import collect_query_stats
+from core.security import decode_access_token
+
+logger = logging.getLogger("mirumir.requests")
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса по маршрутам",
+    labelnames=("method", "route"),
+)
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP-запросов по маршрутам и статусам",
+    labelnames=("method", "route", "status"),
+)
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP-запросов в обработке")
+
+# Запросы, не попавшие ни в один маршрут, считаются вместе: путь из URL
+# в метке дал бы неограниченное число рядов
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class QueryStatsMiddleware:
+    """
+    Считает SQL-запросы каждого HTTP-запроса.
+
+    Итог отдаётся в заголовке Server-Timing (db — время в БД, total — время
+    до начала ответа) и пишется в лог mirumir.requests с полями в extra.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        with collect_query_stats() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    total_ms = (time.perf_counter() - started) * 1000
+                    headers = MutableHeaders(scope=message)
+                    db_ms = stats.total_seconds * 1000
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={db_ms:.1f};desc="{stats.count} queries", '
+                        f"total;dur={total_ms:.1f}",
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                logger.info(
+                    "%s %s %s db_queries=%d db_ms=%.1f slowest_ms=%.1f",
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    stats.count,
+                    stats.total_seconds * 1000,
+                    stats.slowest_seconds * 1000,
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status_code": status_code,
+                        "duration_ms": (time.perf_counter() - started) * 1000,
+                        "db_queries": stats.count,
+                        "db_ms": stats.total_seconds * 1000,
+                        "db_slowest_ms": stats.slowest_seconds * 1000,
+                        "db_slowest_statement": (stats.slowest_statement or "")[:500],
+                    },
+                )
+
+
+class MetricsMiddleware:
+    """
+    Метрики HTTP: задержка и число запросов по шаблону маршрута, запросы в работе.
+
+    Шаблон (например, /api/v1/boards/{board_id}) берётся из scope["route"],
+    который FastAPI заполняет при выборе маршрута.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route = scope.get("route")
+            path = getattr(route, "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+            HTTP_REQUEST_SECONDS.labels(method, path).observe(
+                time.perf_counter() - started
+            )
+            HTTP_REQUESTS.labels(method, path, str(status_code)).inc()
+
+
+def _bearer_payload(scope: Scope) -> dict | None:
+    """Данные JWT из заголовка Authorization (без БД); None, если токена нет."""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer":
+                return None
+            return decode_access_token(token)
+    return None
+
+
+def _is_admin_request(scope: Scope) -> bool:
+    """Проверяет по JWT из Authorization, что запрос от администратора (без БД)."""
+    payload = _bearer_payload(scope)
+    return payload is not None and payload.get("login") in settings.ADMIN_LOGINS
+
+
+class ProfilingMiddleware:
+    """
+    Профилирует запрос с заголовком X-Profile: 1 от администратора.
+
+    Профиль покрывает зависимости, эндпоинт, время в БД и сериализацию;
+    его id возвращается в заголовке X-Profile-Id, а сам профиль доступен
+    через GET /api/v1/admin/profiles/{id}. Сверх PROFILE_MAX_PER_MINUTE
+    запрос выполняется без профилирования с X-Profile-Skipped: rate-limited.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not any(
+            name == b"x-profile" and value not in (b"", b"0")
+            for name, value in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if not _is_admin_request(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not profile_store.try_acquire():
+
+            async def send_skipped(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append(
+                        "X-Profile-Skipped", "rate-limited"
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_skipped)
+            return
+
+        profiler = RequestProfiler(root=sys._getframe())
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_profile_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(
+                    "X-Profile-Id", profiler.profile_id
+                )
+            await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            profile_store.release()
+            await asyncio.to_thread(
+                profile_store.save,
+                profiler,
+                {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status_code": status_code,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                },
+            )
+
+
+class AdmissionMiddleware:
+    """
+    Допуск запросов под нагрузкой (см. core.admission).
+
+    Запрос, не дождавшийся слота, получает 503 с Retry-After, не доходя
+    до зависимостей и БД.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        controller = admission.admission_controller
+        if scope["type"] != "http" or controller is None:
+            await self.app(scope, receive, send)
+            return
+
+        classified = admission.classify_request(
+            scope["method"], scope["path"], scope["query_string"]
+        )
+        if classified is None:
+            await self.app(scope, receive, send)
+            return
+
+        request_class, route = classified
+        rejection = await controller.acquire(request_class, route)
+        if rejection is not None:
+            await _send_error(
+                send,
+                503,
+                "OVERLOADED",
+                "Сервер перегружен, повторите запрос позже",
+                [
+                    (
+                        b"retry-after",
+                        str(settings.ADMISSION_RETRY_AFTER_SECONDS).encode("latin-1"),
+                    )
+                ],
+            )
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(request_class, route)
+
+
+class IdempotencyMiddleware:
+    """
+    Idempotency-Key для создания досок и стикеров (см. core.idempotency).
+
+    Повтор запроса с тем же ключом от того же пользователя получает
+    сохранённый ответ оригинала с заголовком Idempotent-Replayed: true и не
+    создаёт дубликат. Повтор, пришедший, пока оригинал выполняется, ждёт его
+    ответа. Сохраняются только успешные (2xx) ответы: после ошибки повтор
+    выполняется заново. Из заголовков хранятся только описывающие
+    содержимое (REPLAYED_HEADERS), остальные выставляются для повтора
+    заново. Тот же ключ с другим телом — 422; если хранилище занято
+    выполняющимися оригиналами — 503 с Retry-After.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not any(pattern.match(scope["path"]) for pattern in IDEMPOTENT_PATHS)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        idempotency_key = next(
+            (value for name, value in scope["headers"] if name == b"idempotency-key"),
+            None,
+        )
+        payload = _bearer_payload(scope)
+        if idempotency_key is None or payload is None or "sub" not in payload:
+            # Без ключа или без пользователя — обычная обработка (и 401)
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await _send_error(
+                send,
+                400,
+                "INVALID_IDEMPOTENCY_KEY",
+                f"Idempotency-Key должен быть от 1 до {MAX_KEY_LENGTH} символов",
+            )
+            return
+
+        body = await _read_body(receive)
+        fingerprint = hashlib.sha256(body).digest()
+        key = (payload["sub"], scope["path"].rstrip("/"), idempotency_key)
+
+        while (entry := idempotency_store.get(key)) is not None:
+            if entry.fingerprint != fingerprint:
+                IDEMPOTENCY_REQUESTS.labels("mismatch").inc()
+                await _send_error(
+                    send,
+                    422,
+                    "IDEMPOTENCY_KEY_REUSED",
+                    "Idempotency-Key уже использован с другим телом запроса",
+                )
+                return
+            # shield: отмена повтора не должна отменять future оригинала
+            stored = await asyncio.shield(entry.future)
+            if stored is not None:
+                IDEMPOTENCY_REQUESTS.labels("replayed").inc()
+                await _send_stored(send, stored)
+                return
+
+        entry = idempotency_store.start(key, fingerprint)
+        if entry is None:
+            # Без записи повтор нельзя было бы отличить от нового запроса
+            IDEMPOTENCY_REQUESTS.labels("rejected").inc()
+            await _send_error(
+                send,
+                503,
+                "IDEMPOTENCY_STORE_FULL",
+                "Слишком много запросов с Idempotency-Key, повторите позже",
+                [
+                    (
+                        b"retry-after",
+                        str(settings.ADMISSION_RETRY_AFTER_SECONDS).encode("latin-1"),
+                    )
+                ],
+            )
+            return
+        IDEMPOTENCY_REQUESTS.labels("new").inc()
+        body_sent = False
+
+        async def receive_body() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        status_code = 500
+        headers: list[tuple[bytes, bytes]] = []
+        chunks: list[bytes] = []
+
+        async def send_and_record(message: Message) -> None:
+            nonlocal status_code, headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", [])
+                    if name.lower() in REPLAYED_HEADERS
+                ]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        stored = None
+        try:
+            await self.app(scope, receive_body, send_and_record)
+            if 200 <= status_code < 300:
+                stored = StoredResponse(status_code, headers, b"".join(chunks))
+        finally:
+            idempotency_store.finish(key, entry, stored)
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+async def _send_stored(send: Send, stored: StoredResponse) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": stored.status,
+            "headers": [
+                *stored.headers,
+                (b"content-length", str(len(stored.body)).encode("latin-1")),
+                (b"idempotent-replayed", b"true"),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": stored.body})
+
+
+async def _send_error(
+    send: Send,
+    status_code: int,
+    error: str,
+    message: str,
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> None:
+    """Ответ об ошибке в формате HTTPException: {"detail": {"error", "message"}}."""
+    body = json.dumps(
+        {"detail": {"error": error, "message": message}}, ensure_ascii=False
+    ).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                *(headers or []),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -1,8 +1,8 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models.access import Access
 from models.board import Board
+from models.effective_permission import EffectivePermission
 from models.permission import Permission
 from models.user import User
 
@@ -11,16 +11,19 @@ async def get_user_permission(
     user: User,
     board: Board,
     db: AsyncSession,
-    accesses_cache: dict[int, Access] | None = None,
+    permissions_cache: dict[int, Permission] | None = None,
 ) -> Permission | None:
     """
     Определяет права пользователя на доску.
 
+    Выданные права (напрямую и через группы) читаются из
+    effective_permissions одним запросом по первичному ключу.
+
     Args:
         user: Пользователь
         board: Доска
         db: Сессия базы данных
-        accesses_cache: Опциональный кэш Access по board_id для оптимизации
+        permissions_cache: Опциональный кэш выданных прав по board_id для оптимизации
 
     Returns:
         Permission | None: Уровень прав или None если нет доступа
@@ -29,19 +32,18 @@ async def get_user_permission(
         return Permission.OWNER
 
     # Используем кэш если передан, иначе делаем запрос
-    if accesses_cache is not None:
-        access = accesses_cache.get(board.board_id)
+    if permissions_cache is not None:
+        permission = permissions_cache.get(board.board_id)
     else:
-        result = await db.execute(
-            select(Access).where(
-                Access.board_id == board.board_id,
-                Access.user_id == user.user_id,
+        permission = await db.scalar(
+            select(EffectivePermission.permission).where(
+                EffectivePermission.user_id == user.user_id,
+                EffectivePermission.board_id == board.board_id,
             )
         )
-        access = result.scalar_one_or_none()
 
-    if access:
-        return access.permission
+    if permission is not None:
+        return permission
 
     if board.is_public:
         return Permission.VIEW
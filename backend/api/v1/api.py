@@ -1,8 +1,25 @@
 from fastapi import APIRouter
-from api.v1.endpoints import auth, boards, sharing, stickers
+from api.v1.endpoints import (
+    admin,
+    auth,
+    boards,
+    groups,
+    jobs,
+    live,
+    search,
+    sharing,
+    stickers,
+    users,
+)
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["Auth"])
 api_router.include_router(boards.router, prefix="/boards", tags=["Boards"])
 api_router.include_router(sharing.router, prefix="/boards", tags=["Sharing"])
 api_router.include_router(stickers.router, prefix="/boards", tags=["Stickers"])
+api_router.include_router(live.router, prefix="/boards", tags=["Live"])
+api_router.include_router(users.router, prefix="/users", tags=["Users"])
+api_router.include_router(groups.router, prefix="/groups", tags=["Groups"])
+api_router.include_router(search.router, prefix="/search", tags=["Search"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
+api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
@@ -0,0 +1,99 @@
+from fastapi import APIRouter, HTTPException, Path, Query, status
+from fastapi.responses import PlainTextResponse
+
+from api.deps import AdminUser
+from core.config import settings
+from core.profiling import profile_store
+from core.slow_queries import slow_query_log
+from schemas.admin import (
+    ProfileInfo,
+    ProfileListResponse,
+    SlowQueryInfo,
+    SlowQueryListResponse,
+)
+
+router = APIRouter()
+
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueryListResponse,
+    summary="Самые дорогие медленные запросы",
+    description="Медленные запросы процесса, сгруппированные по отпечатку",
+)
+async def get_slow_queries(
+    _: AdminUser,
+    limit: int = Query(default=20, ge=1, le=200, description="Количество записей"),
+) -> SlowQueryListResponse:
+    """
+    Список медленных запросов по убыванию суммарного времени.
+
+    Статистика хранится в памяти процесса; полный журнал — в SLOW_QUERY_LOG_FILE.
+    """
+    return SlowQueryListResponse(
+        thresholdMs=settings.SLOW_QUERY_THRESHOLD_MS,
+        queries=[
+            SlowQueryInfo(
+                fingerprint=entry.fingerprint,
+                statement=entry.statement,
+                parameterShapes=entry.parameter_shapes,
+                calls=entry.calls,
+                totalMs=round(entry.total_ms, 2),
+                maxMs=round(entry.max_ms, 2),
+                meanMs=round(entry.total_ms / entry.calls, 2),
+                lastSeenAt=entry.last_seen_at,
+                plan=entry.plan,
+            )
+            for entry in slow_query_log.top(limit)
+        ],
+    )
+
+
+@router.get(
+    "/profiles",
+    response_model=ProfileListResponse,
+    summary="Список профилей запросов",
+    description="Профили, снятые по заголовку X-Profile: 1",
+)
+async def get_profiles(
+    _: AdminUser,
+    limit: int = Query(default=20, ge=1, le=200, description="Количество записей"),
+) -> ProfileListResponse:
+    """Последние профили запросов, новые первыми."""
+    return ProfileListResponse(
+        profiles=[
+            ProfileInfo(
+                profileId=profile["profile_id"],
+                method=profile["method"],
+                path=profile["path"],
+                statusCode=profile["status_code"],
+                durationMs=profile["duration_ms"],
+                samples=profile["samples"],
+                intervalMs=profile["interval_ms"],
+                createdAt=profile["created_at"],
+            )
+            for profile in profile_store.list(limit)
+        ]
+    )
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    response_class=PlainTextResponse,
+    summary="Профиль запроса",
+    description="Стеки в collapsed-формате для flamegraph.pl или speedscope",
+)
+async def get_profile(
+    _: AdminUser,
+    profile_id: str = Path(..., description="ID профиля из заголовка X-Profile-Id"),
+) -> PlainTextResponse:
+    """
+    Профиль в collapsed-формате: строка на стек, кадры через «;», в конце число сэмплов.
+    """
+    collapsed = profile_store.read(profile_id)
+    if collapsed is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "PROFILE_NOT_FOUND", "message": "Профиль не найден"},
+        )
+    return PlainTextResponse(collapsed)
@@ -1,12 +1,16 @@
 from datetime import datetime, timedelta, timezone
 
-import bcrypt
 from fastapi import APIRouter, HTTPException, status
 from sqlalchemy import select
 
 from api.deps import SessionDep
 from core.config import settings
-from core.security import create_access_token, verify_password
+from core.security import (
+    create_access_token,
+    hash_password,
+    run_bcrypt,
+    verify_password,
+)
 from models.user import User
 from schemas.auth import (
     ErrorResponse,
@@ -17,14 +21,6 @@ from schemas.auth import (
 )
 
 
-def hash_password(password: str) -> str:
-    """Хеширует пароль с использованием bcrypt."""
-    password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode("utf-8")
-
-
 router = APIRouter()
 
 
@@ -66,7 +62,7 @@ async def register(request: RegisterRequest, db: SessionDep) -> RegisterResponse
             },
         )
 
-    hashed_password = hash_password(request.password)
+    hashed_password = await run_bcrypt(hash_password, request.password)
 
     new_user = User(
         login=request.login,
@@ -106,7 +102,9 @@ async def login(request: LoginRequest, db: SessionDep) -> LoginResponse:
     result = await db.execute(select(User).where(User.login == request.login))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(request.password, user.hash_password):
+    if not user or not await run_bcrypt(
+        verify_password, request.password, user.hash_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
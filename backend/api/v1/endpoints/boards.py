@@ -1,32 +1,105 @@
+import time
 from typing import Literal
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy import func, select, or_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from api.deps import (
+    BoardReader,
+    BoardReadSessionDep,
     BoardWithAccess,
     CurrentUser,
+    PublicReadSessionDep,
+    ReadSessionDep,
     SessionDep,
     BoardWithEdit,
     BoardWithOwner,
 )
 from api.utils import get_user_permission
-from models.access import Access
+from api.v1.endpoints.jobs import to_job_response
+from core.board_versions import board_version, bump_board_version, on_board_change
+from core.cache import TTLCache
+from core.config import settings
+from core.database import session_target
+from core.http_cache import CachedBody, accepts_gzip, etag_matches
+from core.jobs import enqueue_job, job_runner
+from core.live import live_hub
+from core.search import prefix_tsquery, search_query
+from core.share_links import ShareLinkClaims
+from core.singleflight import SingleFlight
+from core.streaming_json import StreamFormatError, iter_json_array, iter_ndjson
+from jobs.boards import (
+    BOARD_DELETE,
+    BOARD_DUPLICATE,
+    duplicate_board,
+    sticker_selection,
+)
+from models.effective_permission import EffectivePermission
 from models.board import Board
+from models.permission import Permission
 from models.sticker import Sticker
+from models.user import User
 from schemas.board import (
     BoardCreate,
     BoardDetail,
+    BoardDuplicate,
+    BoardImportResponse,
     BoardListResponse,
     BoardResponse,
     BoardSummary,
     StickerResponse,
     BoardUpdate,
 )
+from schemas.job import JobResponse
+from schemas.stickers import StickerCreate
 
 router = APIRouter()
 
+# Одновременные чтения одной версии доски из одной БД загружают её содержимое
+# один раз
+board_detail_flight: SingleFlight[BoardDetail] = SingleFlight("board_detail")
+# Снимки досок для пришедших по ссылке: один на версию доски для всех держателей
+# ссылок. Запись в доску в этом процессе меняет версию, в других воркерах
+# снимок устаревает не дольше чем через SHARE_LINK_SNAPSHOT_TTL_SECONDS
+board_snapshots: TTLCache[BoardDetail] = TTLCache(
+    "board_snapshot",
+    settings.SHARE_LINK_SNAPSHOT_MAX_ENTRIES,
+    settings.SHARE_LINK_SNAPSHOT_TTL_SECONDS,
+)
+# Готовые тела ответов публичных досок: (версия доски, тело и его gzip).
+# Запись в доску в этом процессе сбрасывает запись сразу, в других воркерах
+# она устаревает не дольше чем через PUBLIC_BOARD_CACHE_TTL_SECONDS
+public_board_bodies: TTLCache[tuple[int, CachedBody]] = TTLCache(
+    "public_board_body",
+    settings.PUBLIC_BOARD_CACHE_MAX_ENTRIES,
+    settings.PUBLIC_BOARD_CACHE_TTL_SECONDS,
+)
+on_board_change(public_board_bodies.delete)
+
+# Форматы импорта: NDJSON (запись в строке) или JSON-массив записей
+IMPORT_FORMATS = {
+    "application/x-ndjson": iter_ndjson,
+    "application/ndjson": iter_ndjson,
+    "application/jsonl": iter_ndjson,
+    "application/json": iter_json_array,
+}
+# Пачка стикеров проверяется одним вызовом pydantic-core прямо из байтов JSON
+sticker_batch_adapter = TypeAdapter(list[StickerCreate])
+STICKER_COPY_COLUMNS = (
+    "board_id",
+    "created_by",
+    "x",
+    "y",
+    "layer_level",
+    "text",
+    "width",
+    "height",
+    "color",
+)
+
 
 @router.post(
     "",
@@ -70,20 +143,234 @@ async def create_board(
     )
 
 
+@router.post(
+    "/import",
+    response_model=BoardImportResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Импорт доски",
+    description=(
+        "Создание доски со стикерами из потока NDJSON (application/x-ndjson) "
+        "или JSON-массива (application/json)"
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {
+                    "schema": {"type": "string"},
+                    "example": '{"title": "Импорт"}\n{"x": 10, "y": 20, "text": "a"}\n',
+                },
+                "application/json": {
+                    "schema": {"type": "array", "items": {"type": "object"}},
+                    "example": [{"title": "Импорт"}, {"x": 10, "y": 20, "text": "a"}],
+                },
+            },
+        }
+    },
+)
+async def import_board(
+    request: Request,
+    current_user: CurrentUser,
+    db: SessionDep,
+) -> BoardImportResponse:
+    """
+    Импорт доски из файла, загружаемого потоком.
+
+    Первая запись — доска (поля BoardCreate), остальные — стикеры (поля
+    StickerCreate). Тело разбирается по мере поступления: стикеры
+    проверяются пачками по IMPORT_BATCH_SIZE и записываются в БД через
+    COPY, поэтому память не растёт с размером файла. Импорт атомарен:
+    при первой ошибке доска не создаётся, а в ответе 422 указан номер записи.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    splitter = IMPORT_FORMATS.get(content_type.lower())
+    if splitter is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail={
+                "error": "UNSUPPORTED_FORMAT",
+                "message": "Ожидается application/x-ndjson или application/json",
+            },
+        )
+
+    records = splitter(request.stream(), settings.IMPORT_MAX_ITEM_BYTES)
+    # Записей уже разобрано целиком (доска и записанные пачки); batch — до
+    # try: ошибка формата может случиться ещё на записи доски
+    record_number = 0
+    batch: list[bytes] = []
+    try:
+        try:
+            header = await anext(records)
+        except StopAsyncIteration:
+            raise StreamFormatError("Нет записи доски") from None
+        record_number = 1
+        board_data = BoardCreate.model_validate_json(header)
+
+        new_board = Board(
+            creator_id=current_user.user_id,
+            title=board_data.title,
+            description=board_data.description,
+            background_color=board_data.backgroundColor,
+            is_public=False,
+        )
+        db.add(new_board)
+        await db.flush()
+
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        copy_connection = raw_connection.driver_connection
+
+        imported = 0
+        async for record in records:
+            batch.append(record)
+            if len(batch) >= settings.IMPORT_BATCH_SIZE:
+                imported += await _copy_sticker_batch(
+                    copy_connection,
+                    new_board.board_id,
+                    current_user.user_id,
+                    batch,
+                    record_number + 1,
+                )
+                record_number += len(batch)
+                batch.clear()
+            if imported + len(batch) > settings.IMPORT_MAX_STICKERS:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail={
+                        "error": "IMPORT_TOO_LARGE",
+                        "message": f"Не больше {settings.IMPORT_MAX_STICKERS} стикеров",
+                    },
+                )
+        if batch:
+            imported += await _copy_sticker_batch(
+                copy_connection,
+                new_board.board_id,
+                current_user.user_id,
+                batch,
+                record_number + 1,
+            )
+    except StreamFormatError as exc:
+        await db.rollback()
+        raise _invalid_import(record_number + len(batch) + 1, str(exc))
+    except ValidationError as exc:
+        # Ошибки стикеров _copy_sticker_batch превращает в 422 сам, здесь —
+        # только запись доски
+        await db.rollback()
+        raise _invalid_import(record_number, _validation_message(exc.errors()[0]))
+    except HTTPException:
+        await db.rollback()
+        raise
+
+    await db.commit()
+    await db.refresh(new_board)
+
+    return BoardImportResponse(
+        board=BoardResponse(
+            boardId=new_board.board_id,
+            title=new_board.title or "",
+            description=new_board.description,
+            ownerId=new_board.creator_id,
+            ownerName=current_user.login,
+            backgroundColor=new_board.background_color,
+            createdAt=new_board.created_at,
+            updatedAt=new_board.updated_at,
+        ),
+        stickersImported=imported,
+    )
+
+
+async def _copy_sticker_batch(
+    copy_connection,
+    board_id: int,
+    user_id: int,
+    batch: list[bytes],
+    first_record: int,
+) -> int:
+    """
+    Проверяет пачку записей как StickerCreate и пишет её через COPY.
+
+    Пачка проверяется одним вызовом. Если он не прошёл или стикеров
+    получилось не столько, сколько записей (строка NDJSON вида
+    {...},{...} склеилась бы в несколько стикеров), записи проверяются по
+    одной, чтобы назвать в 422 номер ошибочной — first_record для первой.
+    """
+    try:
+        stickers = sticker_batch_adapter.validate_json(b"[" + b",".join(batch) + b"]")
+    except ValidationError:
+        stickers = []
+    if len(stickers) != len(batch):
+        stickers = []
+        for index, record in enumerate(batch):
+            try:
+                parsed = sticker_batch_adapter.validate_json(b"[" + record + b"]")
+            except ValidationError as exc:
+                error = exc.errors()[0]
+                raise _invalid_import(
+                    first_record + index,
+                    _validation_message(error | {"loc": error["loc"][1:]}),
+                ) from None
+            if len(parsed) != 1:
+                raise _invalid_import(
+                    first_record + index, "Запись должна быть одним JSON-объектом"
+                )
+            stickers.append(parsed[0])
+    await copy_connection.copy_records_to_table(
+        "stickers",
+        columns=STICKER_COPY_COLUMNS,
+        records=[
+            (
+                board_id,
+                user_id,
+                sticker.x,
+                sticker.y,
+                sticker.layerLevel,
+                sticker.text,
+                sticker.width,
+                sticker.height,
+                sticker.color or "#FFEB3B",
+            )
+            for sticker in stickers
+        ],
+    )
+    return len(stickers)
+
+
+def _validation_message(error: dict) -> str:
+    field = ".".join(str(part) for part in error["loc"])
+    return f"{field}: {error['msg']}" if field else error["msg"]
+
+
+def _invalid_import(record_number: int, message: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        detail={
+            "error": "INVALID_IMPORT",
+            "message": f"Запись {record_number}: {message}",
+        },
+    )
+
+
 @router.get(
     "",
     response_model=BoardListResponse,
     summary="Получение списка досок",
-    description="Получение списка досок текущего пользователя (собственных и расшаренных)",
+    description="Получение списка досок текущего пользователя (собственных и расшаренных), "
+    "с полнотекстовым поиском по заголовку и описанию",
 )
 async def get_boards(
     current_user: CurrentUser,
-    db: SessionDep,
+    db: ReadSessionDep,
     board_filter: Literal["own", "shared", "all"] = Query(
         default="all",
         alias="filter",
         description="Фильтр досок: own (только свои), shared (только расшаренные), all (все)",
     ),
+    q: str | None = Query(
+        default=None,
+        min_length=1,
+        max_length=200,
+        description="Поиск по заголовку и описанию; слова ищутся по префиксу",
+    ),
     page: int = Query(default=1, ge=1, description="Номер страницы"),
     limit: int = Query(
         default=20, ge=1, le=100, description="Количество элементов на странице"
@@ -96,40 +383,50 @@ async def get_boards(
     ),
 ) -> BoardListResponse:
     """
-    Получение списка досок с фильтрацией, пагинацией и сортировкой.
+    Получение списка досок с фильтрацией, поиском, пагинацией и сортировкой.
 
     - filter: Фильтр досок (own/shared/all)
+    - q: Поисковая строка; результаты упорядочены по релевантности,
+      при равной релевантности — по sortBy
     - page: Номер страницы (начиная с 1)
     - limit: Количество элементов на странице (1-100)
     - sortBy: Поле для сортировки (createdAt/updatedAt/title)
     - sortOrder: Порядок сортировки (asc/desc)
     """
-    # Строим базовый запрос в зависимости от фильтра
+    # Доски, расшаренные пользователю напрямую или через группы, —
+    # подзапросом в том же запросе, чтобы права проверялись вместе с
+    # поиском и сортировкой
+    shared_board_ids = select(EffectivePermission.board_id).where(
+        EffectivePermission.user_id == current_user.user_id
+    )
     if board_filter == "own":
         base_query = select(Board).where(Board.creator_id == current_user.user_id)
     elif board_filter == "shared":
-        base_query = (
-            select(Board)
-            .join(Access, Board.board_id == Access.board_id)
-            .where(Access.user_id == current_user.user_id)
-            .where(Board.creator_id != current_user.user_id)
-            .distinct()
+        base_query = select(Board).where(
+            Board.board_id.in_(shared_board_ids),
+            Board.creator_id != current_user.user_id,
         )
     else:  # all
-        # Получаем все доски: свои + расшаренные
-        conditions = [Board.creator_id == current_user.user_id]
-
-        # Получаем ID расшаренных досок одним запросом
-        shared_board_ids_query = select(Access.board_id).where(
-            Access.user_id == current_user.user_id
+        base_query = select(Board).where(
+            or_(
+                Board.creator_id == current_user.user_id,
+                Board.board_id.in_(shared_board_ids),
+            )
         )
-        shared_board_ids_result = await db.execute(shared_board_ids_query)
-        shared_board_ids = [row[0] for row in shared_board_ids_result.all()]
 
-        if shared_board_ids:
-            conditions.append(Board.board_id.in_(shared_board_ids))
-
-        base_query = select(Board).where(or_(*conditions))
+    # Удалённые доски ждут очистки фоновой задачей и в списке не показываются
+    base_query = base_query.where(Board.deleted_at.is_(None))
+
+    if q is not None:
+        search = prefix_tsquery(q)
+        if search is None:
+            # В запросе нет ни одного слова — искать нечего
+            return BoardListResponse(boards=[])
+        tsquery = search_query(search)
+        base_query = base_query.where(Board.search_vector.bool_op("@@")(tsquery))
+        base_query = base_query.order_by(
+            func.ts_rank_cd(Board.search_vector, tsquery).desc()
+        )
 
     # Применяем сортировку
     if sortBy == "title":
@@ -160,16 +457,16 @@ async def get_boards(
     if not boards:
         return BoardListResponse(boards=[])
 
-    # Получаем все Access для этих досок одним запросом (избегаем N+1)
+    # Получаем права на эти доски одним запросом (избегаем N+1)
     board_ids = [board.board_id for board in boards]
-    accesses_query = select(Access).where(
-        Access.board_id.in_(board_ids),
-        Access.user_id == current_user.user_id,
+    permissions_query = select(
+        EffectivePermission.board_id, EffectivePermission.permission
+    ).where(
+        EffectivePermission.board_id.in_(board_ids),
+        EffectivePermission.user_id == current_user.user_id,
     )
-    accesses_result = await db.execute(accesses_query)
-    accesses_cache = {
-        access.board_id: access for access in accesses_result.scalars().all()
-    }
+    permissions_result = await db.execute(permissions_query)
+    permissions_cache = {row.board_id: row.permission for row in permissions_result}
 
     # Подсчитываем стикеры одним запросом (GROUP BY)
     sticker_counts_query = (
@@ -184,7 +481,7 @@ async def get_boards(
     board_summaries = []
     for board in boards:
         permission = await get_user_permission(
-            current_user, board, db, accesses_cache=accesses_cache
+            current_user, board, db, permissions_cache=permissions_cache
         )
 
         if permission is None:
@@ -213,30 +510,164 @@ async def get_boards(
     "/{board_id}",
     response_model=BoardDetail,
     summary="Получение доски по ID",
-    description="Получение полной информации о доске, включая все стикеры",
+    description="Получение полной информации о доске, включая все стикеры. "
+    "Вместо авторизации можно передать токен ссылки на доску в link",
 )
 async def get_board(
-    board_with_access: BoardWithAccess,
-    db: SessionDep,
+    reader: BoardReader,
+    response: Response,
+    db: BoardReadSessionDep,
 ) -> BoardDetail:
     """
     Получение доски по ID со всеми стикерами.
 
     - board_id: ID доски
+    - link: Токен ссылки на доску (вместо заголовка Authorization)
     - Возвращает полную информацию о доске и все стикеры
     """
-    board, permission = board_with_access
+    if isinstance(reader, ShareLinkClaims):
+        return await _get_board_by_link(reader, response, db)
 
-    await db.refresh(board, ["creator", "stickers"])
+    board, permission = reader
 
-    if board.creator is None:
+    # Права проверены по основной БД для каждого запроса отдельно; содержимое
+    # общее для всех, кто пришёл до следующей записи в доску и читает из той
+    # же БД: недавно писавший не присоединяется к загрузке с реплики
+    detail = await board_detail_flight.do(
+        (board.board_id, board_version(board.board_id), session_target(db)),
+        lambda: _load_board_detail(board, permission, db),
+    )
+    return detail.model_copy(update={"permission": permission.value})
+
+
+async def _get_board_by_link(
+    claims: ShareLinkClaims, response: Response, db: AsyncSession
+) -> BoardDetail:
+    """
+    Доска для держателя ссылки. Ответ одинаков для всех держателей ссылок
+    и может кэшироваться прокси, но не дольше, чем действует ссылка.
+    """
+    key = (claims.board_id, board_version(claims.board_id), session_target(db))
+    detail = board_snapshots.get(key)
+    if detail is None:
+
+        async def load() -> BoardDetail:
+            board = await db.scalar(
+                select(Board).where(
+                    Board.board_id == claims.board_id, Board.deleted_at.is_(None)
+                )
+            )
+            if board is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Board not found",
+                )
+            return await _load_board_detail(board, claims.permission, db)
+
+        detail = await board_detail_flight.do(key, load)
+        board_snapshots.set(key, detail)
+
+    max_age = min(
+        settings.SHARE_LINK_CACHE_MAX_AGE_SECONDS,
+        max(int(claims.expires_at - time.time()), 0),
+    )
+    response.headers["Cache-Control"] = f"public, max-age={max_age}"
+    return detail.model_copy(update={"permission": claims.permission.value})
+
+
+@router.get(
+    "/{board_id}/public",
+    response_model=BoardDetail,
+    summary="Получение публичной доски",
+    description="Публичная доска со стикерами без авторизации. Ответ одинаков "
+    "для всех и рассчитан на кэширование прокси: сильный ETag, Cache-Control "
+    "с stale-while-revalidate, заранее сжатое gzip-тело",
+    responses={304: {"description": "Доска не изменилась с версии из If-None-Match"}},
+)
+async def get_public_board(
+    board_id: int,
+    request: Request,
+    db: PublicReadSessionDep,
+) -> Response:
+    """
+    Получение публичной доски без входа.
+
+    Тело сериализуется и сжимается один раз на версию доски; пока версия не
+    изменилась, ответ отдаётся из памяти без обращения к БД. Закрытая,
+    удалённая и несуществующая доска неразличимы — 404.
+
+    - board_id: ID доски
+    - If-None-Match: ETag ранее полученного ответа — 304 без тела
+    """
+    version = board_version(board_id)
+    cached = public_board_bodies.get(board_id)
+    if cached is None or cached[0] != version:
+        board = await db.scalar(
+            select(Board).where(
+                Board.board_id == board_id,
+                Board.is_public.is_(True),
+                Board.deleted_at.is_(None),
+            )
+        )
+        if board is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Board not found",
+            )
+        detail = await board_detail_flight.do(
+            (board_id, version, session_target(db)),
+            lambda: _load_board_detail(board, Permission.VIEW, db),
+        )
+        body = detail.model_copy(update={"permission": Permission.VIEW.value})
+        cached = (version, CachedBody.render(body.model_dump_json().encode()))
+        # Версия снята до загрузки: если запись пришла во время неё, тело
+        # сохранится под старой версией и не будет выдано следующему запросу
+        public_board_bodies.set(board_id, cached)
+
+    cached_body = cached[1]
+    use_gzip = accepts_gzip(request.headers.get("accept-encoding"))
+    etag = cached_body.gzip_etag if use_gzip else cached_body.etag
+    headers = {
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+        "Cache-Control": f"public, max-age={settings.PUBLIC_BOARD_MAX_AGE_SECONDS}, "
+        f"stale-while-revalidate={settings.PUBLIC_BOARD_STALE_WHILE_REVALIDATE_SECONDS}",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(
+            content=cached_body.gzip_body,
+            media_type="application/json",
+            headers=headers,
+        )
+    return Response(
+        content=cached_body.body, media_type="application/json", headers=headers
+    )
+
+
+async def _load_board_detail(
+    board: Board, permission: Permission, db: AsyncSession
+) -> BoardDetail:
+    """Загружает владельца и стикеры доски через сессию для чтения."""
+    creator_result = await db.execute(
+        select(User.login).where(User.user_id == board.creator_id)
+    )
+    creator_login = creator_result.scalar_one_or_none()
+
+    if creator_login is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Board creator not found",
         )
 
+    stickers_result = await db.execute(
+        select(Sticker).where(Sticker.board_id == board.board_id)
+    )
+
     stickers = []
-    for sticker in board.stickers:
+    for sticker in stickers_result.scalars().all():
         stickers.append(
             StickerResponse(
                 stickerId=sticker.sticker_id,
@@ -254,8 +685,6 @@ async def get_board(
             )
         )
 
-    creator_login = board.creator.login
-
     return BoardDetail(
         boardId=board.board_id,
         title=board.title or "",
@@ -288,9 +717,10 @@ async def update_board(
     - title: Новое название доски (обязательно, 1-200 символов)
     - description: Новое описание доски (опционально, до 1000 символов)
     - backgroundColor: Новый цвет фона доски в hex формате (опционально)
+    - isPublic: Открыть доску всем без входа или закрыть (только владелец)
     """
 
-    board, _ = board_with_edit
+    board, permission = board_with_edit
 
     if new_data.title is not None:
         board.title = new_data.title
@@ -298,6 +728,13 @@ async def update_board(
         board.description = new_data.description
     if new_data.backgroundColor is not None:
         board.background_color = new_data.backgroundColor
+    if new_data.isPublic is not None and new_data.isPublic != board.is_public:
+        if permission != Permission.OWNER:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Requires owner permission to change board visibility",
+            )
+        board.is_public = new_data.isPublic
 
     await db.commit()
     await db.refresh(board, ["creator", "updated_at"])
@@ -308,7 +745,7 @@ async def update_board(
             detail="Board creator not found",
         )
 
-    return BoardResponse(
+    response = BoardResponse(
         boardId=board.board_id,
         title=board.title or "",
         description=board.description,
@@ -318,24 +755,141 @@ async def update_board(
         createdAt=board.created_at,
         updatedAt=board.updated_at,
     )
+    bump_board_version(board.board_id)
+    live_hub.publish(
+        board.board_id,
+        {"type": "board.updated", "board": response.model_dump(mode="json")},
+    )
+
+    return response
 
 
 @router.delete(
     "/{board_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Удаление доски",
-    description="Удаление доски владельцем",
+    description="Удаление доски владельцем; содержимое удаляется фоновой задачей",
 )
 async def delete_board(
     board_with_owner: BoardWithOwner,
+    current_user: CurrentUser,
     db: SessionDep,
+    response: Response,
 ):
     """
     Удаление доски по ID.
 
     - board_id: ID доски
+
+    Доска сразу помечается удалённой и пропадает из API, а стикеры и сама
+    доска удаляются порциями фоновой задачей, чтобы большая доска не
+    держала долгую транзакцию. Прогресс — по ссылке из заголовка Location
+    (GET /api/v1/jobs/{job_id}).
     """
     board, _ = board_with_owner
+    board_id = board.board_id
+
+    board.deleted_at = func.now()
+    job = enqueue_job(
+        db, BOARD_DELETE, {"board_id": board_id}, created_by=current_user.user_id
+    )
+    await db.commit()
+    job_runner.wake()
+
+    response.headers["Location"] = f"/api/v1/jobs/{job.job_id}"
+    bump_board_version(board_id)
+    live_hub.publish(board_id, {"type": "board.deleted", "boardId": board_id})
+
 
-    await db.delete(board)
+@router.post(
+    "/{board_id}/duplicate",
+    response_model=BoardResponse | JobResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Копирование доски",
+    description=(
+        "Копия доски со стикерами для текущего пользователя; большая доска "
+        "копируется фоновой задачей (ответ 202)"
+    ),
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "model": JobResponse,
+            "description": "Копирование поставлено в очередь",
+        }
+    },
+)
+async def duplicate_board_endpoint(
+    board_with_access: BoardWithAccess,
+    current_user: CurrentUser,
+    db: SessionDep,
+    response: Response,
+    duplicate_data: BoardDuplicate | None = None,
+) -> BoardResponse | JobResponse:
+    """
+    Копирование доски.
+
+    - board_id: ID исходной доски (достаточно права просмотра)
+    - title: Название копии (опционально)
+    - offsetX, offsetY: Сдвиг стикеров копии (опционально)
+    - stickerIds: Копировать только эти стикеры (опционально)
+
+    Доска и стикеры копируются INSERT ... SELECT внутри БД. Если стикеров
+    больше BOARD_DUPLICATE_SYNC_MAX_STICKERS, копирование выполняет фоновая
+    задача: ответ 202 с задачей, id новой доски — в её result.
+    """
+    board, _ = board_with_access
+    duplicate_data = duplicate_data or BoardDuplicate()
+    title = duplicate_data.title or f"{board.title or ''} (копия)".strip()
+
+    # Считаем не дальше порога: точное число больших досок не нужно
+    limit = settings.BOARD_DUPLICATE_SYNC_MAX_STICKERS
+    bounded = (
+        select(Sticker.sticker_id)
+        .where(*sticker_selection(board.board_id, duplicate_data.stickerIds))
+        .limit(limit + 1)
+        .subquery()
+    )
+    sticker_count = await db.scalar(select(func.count()).select_from(bounded))
+
+    if sticker_count > limit:
+        job = enqueue_job(
+            db,
+            BOARD_DUPLICATE,
+            {
+                "board_id": board.board_id,
+                "owner_id": current_user.user_id,
+                "title": title,
+                "offset_x": duplicate_data.offsetX,
+                "offset_y": duplicate_data.offsetY,
+                "sticker_ids": duplicate_data.stickerIds,
+            },
+            created_by=current_user.user_id,
+        )
+        await db.commit()
+        job_runner.wake()
+        await db.refresh(job)
+
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers["Location"] = f"/api/v1/jobs/{job.job_id}"
+        return to_job_response(job)
+
+    new_board, _ = await duplicate_board(
+        db,
+        board.board_id,
+        current_user.user_id,
+        title,
+        duplicate_data.offsetX,
+        duplicate_data.offsetY,
+        duplicate_data.stickerIds,
+    )
     await db.commit()
+
+    return BoardResponse(
+        boardId=new_board.board_id,
+        title=new_board.title or "",
+        description=new_board.description,
+        ownerId=new_board.creator_id,
+        ownerName=current_user.login,
+        backgroundColor=new_board.background_color,
+        createdAt=new_board.created_at,
+        updatedAt=new_board.updated_at,
+    )
@@ -0,0 +1,307 @@
+from fastapi import APIRouter, HTTPException, status
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from api.deps import CurrentUser, OwnedGroup, ReadSessionDep, SessionDep
+from core.permissions import (
+    group_descendants,
+    group_user_ids,
+    lock_effective_permissions,
+    refresh_effective_permissions,
+)
+from models.group import Group, GroupAccess, GroupMember, GroupNesting
+from models.user import User
+from schemas.group import (
+    GroupCreate,
+    GroupDetailResponse,
+    GroupListResponse,
+    GroupMemberInfo,
+    GroupMemberRequest,
+    GroupResponse,
+    SubgroupInfo,
+    SubgroupRequest,
+)
+
+router = APIRouter()
+
+
+def _group_response(group: Group) -> GroupResponse:
+    return GroupResponse(
+        groupId=group.group_id,
+        name=group.name,
+        ownerId=group.owner_id,
+        createdAt=group.created_at,
+    )
+
+
+@router.post(
+    "",
+    response_model=GroupResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Создание группы",
+    description="Создание группы пользователей; текущий пользователь становится её владельцем",
+)
+async def create_group(
+    group_data: GroupCreate,
+    current_user: CurrentUser,
+    db: SessionDep,
+) -> GroupResponse:
+    """
+    Создание группы.
+
+    Владелец управляет составом группы, но сам в неё не входит, пока не
+    добавит себя участником.
+
+    - name: Название группы
+    """
+    group = Group(name=group_data.name, owner_id=current_user.user_id)
+    db.add(group)
+    await db.commit()
+    await db.refresh(group)
+    return _group_response(group)
+
+
+@router.get(
+    "",
+    response_model=GroupListResponse,
+    summary="Получение списка групп",
+    description="Группы, которыми управляет текущий пользователь",
+)
+async def get_groups(
+    current_user: CurrentUser, db: ReadSessionDep
+) -> GroupListResponse:
+    """Получение групп, которыми управляет текущий пользователь."""
+    result = await db.execute(
+        select(Group)
+        .where(Group.owner_id == current_user.user_id)
+        .order_by(Group.group_id)
+    )
+    return GroupListResponse(
+        groups=[_group_response(group) for group in result.scalars()]
+    )
+
+
+@router.get(
+    "/{group_id}",
+    response_model=GroupDetailResponse,
+    summary="Получение группы",
+    description="Группа с прямыми участниками и вложенными группами",
+)
+async def get_group(group: OwnedGroup, db: SessionDep) -> GroupDetailResponse:
+    """
+    Получение группы.
+
+    - group_id: ID группы
+    """
+    members = await db.execute(
+        select(User.user_id, User.login)
+        .join(GroupMember, GroupMember.user_id == User.user_id)
+        .where(GroupMember.group_id == group.group_id)
+        .order_by(User.login)
+    )
+    subgroups = await db.execute(
+        select(Group.group_id, Group.name)
+        .join(GroupNesting, GroupNesting.child_group_id == Group.group_id)
+        .where(GroupNesting.parent_group_id == group.group_id)
+        .order_by(Group.group_id)
+    )
+    return GroupDetailResponse(
+        **_group_response(group).model_dump(),
+        members=[
+            GroupMemberInfo(userId=row.user_id, userLogin=row.login) for row in members
+        ],
+        subgroups=[
+            SubgroupInfo(groupId=row.group_id, name=row.name) for row in subgroups
+        ],
+    )
+
+
+@router.delete(
+    "/{group_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Удаление группы",
+    description="Удаление группы; её участники теряют доступ, выданный через неё",
+)
+async def delete_group(group: OwnedGroup, db: SessionDep) -> None:
+    """
+    Удаление группы.
+
+    Сначала снимаются доступы группы и её вхождения в другие группы, затем
+    пересчитываются права её участников (и участников вложенных групп,
+    пока вложенность ещё на месте), и только потом удаляется сама группа.
+
+    - group_id: ID группы
+    """
+    await db.execute(delete(GroupAccess).where(GroupAccess.group_id == group.group_id))
+    await db.execute(
+        delete(GroupNesting).where(GroupNesting.child_group_id == group.group_id)
+    )
+    await refresh_effective_permissions(db, group_user_ids(group.group_id))
+    await db.delete(group)
+    await db.commit()
+
+
+@router.post(
+    "/{group_id}/members",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Добавление участника группы",
+    description="Пользователь получает доступ ко всем доскам, выданным группе "
+    "и группам, в которые она вложена",
+)
+async def add_group_member(
+    group: OwnedGroup,
+    member_data: GroupMemberRequest,
+    db: SessionDep,
+) -> None:
+    """
+    Добавление участника группы. Повторное добавление ничего не меняет.
+
+    - group_id: ID группы
+    - userLogin: Логин пользователя
+    """
+    user_id = await db.scalar(
+        select(User.user_id).where(User.login == member_data.userLogin)
+    )
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "USER_NOT_FOUND", "message": "Пользователь не найден"},
+        )
+
+    result = await db.execute(
+        insert(GroupMember)
+        .values(group_id=group.group_id, user_id=user_id)
+        .on_conflict_do_nothing()
+        .returning(GroupMember.user_id)
+    )
+    if result.one_or_none() is not None:
+        await refresh_effective_permissions(db, [user_id])
+    await db.commit()
+
+
+@router.delete(
+    "/{group_id}/members",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Удаление участника группы",
+    description="Пользователь теряет доступ, выданный ему только через эту группу",
+)
+async def remove_group_member(
+    group: OwnedGroup,
+    member_data: GroupMemberRequest,
+    db: SessionDep,
+) -> None:
+    """
+    Удаление участника группы.
+
+    - group_id: ID группы
+    - userLogin: Логин пользователя
+    """
+    result = await db.execute(
+        delete(GroupMember)
+        .where(
+            GroupMember.group_id == group.group_id,
+            GroupMember.user_id == User.user_id,
+            User.login == member_data.userLogin,
+        )
+        .returning(GroupMember.user_id)
+    )
+    user_id = result.scalar_one_or_none()
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "MEMBER_NOT_FOUND",
+                "message": "Пользователь не состоит в группе",
+            },
+        )
+    await refresh_effective_permissions(db, [user_id])
+    await db.commit()
+
+
+@router.post(
+    "/{group_id}/subgroups",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Вложение группы",
+    description="Участники вложенной группы получают всё, что выдано этой группе",
+)
+async def add_subgroup(
+    group: OwnedGroup,
+    subgroup_data: SubgroupRequest,
+    db: SessionDep,
+) -> None:
+    """
+    Вложение группы groupId в группу group_id. Повторное вложение ничего
+    не меняет, вложение, образующее цикл, отклоняется.
+
+    - group_id: ID группы
+    - groupId: ID вкладываемой группы
+    """
+    child = await db.get(Group, subgroup_data.groupId)
+    if child is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "GROUP_NOT_FOUND", "message": "Группа не найдена"},
+        )
+
+    # Под блокировкой пересчёта: одновременные вложения A в B и B в A не
+    # пройдут проверку цикла оба
+    await lock_effective_permissions(db)
+    descendants = group_descendants(child.group_id)
+    cycle = await db.scalar(
+        select(descendants.c.group_id).where(descendants.c.group_id == group.group_id)
+    )
+    if cycle is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "error": "GROUP_CYCLE",
+                "message": "Группа уже входит во вкладываемую группу",
+            },
+        )
+
+    result = await db.execute(
+        insert(GroupNesting)
+        .values(parent_group_id=group.group_id, child_group_id=child.group_id)
+        .on_conflict_do_nothing()
+        .returning(GroupNesting.child_group_id)
+    )
+    if result.one_or_none() is not None:
+        await refresh_effective_permissions(db, group_user_ids(child.group_id))
+    await db.commit()
+
+
+@router.delete(
+    "/{group_id}/subgroups/{subgroup_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Исключение вложенной группы",
+    description="Участники вложенной группы теряют доступ, выданный им только через эту группу",
+)
+async def remove_subgroup(
+    group: OwnedGroup,
+    subgroup_id: int,
+    db: SessionDep,
+) -> None:
+    """
+    Исключение вложенной группы.
+
+    - group_id: ID группы
+    - subgroup_id: ID вложенной группы
+    """
+    result = await db.execute(
+        delete(GroupNesting)
+        .where(
+            GroupNesting.parent_group_id == group.group_id,
+            GroupNesting.child_group_id == subgroup_id,
+        )
+        .returning(GroupNesting.child_group_id)
+    )
+    if result.one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "SUBGROUP_NOT_FOUND",
+                "message": "Группа не вложена в эту группу",
+            },
+        )
+    await refresh_effective_permissions(db, group_user_ids(subgroup_id))
+    await db.commit()
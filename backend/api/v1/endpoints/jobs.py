@@ -0,0 +1,54 @@
+from fastapi import APIRouter, HTTPException, Path, status
+
+from api.deps import CurrentUser, SessionDep
+from core.config import settings
+from models.job import Job
+from schemas.job import JobResponse
+
+router = APIRouter()
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Состояние фоновой задачи",
+    description="Прогресс и результат фоновой задачи, например удаления доски",
+)
+async def get_job(
+    current_user: CurrentUser,
+    db: SessionDep,
+    job_id: int = Path(..., description="ID задачи"),
+) -> JobResponse:
+    """
+    Состояние фоновой задачи.
+
+    Задачу видит поставивший её пользователь и администраторы; для
+    остальных она не существует.
+    """
+    job = await db.get(Job, job_id)
+    if job is None or (
+        job.created_by != current_user.user_id
+        and current_user.login not in settings.ADMIN_LOGINS
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "JOB_NOT_FOUND", "message": "Задача не найдена"},
+        )
+
+    return to_job_response(job)
+
+
+def to_job_response(job: Job) -> JobResponse:
+    return JobResponse(
+        jobId=job.job_id,
+        kind=job.kind,
+        status=job.status.value,
+        progressDone=job.progress_done,
+        progressTotal=job.progress_total,
+        attempts=job.attempts,
+        result=job.result,
+        error=job.error,
+        createdAt=job.created_at,
+        startedAt=job.started_at,
+        finishedAt=job.finished_at,
+    )
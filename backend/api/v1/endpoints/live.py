@@ -0,0 +1,105 @@
+import asyncio
+import contextlib
+
+from fastapi import APIRouter, Path, Query, WebSocket, status
+
+from api.utils import get_user_permission
+from core.config import settings
+from core.database import AsyncSessionLocal
+from core.live import LIVE_FRAMES_SENT, Subscriber, live_hub
+from core.security import decode_access_token
+from models.board import Board
+from models.permission import Permission
+from models.user import User
+
+router = APIRouter()
+
+
+async def authorize_subscriber(token: str, board_id: int) -> Permission | None:
+    """
+    Проверяет токен и права пользователя на доску.
+
+    Сессия закрывается сразу после проверки, чтобы долгоживущее
+    подключение не удерживало соединение из пула.
+    """
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+
+    try:
+        user_id = int(payload.get("sub"))
+    except (ValueError, TypeError):
+        return None
+
+    async with AsyncSessionLocal() as db:
+        user = await db.get(User, user_id)
+        board = await db.get(Board, board_id)
+        if user is None or board is None or board.deleted_at is not None:
+            return None
+        return await get_user_permission(user, board, db)
+
+
+async def _send_frames(websocket: WebSocket, subscriber: Subscriber) -> None:
+    """Отправляет кадры из очереди подписчика; завершается, если клиент завис."""
+    while True:
+        frame = await subscriber.queue.get()
+        try:
+            await asyncio.wait_for(
+                websocket.send_text(frame),
+                timeout=settings.LIVE_SEND_TIMEOUT_SECONDS,
+            )
+        except TimeoutError:
+            return
+        LIVE_FRAMES_SENT.inc()
+
+
+async def _receive_until_disconnect(websocket: WebSocket) -> None:
+    """Читает входящие сообщения (они игнорируются) до отключения клиента."""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+@router.websocket("/{board_id}/live")
+async def board_live(
+    websocket: WebSocket,
+    board_id: int = Path(..., description="ID доски"),
+    token: str = Query(..., description="JWT токен"),
+) -> None:
+    """
+    Подписка на изменения доски.
+
+    Клиент получает события sticker.created / sticker.updated / sticker.deleted,
+    board.updated и board.deleted. Если клиент не успевает их читать, накопленные
+    события выбрасываются и приходит {"type": "resync"} — доску нужно загрузить
+    заново через GET /boards/{board_id}.
+    """
+    permission = await authorize_subscriber(token, board_id)
+    if permission is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    subscriber = live_hub.subscribe(board_id)
+    try:
+        await websocket.send_json(
+            {"type": "subscribed", "boardId": board_id, "permission": permission.value}
+        )
+
+        sender = asyncio.create_task(_send_frames(websocket, subscriber))
+        receiver = asyncio.create_task(_receive_until_disconnect(websocket))
+        done, pending = await asyncio.wait(
+            {sender, receiver}, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        for task in done:
+            task.exception()
+
+        # Клиент не принимает данные дольше таймаута — закрываем подключение
+        if receiver not in done:
+            with contextlib.suppress(Exception):
+                await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+    finally:
+        live_hub.unsubscribe(subscriber)
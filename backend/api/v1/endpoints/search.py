@@ -0,0 +1,142 @@
+from fastapi import APIRouter, HTTPException, Query, status
+from sqlalchemy import Float, func, literal, literal_column, or_, select, tuple_
+
+from api.deps import CurrentUser, ReadSessionDep
+from core.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from core.search import SEARCH_CONFIG, prefix_tsquery, search_query
+from models.board import Board
+from models.effective_permission import EffectivePermission
+from models.sticker import Sticker
+from schemas.search import StickerSearchHit, StickerSearchResponse
+
+router = APIRouter()
+
+# Сниппет — HTML: текст экранируется до ts_headline, разметку добавляет
+# только выделение совпадений
+SNIPPET_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxWords=25, MinWords=8, ShortWord=0, "
+    'MaxFragments=2, FragmentDelimiter=" … "'
+)
+
+
+def _escaped_text():
+    text = func.coalesce(Sticker.text, literal_column("''"))
+    for char, entity in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;")):
+        text = func.replace(text, char, entity)
+    return text
+
+
+@router.get(
+    "/stickers",
+    response_model=StickerSearchResponse,
+    summary="Поиск по стикерам",
+    description="Полнотекстовый поиск по тексту стикеров на всех доступных досках",
+)
+async def search_stickers(
+    current_user: CurrentUser,
+    db: ReadSessionDep,
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Поисковая строка; слова ищутся по префиксу",
+    ),
+    limit: int = Query(
+        default=20, ge=1, le=100, description="Количество результатов на странице"
+    ),
+    cursor: str | None = Query(
+        default=None, description="nextCursor из предыдущей страницы"
+    ),
+) -> StickerSearchResponse:
+    """
+    Поиск стикеров по тексту.
+
+    Ищет на досках, которые пользователь создал, которые ему расшарены
+    (напрямую или через группы), и на публичных. Права проверяются в том
+    же запросе, что и поиск. Результаты упорядочены по релевантности,
+    страницы — по курсору (keyset), поэтому дальние страницы не дороже
+    первой.
+    """
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor, float, int)
+        except InvalidCursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail={"error": "INVALID_CURSOR", "message": str(exc)},
+            ) from exc
+
+    search = prefix_tsquery(q)
+    if search is None:
+        return StickerSearchResponse()
+    tsquery = search_query(search)
+
+    rank = func.ts_rank_cd(Sticker.search_vector, tsquery)
+    shared_board_ids = select(EffectivePermission.board_id).where(
+        EffectivePermission.user_id == current_user.user_id
+    )
+    page_query = (
+        select(
+            Sticker.sticker_id,
+            Sticker.board_id,
+            rank.label("rank"),
+        )
+        .join(Board, Board.board_id == Sticker.board_id)
+        .where(
+            Sticker.search_vector.bool_op("@@")(tsquery),
+            Board.deleted_at.is_(None),
+            or_(
+                Board.creator_id == current_user.user_id,
+                Board.is_public.is_(True),
+                Board.board_id.in_(shared_board_ids),
+            ),
+        )
+    )
+    if after is not None:
+        after_rank, after_id = after
+        page_query = page_query.where(
+            tuple_(rank, Sticker.sticker_id)
+            < tuple_(literal(after_rank, Float), literal(after_id))
+        )
+    # Лишняя строка показывает, есть ли следующая страница
+    page = (
+        page_query.order_by(rank.desc(), Sticker.sticker_id.desc())
+        .limit(limit + 1)
+        .subquery()
+    )
+
+    # Сниппеты строятся только для строк страницы, а не для всех совпадений
+    result = await db.execute(
+        select(
+            page.c.sticker_id,
+            page.c.board_id,
+            page.c.rank,
+            Board.title,
+            func.ts_headline(
+                SEARCH_CONFIG, _escaped_text(), tsquery, SNIPPET_OPTIONS
+            ).label("snippet"),
+        )
+        .join(Sticker, Sticker.sticker_id == page.c.sticker_id)
+        .join(Board, Board.board_id == page.c.board_id)
+        .order_by(page.c.rank.desc(), page.c.sticker_id.desc())
+    )
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].rank, rows[-1].sticker_id)
+
+    return StickerSearchResponse(
+        results=[
+            StickerSearchHit(
+                stickerId=row.sticker_id,
+                boardId=row.board_id,
+                boardTitle=row.title or "",
+                snippet=row.snippet,
+            )
+            for row in rows
+        ],
+        nextCursor=next_cursor,
+    )
@@ -1,16 +1,35 @@
-from datetime import datetime, timezone
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Literal
 
-from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from fastapi import APIRouter, HTTPException, Query, status
+from sqlalchemy import delete, func, literal, literal_column, select, tuple_, update
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.deps import BoardWithOwner, CurrentUser, SessionDep
+from api.deps import BoardWithOwner, CurrentUser, ReadSessionDep, SessionDep
+from core.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from core.permissions import group_user_ids, refresh_effective_permissions
+from core.share_links import ShareLinkClaims, share_link_denylist, sign_share_link
 from models.access import Access
+from models.group import Group, GroupAccess
 from models.permission import Permission
+from models.share_link import ShareLink
 from models.user import User
 from schemas.sharing import (
+    GroupShareInfo,
+    GroupShareListResponse,
+    GroupShareRequest,
+    GroupShareResponse,
+    RevokeShareBatchRequest,
     RevokeShareRequest,
+    ShareBatchRequest,
+    ShareBatchResponse,
+    ShareBatchResult,
     ShareInfo,
+    ShareLinkCreate,
+    ShareLinkInfo,
+    ShareLinkListResponse,
     ShareListResponse,
     ShareRequest,
     ShareResponse,
@@ -19,6 +38,28 @@ from schemas.sharing import (
 router = APIRouter()
 
 
+def _upsert_accesses(statement: Insert) -> Insert:
+    """
+    INSERT в accesses, который при существующем доступе обновляет уровень
+    и выдавшего. Возвращает строку доступа и признак created.
+    """
+    return statement.on_conflict_do_update(
+        constraint="uq_user_board",
+        set_={
+            "permission": statement.excluded.permission,
+            "granted_by": statement.excluded.granted_by,
+            "granted_at": func.now(),
+        },
+    ).returning(
+        Access.user_id,
+        Access.permission,
+        Access.granted_at,
+        Access.granted_by,
+        # xmax = 0 только у строк, вставленных этим оператором
+        literal_column("xmax = 0").label("created"),
+    )
+
+
 @router.post(
     "/{board_id}/share",
     response_model=ShareResponse,
@@ -43,17 +84,8 @@ async def share_board(
     """
     board, _ = board_with_owner
 
-    # Проверяем, что пользователь существует по логину
-    result = await db.execute(select(User).where(User.login == share_data.userLogin))
-    target_user = result.scalar_one_or_none()
-    if target_user is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={"error": "USER_NOT_FOUND", "message": "Пользователь не найден"},
-        )
-
     # Нельзя предоставить доступ самому себе (он уже owner)
-    if target_user.user_id == board.creator_id:
+    if share_data.userLogin == current_user.login:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -72,48 +104,37 @@ async def share_board(
             },
         )
 
-    # Проверяем, не существует ли уже доступ
-    existing_access_result = await db.execute(
-        select(Access).where(
-            Access.board_id == board.board_id,
-            Access.user_id == target_user.user_id,
+    # Поиск пользователя и запись доступа — один оператор: одновременные
+    # выдачи одному пользователю не упираются в uq_user_board
+    target = select(
+        literal(board.board_id),
+        User.user_id,
+        literal(share_data.permission, Access.permission.type),
+        literal(current_user.user_id),
+    ).where(User.login == share_data.userLogin, User.user_id != board.creator_id)
+    result = await db.execute(
+        _upsert_accesses(
+            insert(Access).from_select(
+                ["board_id", "user_id", "permission", "granted_by"], target
+            )
         )
     )
-    existing_access = existing_access_result.scalar_one_or_none()
-
-    if existing_access:
-        # Обновляем существующий доступ
-        existing_access.permission = share_data.permission
-        existing_access.granted_by = current_user.user_id
-        existing_access.granted_at = datetime.now(timezone.utc)
-        await db.commit()
-        await db.refresh(existing_access)
-
-        return ShareResponse(
-            boardId=board.board_id,
-            userId=target_user.user_id,
-            permission=existing_access.permission,
-            grantedAt=existing_access.granted_at,
-            grantedBy=existing_access.granted_by,
+    access = result.one_or_none()
+    if access is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "USER_NOT_FOUND", "message": "Пользователь не найден"},
         )
-
-    # Создаем новый доступ
-    new_access = Access(
-        board_id=board.board_id,
-        user_id=target_user.user_id,
-        permission=share_data.permission,
-        granted_by=current_user.user_id,
-    )
-    db.add(new_access)
+    await refresh_effective_permissions(db, [access.user_id], [board.board_id])
     await db.commit()
-    await db.refresh(new_access)
 
     return ShareResponse(
         boardId=board.board_id,
-        userId=target_user.user_id,
-        permission=share_data.permission,
-        grantedAt=new_access.granted_at,
-        grantedBy=new_access.granted_by,
+        userId=access.user_id,
+        permission=access.permission,
+        grantedAt=access.granted_at,
+        grantedBy=access.granted_by,
+        created=access.created,
     )
 
 
@@ -121,47 +142,105 @@ async def share_board(
     "/{board_id}/share",
     response_model=ShareListResponse,
     summary="Получение списка пользователей с доступом",
-    description="Получение списка всех пользователей, имеющих доступ к доске",
+    description="Постраничный список пользователей, имеющих доступ к доске, "
+    "с фильтрами по уровню доступа и началу логина",
 )
 async def get_board_shares(
     board_with_owner: BoardWithOwner,
-    db: SessionDep,
+    db: ReadSessionDep,
+    permission: Literal["view", "edit"] | None = Query(
+        default=None, description="Только пользователи с этим уровнем доступа"
+    ),
+    loginPrefix: str | None = Query(
+        default=None,
+        min_length=1,
+        max_length=255,
+        description="Только пользователи, чей логин начинается с этой строки",
+    ),
+    limit: int = Query(
+        default=100, ge=1, le=1000, description="Количество элементов на странице"
+    ),
+    cursor: str | None = Query(
+        default=None, description="nextCursor из предыдущей страницы"
+    ),
+    includeTotal: bool = Query(
+        default=False,
+        description="Посчитать, сколько всего пользователей подходит под фильтры",
+    ),
 ) -> ShareListResponse:
     """
     Получение списка пользователей с доступом к доске.
 
+    Доступы и логины читаются одним запросом с JOIN, страница за страницей
+    по курсору (keyset по уровню доступа и ID пользователя), поэтому
+    доски с тысячами участников не загружаются в память целиком.
+
     - board_id: ID доски
-    - Возвращает список всех пользователей с доступом (кроме владельца)
+    - permission: Фильтр по уровню доступа (view или edit)
+    - loginPrefix: Фильтр по началу логина
+    - limit: Количество элементов на странице (1-1000)
+    - cursor: Курсор следующей страницы
+    - includeTotal: Вернуть общее число подходящих пользователей
     """
     board, _ = board_with_owner
 
-    # Получаем все Access для этой доски с загрузкой пользователей
-    result = await db.execute(
-        select(Access)
-        .where(Access.board_id == board.board_id)
-        .options(selectinload(Access.user))
+    after = None
+    if cursor is not None:
+        try:
+            after_permission, after_user_id = decode_cursor(cursor, Permission, int)
+        except InvalidCursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail={"error": "INVALID_CURSOR", "message": str(exc)},
+            ) from exc
+        after = tuple_(
+            literal(after_permission, Access.permission.type), literal(after_user_id)
+        )
+
+    # Владелец не хранится в Access, у него автоматически OWNER
+    conditions = [Access.board_id == board.board_id, Access.user_id != board.creator_id]
+    if permission is not None:
+        conditions.append(Access.permission == Permission(permission))
+    if loginPrefix is not None:
+        conditions.append(User.login.startswith(loginPrefix, autoescape=True))
+
+    page_query = (
+        select(Access.user_id, User.login, Access.permission, Access.granted_at)
+        .join(User, User.user_id == Access.user_id)
+        .where(*conditions)
+        .order_by(Access.permission, Access.user_id)
+        .limit(limit + 1)
     )
-    accesses = result.scalars().all()
+    if after is not None:
+        page_query = page_query.where(tuple_(Access.permission, Access.user_id) > after)
+    rows = (await db.execute(page_query)).all()
 
-    shares = []
-    for access in accesses:
-        if access.user is None:
-            continue
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].permission.value, rows[-1].user_id)
 
-        # Пропускаем владельца (он не в Access, у него автоматически OWNER)
-        if access.user_id == board.creator_id:
-            continue
+    total = None
+    if includeTotal:
+        total_query = select(func.count()).select_from(Access).where(*conditions)
+        if loginPrefix is not None:
+            total_query = total_query.join(User, User.user_id == Access.user_id)
+        total = await db.scalar(total_query)
 
-        shares.append(
+    return ShareListResponse(
+        boardId=board.board_id,
+        shares=[
             ShareInfo(
-                userId=access.user_id,
-                userLogin=access.user.login,
-                permission=access.permission,
-                grantedAt=access.granted_at,
+                userId=row.user_id,
+                userLogin=row.login,
+                permission=row.permission,
+                grantedAt=row.granted_at,
             )
-        )
-
-    return ShareListResponse(boardId=board.board_id, shares=shares)
+            for row in rows
+        ],
+        nextCursor=next_cursor,
+        total=total,
+    )
 
 
 @router.delete(
@@ -173,6 +252,7 @@ async def get_board_shares(
 async def revoke_share(
     board_with_owner: BoardWithOwner,
     revoke_data: RevokeShareRequest,
+    current_user: CurrentUser,
     db: SessionDep,
 ) -> None:
     """
@@ -183,41 +263,494 @@ async def revoke_share(
     """
     board, _ = board_with_owner
 
-    # Находим пользователя по логину
-    user_result = await db.execute(
-        select(User).where(User.login == revoke_data.userLogin)
+    # Нельзя отозвать доступ владельца
+    if revoke_data.userLogin == current_user.login:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "INVALID_REQUEST",
+                "message": "Нельзя отозвать доступ владельца доски",
+            },
+        )
+
+    result = await db.execute(
+        delete(Access)
+        .where(
+            Access.user_id == User.user_id,
+            User.login == revoke_data.userLogin,
+            Access.board_id == board.board_id,
+        )
+        .returning(Access.user_id)
+    )
+    revoked_user_id = result.scalar_one_or_none()
+    if revoked_user_id is not None:
+        # Доступ через группы, если он есть, остаётся
+        await refresh_effective_permissions(db, [revoked_user_id], [board.board_id])
+        await db.commit()
+        return
+
+    # Ничего не удалено: уточняем причину только в этом случае
+    user_exists = await db.scalar(
+        select(User.user_id).where(User.login == revoke_data.userLogin)
     )
-    target_user = user_result.scalar_one_or_none()
-    if target_user is None:
+    if user_exists is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error": "USER_NOT_FOUND", "message": "Пользователь не найден"},
         )
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={"error": "ACCESS_NOT_FOUND", "message": "Доступ не найден"},
+    )
 
-    # Нельзя отозвать доступ владельца
-    if target_user.user_id == board.creator_id:
+
+async def _resolve_logins(db: AsyncSession, logins: list[str]) -> dict[str, int]:
+    """Логин -> ID пользователя для всех найденных логинов, одним запросом."""
+    result = await db.execute(
+        select(User.login, User.user_id).where(User.login.in_(logins))
+    )
+    return {row.login: row.user_id for row in result}
+
+
+@router.post(
+    "/{board_id}/share:batch",
+    response_model=ShareBatchResponse,
+    summary="Пакетная выдача доступа к доске",
+    description="Выдача или обновление доступа сразу многим пользователям с итогом по каждому логину",
+)
+async def share_board_batch(
+    board_with_owner: BoardWithOwner,
+    batch: ShareBatchRequest,
+    current_user: CurrentUser,
+    db: SessionDep,
+) -> ShareBatchResponse:
+    """
+    Пакетная выдача или обновление доступа к доске.
+
+    Логины разрешаются одним запросом, доступы записываются одним
+    INSERT ... ON CONFLICT DO UPDATE, поэтому число запросов к БД не
+    зависит от числа пользователей. Ненайденные логины и владелец доски
+    не прерывают операцию, а получают свой статус в results.
+
+    - board_id: ID доски
+    - shares: Список пар userLogin и permission (view или edit)
+    """
+    board, _ = board_with_owner
+
+    if any(share.permission == Permission.OWNER for share in batch.shares):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "INVALID_REQUEST",
-                "message": "Нельзя отозвать доступ владельца доски",
+                "error": "INVALID_PERMISSION",
+                "message": "Нельзя установить уровень доступа owner",
+            },
+        )
+
+    user_ids = await _resolve_logins(db, [share.userLogin for share in batch.shares])
+    rows = [
+        {
+            "board_id": board.board_id,
+            "user_id": user_ids[share.userLogin],
+            "permission": share.permission,
+            "granted_by": current_user.user_id,
+        }
+        for share in batch.shares
+        if user_ids.get(share.userLogin) not in (None, board.creator_id)
+    ]
+
+    granted = {}
+    if rows:
+        statement = _upsert_accesses(insert(Access).values(rows))
+        result = await db.execute(statement)
+        granted = {row.user_id: row for row in result}
+        await refresh_effective_permissions(db, list(granted), [board.board_id])
+        await db.commit()
+
+    results = []
+    for share in batch.shares:
+        user_id = user_ids.get(share.userLogin)
+        row = granted.get(user_id)
+        if row is None:
+            results.append(
+                ShareBatchResult(
+                    userLogin=share.userLogin,
+                    status="user_not_found" if user_id is None else "owner",
+                    userId=user_id,
+                )
+            )
+        else:
+            results.append(
+                ShareBatchResult(
+                    userLogin=share.userLogin,
+                    status="created" if row.created else "updated",
+                    userId=user_id,
+                    permission=row.permission,
+                    grantedAt=row.granted_at,
+                )
+            )
+
+    return ShareBatchResponse(boardId=board.board_id, results=results)
+
+
+@router.delete(
+    "/{board_id}/share:batch",
+    response_model=ShareBatchResponse,
+    summary="Пакетный отзыв доступа к доске",
+    description="Отзыв доступа сразу у многих пользователей с итогом по каждому логину",
+)
+async def revoke_share_batch(
+    board_with_owner: BoardWithOwner,
+    revoke_data: RevokeShareBatchRequest,
+    db: SessionDep,
+) -> ShareBatchResponse:
+    """
+    Пакетный отзыв доступа к доске.
+
+    Логины разрешаются одним запросом, доступы удаляются одним DELETE.
+    Логины без доступа, ненайденные логины и владелец доски получают свой
+    статус в results.
+
+    - board_id: ID доски
+    - userLogins: Логины пользователей, у которых отзывается доступ
+    """
+    board, _ = board_with_owner
+
+    user_ids = await _resolve_logins(db, revoke_data.userLogins)
+    target_ids = [
+        user_id for user_id in user_ids.values() if user_id != board.creator_id
+    ]
+
+    revoked = set()
+    if target_ids:
+        result = await db.execute(
+            delete(Access)
+            .where(Access.board_id == board.board_id, Access.user_id.in_(target_ids))
+            .returning(Access.user_id)
+        )
+        revoked = set(result.scalars().all())
+        if revoked:
+            await refresh_effective_permissions(db, list(revoked), [board.board_id])
+        await db.commit()
+
+    results = []
+    for login in revoke_data.userLogins:
+        user_id = user_ids.get(login)
+        if user_id is None:
+            result_status = "user_not_found"
+        elif user_id == board.creator_id:
+            result_status = "owner"
+        elif user_id in revoked:
+            result_status = "revoked"
+        else:
+            result_status = "not_shared"
+        results.append(
+            ShareBatchResult(userLogin=login, status=result_status, userId=user_id)
+        )
+
+    return ShareBatchResponse(boardId=board.board_id, results=results)
+
+
+@router.post(
+    "/{board_id}/share/groups",
+    response_model=GroupShareResponse,
+    summary="Предоставление или обновление доступа группе",
+    description="Выдача прав на доску всем участникам группы, включая участников "
+    "вложенных групп. Если доступ уже существует, он будет обновлен.",
+)
+async def share_board_with_group(
+    board_with_owner: BoardWithOwner,
+    share_data: GroupShareRequest,
+    current_user: CurrentUser,
+    db: SessionDep,
+) -> GroupShareResponse:
+    """
+    Предоставление или обновление доступа группе.
+
+    Итоговые права участников группы пересчитываются в той же транзакции:
+    у каждого остаётся максимум из прямого доступа и доступов его групп.
+
+    - board_id: ID доски
+    - groupId: ID группы
+    - permission: Уровень доступа (view или edit)
+    """
+    board, _ = board_with_owner
+
+    if share_data.permission == Permission.OWNER:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "INVALID_PERMISSION",
+                "message": "Нельзя установить уровень доступа owner",
             },
         )
 
-    # Находим существующий доступ
+    group = await db.get(Group, share_data.groupId)
+    if group is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "GROUP_NOT_FOUND", "message": "Группа не найдена"},
+        )
+
+    statement = insert(GroupAccess).values(
+        board_id=board.board_id,
+        group_id=group.group_id,
+        permission=share_data.permission,
+        granted_by=current_user.user_id,
+    )
     result = await db.execute(
-        select(Access).where(
-            Access.board_id == board.board_id,
-            Access.user_id == target_user.user_id,
+        statement.on_conflict_do_update(
+            index_elements=["board_id", "group_id"],
+            set_={
+                "permission": statement.excluded.permission,
+                "granted_by": statement.excluded.granted_by,
+                "granted_at": func.now(),
+            },
+        ).returning(
+            GroupAccess.permission,
+            GroupAccess.granted_at,
+            literal_column("xmax = 0").label("created"),
         )
     )
-    access = result.scalar_one_or_none()
+    grant = result.one()
+    await refresh_effective_permissions(
+        db, group_user_ids(group.group_id), [board.board_id]
+    )
+    await db.commit()
+
+    return GroupShareResponse(
+        boardId=board.board_id,
+        groupId=group.group_id,
+        groupName=group.name,
+        permission=grant.permission,
+        grantedAt=grant.granted_at,
+        created=grant.created,
+    )
 
-    if access is None:
+
+@router.get(
+    "/{board_id}/share/groups",
+    response_model=GroupShareListResponse,
+    summary="Получение списка групп с доступом",
+    description="Группы, которым выдан доступ к доске",
+)
+async def get_board_group_shares(
+    board_with_owner: BoardWithOwner,
+    db: ReadSessionDep,
+) -> GroupShareListResponse:
+    """
+    Получение списка групп с доступом к доске.
+
+    - board_id: ID доски
+    """
+    board, _ = board_with_owner
+
+    result = await db.execute(
+        select(
+            GroupAccess.group_id,
+            Group.name,
+            GroupAccess.permission,
+            GroupAccess.granted_at,
+        )
+        .join(Group, Group.group_id == GroupAccess.group_id)
+        .where(GroupAccess.board_id == board.board_id)
+        .order_by(GroupAccess.group_id)
+    )
+
+    return GroupShareListResponse(
+        boardId=board.board_id,
+        groups=[
+            GroupShareInfo(
+                groupId=row.group_id,
+                groupName=row.name,
+                permission=row.permission,
+                grantedAt=row.granted_at,
+            )
+            for row in result
+        ],
+    )
+
+
+@router.delete(
+    "/{board_id}/share/groups/{group_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Отзыв доступа группы к доске",
+    description="Удаление прав группы на доступ к доске",
+)
+async def revoke_group_share(
+    board_with_owner: BoardWithOwner,
+    group_id: int,
+    db: SessionDep,
+) -> None:
+    """
+    Отзыв доступа группы к доске.
+
+    Участники группы сохраняют доступ, выданный им напрямую или через
+    другие группы.
+
+    - board_id: ID доски
+    - group_id: ID группы
+    """
+    board, _ = board_with_owner
+
+    result = await db.execute(
+        delete(GroupAccess)
+        .where(GroupAccess.board_id == board.board_id, GroupAccess.group_id == group_id)
+        .returning(GroupAccess.group_id)
+    )
+    if result.one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error": "ACCESS_NOT_FOUND", "message": "Доступ не найден"},
         )
+    await refresh_effective_permissions(db, group_user_ids(group_id), [board.board_id])
+    await db.commit()
+
 
-    await db.delete(access)
+def _share_link_info(
+    link_id: str,
+    board_id: int,
+    permission: Permission,
+    created_at: datetime,
+    expires_at: datetime,
+) -> ShareLinkInfo:
+    claims = ShareLinkClaims(link_id, board_id, permission, int(expires_at.timestamp()))
+    return ShareLinkInfo(
+        linkId=link_id,
+        token=sign_share_link(claims),
+        permission=permission,
+        createdAt=created_at,
+        expiresAt=expires_at,
+    )
+
+
+@router.post(
+    "/{board_id}/links",
+    response_model=ShareLinkInfo,
+    status_code=status.HTTP_201_CREATED,
+    summary="Создание ссылки на доску",
+    description="Подписанная ссылка с ограниченным сроком: по ней доску можно "
+    "открыть без входа",
+)
+async def create_share_link(
+    board_with_owner: BoardWithOwner,
+    link_data: ShareLinkCreate,
+    current_user: CurrentUser,
+    db: SessionDep,
+) -> ShareLinkInfo:
+    """
+    Создание ссылки на доску.
+
+    Токен из ответа передаётся в параметре link запроса
+    GET /boards/{board_id}. Он проверяется по подписи и сроку, без
+    обращения к БД; запись в share_links нужна для списка и отзыва.
+
+    - board_id: ID доски
+    - permission: Уровень доступа по ссылке (только view)
+    - expiresInSeconds: Срок действия ссылки
+    """
+    board, _ = board_with_owner
+
+    # Целые секунды: срок в токене хранится как Unix-время
+    expires_at = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(
+        seconds=link_data.expiresInSeconds
+    )
+    link_id = secrets.token_hex(16)
+    permission = Permission(link_data.permission)
+    created_at = await db.scalar(
+        insert(ShareLink)
+        .values(
+            link_id=link_id,
+            board_id=board.board_id,
+            permission=permission,
+            created_by=current_user.user_id,
+            expires_at=expires_at,
+        )
+        .returning(ShareLink.created_at)
+    )
+    await db.commit()
+
+    return _share_link_info(link_id, board.board_id, permission, created_at, expires_at)
+
+
+@router.get(
+    "/{board_id}/links",
+    response_model=ShareLinkListResponse,
+    summary="Получение списка ссылок на доску",
+    description="Действующие (не истёкшие и не отозванные) ссылки на доску",
+)
+async def get_share_links(
+    board_with_owner: BoardWithOwner,
+    db: ReadSessionDep,
+) -> ShareLinkListResponse:
+    """
+    Получение действующих ссылок на доску.
+
+    - board_id: ID доски
+    """
+    board, _ = board_with_owner
+
+    result = await db.execute(
+        select(ShareLink)
+        .where(
+            ShareLink.board_id == board.board_id,
+            ShareLink.revoked_at.is_(None),
+            ShareLink.expires_at > func.now(),
+        )
+        .order_by(ShareLink.created_at)
+    )
+
+    return ShareLinkListResponse(
+        boardId=board.board_id,
+        links=[
+            _share_link_info(
+                link.link_id,
+                link.board_id,
+                link.permission,
+                link.created_at,
+                link.expires_at,
+            )
+            for link in result.scalars()
+        ],
+    )
+
+
+@router.delete(
+    "/{board_id}/links/{link_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Отзыв ссылки на доску",
+    description="Ссылка перестаёт действовать до истечения срока",
+)
+async def revoke_share_link(
+    board_with_owner: BoardWithOwner,
+    link_id: str,
+    db: SessionDep,
+) -> None:
+    """
+    Отзыв ссылки на доску.
+
+    В этом процессе ссылка отклоняется сразу, в остальных воркерах — после
+    обновления deny-list (SHARE_LINK_DENYLIST_REFRESH_SECONDS). Ответы,
+    уже закэшированные прокси, живут до SHARE_LINK_CACHE_MAX_AGE_SECONDS.
+
+    - board_id: ID доски
+    - link_id: ID ссылки
+    """
+    board, _ = board_with_owner
+
+    expires_at = await db.scalar(
+        update(ShareLink)
+        .where(
+            ShareLink.link_id == link_id,
+            ShareLink.board_id == board.board_id,
+            ShareLink.revoked_at.is_(None),
+        )
+        .values(revoked_at=func.now())
+        .returning(ShareLink.expires_at)
+    )
+    if expires_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "LINK_NOT_FOUND", "message": "Ссылка не найдена"},
+        )
     await db.commit()
+    share_link_denylist.add(link_id, expires_at.timestamp())
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException, Path, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Path, status
+from sqlalchemy import select, update
 
-from api.deps import BoardWithEdit, CurrentUser, SessionDep
+from api.deps import BoardWithEdit, CurrentUser, SessionDep, limit_board_writes
+from core.board_versions import bump_board_version
+from core.live import live_hub
 from models.sticker import Sticker
 from schemas.stickers import (
     StickerCreate,
@@ -16,6 +18,7 @@ router = APIRouter()
     "/{board_id}/stickers",
     response_model=StickerResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(limit_board_writes)],
     summary="Создание нового стикера",
     description="Создание нового стикера на доске",
 )
@@ -55,7 +58,7 @@ async def create_sticker(
     await db.commit()
     await db.refresh(new_sticker)
 
-    return StickerResponse(
+    response = StickerResponse(
         stickerId=new_sticker.sticker_id,
         boardId=new_sticker.board_id,
         x=new_sticker.x,
@@ -69,11 +72,19 @@ async def create_sticker(
         createdAt=new_sticker.created_at,
         updatedAt=new_sticker.updated_at,
     )
+    bump_board_version(board.board_id)
+    live_hub.publish(
+        board.board_id,
+        {"type": "sticker.created", "sticker": response.model_dump(mode="json")},
+    )
+
+    return response
 
 
 @router.patch(
     "/{board_id}/stickers/{sticker_id}",
     response_model=StickerResponse,
+    dependencies=[Depends(limit_board_writes)],
     summary="Обновление стикера",
     description="Обновление параметров стикера (координаты, размер, цвет, текст, уровень слоя)",
 )
@@ -92,13 +103,32 @@ async def update_sticker(
     """
     board, _ = board_with_edit
 
-    result = await db.execute(
-        select(Sticker).where(
-            Sticker.sticker_id == sticker_id,
-            Sticker.board_id == board.board_id,
+    # Одним UPDATE ... RETURNING: без предварительного SELECT и refresh
+    values = {
+        column: value
+        for column, value in (
+            ("x", sticker_data.x),
+            ("y", sticker_data.y),
+            ("width", sticker_data.width),
+            ("height", sticker_data.height),
+            ("color", sticker_data.color),
+            ("text", sticker_data.text),
+            ("layer_level", sticker_data.layerLevel),
         )
-    )
-    sticker = result.scalar_one_or_none()
+        if value is not None
+    }
+    conditions = (Sticker.sticker_id == sticker_id, Sticker.board_id == board.board_id)
+    if values:
+        statement = (
+            update(Sticker)
+            .where(*conditions)
+            .values(**values)
+            .returning(Sticker)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+    else:
+        statement = select(Sticker).where(*conditions)
+    sticker = (await db.execute(statement)).scalar_one_or_none()
 
     if sticker is None:
         raise HTTPException(
@@ -106,25 +136,9 @@ async def update_sticker(
             detail="Sticker not found",
         )
 
-    if sticker_data.x is not None:
-        sticker.x = sticker_data.x
-    if sticker_data.y is not None:
-        sticker.y = sticker_data.y
-    if sticker_data.width is not None:
-        sticker.width = sticker_data.width
-    if sticker_data.height is not None:
-        sticker.height = sticker_data.height
-    if sticker_data.color is not None:
-        sticker.color = sticker_data.color
-    if sticker_data.text is not None:
-        sticker.text = sticker_data.text
-    if sticker_data.layerLevel is not None:
-        sticker.layer_level = sticker_data.layerLevel
-
     await db.commit()
-    await db.refresh(sticker)
 
-    return StickerResponse(
+    response = StickerResponse(
         stickerId=sticker.sticker_id,
         boardId=sticker.board_id,
         x=sticker.x,
@@ -138,11 +152,19 @@ async def update_sticker(
         createdAt=sticker.created_at,
         updatedAt=sticker.updated_at,
     )
+    bump_board_version(board.board_id)
+    live_hub.publish(
+        board.board_id,
+        {"type": "sticker.updated", "sticker": response.model_dump(mode="json")},
+    )
+
+    return response
 
 
 @router.delete(
     "/{board_id}/stickers/{sticker_id}",
     status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(limit_board_writes)],
     summary="Удаление стикера",
     description="Удаление стикера с доски",
 )
@@ -175,3 +197,8 @@ async def delete_sticker(
 
     await db.delete(sticker)
     await db.commit()
+
+    bump_board_version(board.board_id)
+    live_hub.publish(
+        board.board_id, {"type": "sticker.deleted", "stickerId": sticker_id}
+    )
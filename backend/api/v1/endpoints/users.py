@@ -0,0 +1,88 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.deps import CurrentUser, ReadSessionDep, limit_user_lookups
+from core.cache import TTLCache
+from core.config import settings
+from models.user import User
+from schemas.user import UserLookupItem, UserLookupResponse
+
+router = APIRouter()
+
+# Префикс -> первые USER_LOOKUP_MAX_RESULTS + 1 пользователей по логину.
+# Частые префиксы (первые буквы, домен компании) обслуживаются без БД
+user_lookup_cache: TTLCache[list[UserLookupItem]] = TTLCache(
+    "user_lookup",
+    settings.USER_LOOKUP_CACHE_MAX_ENTRIES,
+    settings.USER_LOOKUP_CACHE_TTL_SECONDS,
+)
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Наименьшая строка больше всех строк с этим префиксом (None — нет такой)."""
+    for index in range(len(prefix) - 1, -1, -1):
+        code = ord(prefix[index])
+        if code < 0x10FFFF:
+            return prefix[:index] + chr(code + 1)
+    return None
+
+
+async def _lookup(db: AsyncSession, prefix: str) -> list[UserLookupItem]:
+    login = User.login.collate("C")
+    query = (
+        select(User.user_id, User.login)
+        .where(login >= prefix)
+        .order_by(login)
+        # Лишний пользователь на случай, если в выдачу попал сам спрашивающий
+        .limit(settings.USER_LOOKUP_MAX_RESULTS + 1)
+    )
+    upper = _prefix_upper_bound(prefix)
+    if upper is not None:
+        query = query.where(login < upper)
+    result = await db.execute(query)
+    return [UserLookupItem(userId=row.user_id, login=row.login) for row in result]
+
+
+@router.get(
+    "/lookup",
+    response_model=UserLookupResponse,
+    dependencies=[Depends(limit_user_lookups)],
+    summary="Подсказки пользователей по началу логина",
+    description="Пользователи, чей логин начинается с prefix, для диалога выдачи доступа",
+)
+async def lookup_users(
+    current_user: CurrentUser,
+    db: ReadSessionDep,
+    prefix: str = Query(
+        ...,
+        min_length=2,
+        max_length=255,
+        description="Начало логина (с учётом регистра)",
+    ),
+    limit: int = Query(
+        default=10,
+        ge=1,
+        le=settings.USER_LOOKUP_MAX_RESULTS,
+        description="Сколько пользователей вернуть",
+    ),
+) -> UserLookupResponse:
+    """
+    Подсказки пользователей по началу логина.
+
+    Логины ищутся диапазоном по индексу ix_users_login_prefix, результат
+    для префикса кэшируется в памяти процесса на USER_LOOKUP_CACHE_TTL_SECONDS:
+    только что зарегистрированный пользователь может появиться в подсказках
+    с этой задержкой. Сам спрашивающий в выдачу не попадает.
+
+    - prefix: Начало логина, не короче 2 символов
+    - limit: Количество пользователей (1-USER_LOOKUP_MAX_RESULTS)
+    """
+    users = user_lookup_cache.get(prefix)
+    if users is None:
+        users = await _lookup(db, prefix)
+        user_lookup_cache.set(prefix, users)
+
+    return UserLookupResponse(
+        users=[user for user in users if user.userId != current_user.user_id][:limit]
+    )
@@ -0,0 +1 @@
+# Нагрузочные бенчмарки: генератор данных, смешанная нагрузка и отчёты
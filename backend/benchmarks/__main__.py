@@ -0,0 +1,211 @@
+"""
+Нагрузочный прогон: засеять данные, погонять смешанную нагрузку, выдать отчёт.
+
+Запуск из каталога backend/:
+
+    python -m benchmarks --users 200 --boards 500 --duration 30 --output report.json
+    python -m benchmarks --base-url http://localhost:8000 --baseline baseline.json
+
+Без --base-url запросы идут в приложение напрямую через ASGI-транспорт httpx.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+from sqlalchemy import delete, or_
+
+from benchmarks.dataset import DatasetConfig, generate_dataset, seed_dataset
+from benchmarks.report import (
+    REPORT_VERSION,
+    compare,
+    format_comparison,
+    format_table,
+    summarize,
+)
+from benchmarks.workload import DEFAULT_MIX, Workload, WorkloadConfig
+from core.database import engine
+from main import app
+from models.access import Access
+from models.board import Board
+from models.sticker import Sticker
+from models.user import User
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """Разбирает строку вида list_boards=40,open_board=30."""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = int(weight)
+    return mix
+
+
+def build_parser() -> argparse.ArgumentParser:
+    defaults = DatasetConfig()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Нагрузочный прогон Mirumir API"
+    )
+    data = parser.add_argument_group("dataset")
+    data.add_argument("--users", type=int, default=defaults.users)
+    data.add_argument("--boards", type=int, default=defaults.boards)
+    data.add_argument("--sticker-alpha", type=float, default=defaults.sticker_alpha)
+    data.add_argument("--max-stickers", type=int, default=defaults.max_stickers)
+    data.add_argument("--share-alpha", type=float, default=defaults.share_alpha)
+    data.add_argument("--max-shares", type=int, default=defaults.max_shares)
+    data.add_argument("--seed", type=int, default=defaults.seed)
+    data.add_argument(
+        "--keep-data",
+        action="store_true",
+        help="не удалять засеянные данные после прогона",
+    )
+
+    load = parser.add_argument_group("workload")
+    load.add_argument("--concurrency", type=int, default=20)
+    load.add_argument("--duration", type=float, default=30.0)
+    load.add_argument("--warmup", type=float, default=2.0)
+    load.add_argument("--max-operations", type=int, default=None)
+    load.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=dict(DEFAULT_MIX),
+        help="веса операций, например list_boards=40,open_board=30,"
+        "drag_sticker=25,share_revoke=5",
+    )
+    load.add_argument(
+        "--base-url",
+        default=None,
+        help="адрес запущенного сервера (по умолчанию — ASGI-приложение в процессе)",
+    )
+
+    output = parser.add_argument_group("output")
+    output.add_argument("--output", default=None, help="файл для JSON-отчёта")
+    output.add_argument("--baseline", default=None, help="JSON-отчёт для сравнения")
+    output.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="допустимое ухудшение p95 и пропускной способности (доля)",
+    )
+    return parser
+
+
+async def cleanup(user_ids: list[int]) -> None:
+    """Удаляет всё, что создал прогон (доски удаляются каскадом вместе со стикерами)."""
+    async with engine.begin() as conn:
+        await conn.execute(delete(Board).where(Board.creator_id.in_(user_ids)))
+        await conn.execute(
+            delete(Access).where(
+                or_(Access.user_id.in_(user_ids), Access.granted_by.in_(user_ids))
+            )
+        )
+        await conn.execute(delete(Sticker).where(Sticker.created_by.in_(user_ids)))
+        await conn.execute(delete(User).where(User.user_id.in_(user_ids)))
+
+
+def make_client(base_url: str | None) -> httpx.AsyncClient:
+    if base_url is not None:
+        return httpx.AsyncClient(base_url=base_url, timeout=60.0)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60.0
+    )
+
+
+async def run(args: argparse.Namespace) -> dict:
+    dataset_config = DatasetConfig(
+        users=args.users,
+        boards=args.boards,
+        sticker_alpha=args.sticker_alpha,
+        max_stickers=args.max_stickers,
+        share_alpha=args.share_alpha,
+        max_shares=args.max_shares,
+        seed=args.seed,
+    )
+    workload_config = WorkloadConfig(
+        concurrency=args.concurrency,
+        duration_seconds=args.duration,
+        max_operations=args.max_operations,
+        warmup_seconds=args.warmup,
+        mix=args.mix,
+        seed=args.seed,
+    )
+
+    started_at = datetime.now(timezone.utc)
+    plan = generate_dataset(dataset_config)
+    run_id = uuid.uuid4().hex[:8]
+    print(
+        f"Seeding run {run_id}: {dataset_config.users} users, "
+        f"{len(plan.boards)} boards, {plan.sticker_count} stickers, "
+        f"{plan.share_count} shares",
+        file=sys.stderr,
+    )
+    dataset = await seed_dataset(engine, plan, run_id)
+
+    try:
+        async with make_client(args.base_url) as client:
+            workload = Workload(client, dataset, workload_config)
+            elapsed = await workload.run()
+    finally:
+        if not args.keep_data:
+            await cleanup(dataset.user_ids)
+        await engine.dispose()
+
+    sticker_counts = sorted(board.stickers for board in plan.boards)
+    report = summarize(workload.samples, elapsed)
+    report["meta"] = {
+        "version": REPORT_VERSION,
+        "run_id": run_id,
+        "started_at": started_at.isoformat(),
+        "target": args.base_url or "asgi",
+        "python": platform.python_version(),
+        "dataset": {
+            "users": dataset_config.users,
+            "boards": len(plan.boards),
+            "stickers": plan.sticker_count,
+            "shares": plan.share_count,
+            "max_stickers_per_board": sticker_counts[-1] if sticker_counts else 0,
+            "median_stickers_per_board": sticker_counts[len(sticker_counts) // 2]
+            if sticker_counts
+            else 0,
+            "sticker_alpha": dataset_config.sticker_alpha,
+            "share_alpha": dataset_config.share_alpha,
+            "seed": dataset_config.seed,
+        },
+        "workload": {
+            "concurrency": workload_config.concurrency,
+            "duration_seconds": workload_config.duration_seconds,
+            "warmup_seconds": workload_config.warmup_seconds,
+            "max_operations": workload_config.max_operations,
+            "mix": workload_config.mix,
+        },
+    }
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    report = asyncio.run(run(args))
+
+    print(format_table(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        rows = compare(report, baseline, args.tolerance)
+        print()
+        print(format_comparison(rows))
+        if any(row["regressions"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
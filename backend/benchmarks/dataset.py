@@ -0,0 +1,228 @@
+import random
+from dataclasses import dataclass, field
+
+import bcrypt
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from models.access import Access
+from models.board import Board
+from models.permission import Permission
+from models.sticker import Sticker
+from models.user import User
+
+BENCH_PASSWORD = "BenchPass_123!"
+_INSERT_BATCH = 5000
+_STICKER_COLORS = ("#FFEB3B", "#FF9800", "#8BC34A", "#03A9F4", "#E91E63")
+
+
+@dataclass
+class DatasetConfig:
+    """Параметры синтетического набора данных."""
+
+    users: int = 200
+    boards: int = 500
+    # Показатели степенных распределений: чем меньше, тем длиннее хвост
+    sticker_alpha: float = 1.2
+    max_stickers: int = 1000
+    share_alpha: float = 1.5
+    max_shares: int = 50
+    # Доля пользователей, которым принадлежит большинство досок
+    owner_skew: float = 1.1
+    edit_share_ratio: float = 0.3
+    seed: int = 42
+
+
+@dataclass
+class BoardPlan:
+    owner: int
+    stickers: int
+    # Индекс пользователя -> уровень доступа
+    shares: dict[int, Permission] = field(default_factory=dict)
+
+
+@dataclass
+class DatasetPlan:
+    """Набор данных до вставки: пользователи задаются индексами 0..users-1."""
+
+    config: DatasetConfig
+    boards: list[BoardPlan]
+
+    @property
+    def sticker_count(self) -> int:
+        return sum(board.stickers for board in self.boards)
+
+    @property
+    def share_count(self) -> int:
+        return sum(len(board.shares) for board in self.boards)
+
+
+@dataclass
+class SeededBoard:
+    board_id: int
+    owner_id: int
+    sticker_ids: list[int]
+    editors: set[int]
+    viewers: set[int]
+
+
+@dataclass
+class SeededDataset:
+    """Идентификаторы вставленных строк, по которым строится нагрузка."""
+
+    run_id: str
+    user_ids: list[int]
+    logins: dict[int, str]
+    boards: list[SeededBoard]
+
+
+def _power_law(rng: random.Random, alpha: float, cap: int) -> int:
+    """Целое из распределения Парето со сдвигом к нулю, не больше cap."""
+    return min(int(rng.paretovariate(alpha)) - 1, cap)
+
+
+def generate_dataset(config: DatasetConfig) -> DatasetPlan:
+    """
+    Строит план набора данных.
+
+    Число стикеров и число выданных доступов на доску распределены по
+    степенному закону: большинство досок маленькие, но есть «тяжёлые»
+    доски с сотнями стикеров и десятками участников. Владельцы тоже
+    неравномерны — немногие пользователи владеют многими досками.
+    """
+    rng = random.Random(config.seed)
+    owner_weights = [
+        1 / (rank + 1) ** config.owner_skew for rank in range(config.users)
+    ]
+    owners = rng.choices(range(config.users), weights=owner_weights, k=config.boards)
+
+    boards = []
+    for owner in owners:
+        board = BoardPlan(
+            owner=owner,
+            stickers=_power_law(rng, config.sticker_alpha, config.max_stickers),
+        )
+        share_count = _power_law(
+            rng, config.share_alpha, min(config.max_shares, config.users - 1)
+        )
+        candidates = [user for user in range(config.users) if user != owner]
+        for user in rng.sample(candidates, share_count):
+            if rng.random() < config.edit_share_ratio:
+                board.shares[user] = Permission.EDIT
+            else:
+                board.shares[user] = Permission.VIEW
+        boards.append(board)
+
+    return DatasetPlan(config=config, boards=boards)
+
+
+async def _insert_returning(conn, statement, rows: list[dict]) -> list:
+    returned = []
+    for start in range(0, len(rows), _INSERT_BATCH):
+        result = await conn.execute(statement, rows[start : start + _INSERT_BATCH])
+        returned.extend(result.all())
+    return returned
+
+
+async def seed_dataset(
+    engine: AsyncEngine, plan: DatasetPlan, run_id: str
+) -> SeededDataset:
+    """
+    Вставляет план в БД пачками в одной транзакции.
+
+    Логины получают префикс run_id, поэтому повторные прогоны не конфликтуют.
+    У всех пользователей один пароль BENCH_PASSWORD: хеш считается один раз.
+    """
+    rng = random.Random(plan.config.seed)
+    password_hash = bcrypt.hashpw(BENCH_PASSWORD.encode("utf-8"), bcrypt.gensalt())
+
+    async with engine.begin() as conn:
+        user_rows = [
+            {
+                "login": f"bench_{run_id}_{index}@bench.local",
+                "hash_password": password_hash.decode("utf-8"),
+            }
+            for index in range(plan.config.users)
+        ]
+        users = await _insert_returning(
+            conn, insert(User).returning(User.user_id, User.login), user_rows
+        )
+        user_ids = [row.user_id for row in users]
+
+        board_rows = [
+            {
+                "creator_id": user_ids[board.owner],
+                "title": f"Bench board {index}",
+                "is_public": False,
+            }
+            for index, board in enumerate(plan.boards)
+        ]
+        board_ids = [
+            row.board_id
+            for row in await _insert_returning(
+                conn, insert(Board).returning(Board.board_id), board_rows
+            )
+        ]
+
+        access_rows = [
+            {
+                "user_id": user_ids[user],
+                "board_id": board_id,
+                "permission": permission,
+                "granted_by": user_ids[board.owner],
+            }
+            for board_id, board in zip(board_ids, plan.boards)
+            for user, permission in board.shares.items()
+        ]
+        for start in range(0, len(access_rows), _INSERT_BATCH):
+            await conn.execute(
+                insert(Access), access_rows[start : start + _INSERT_BATCH]
+            )
+
+        sticker_rows = [
+            {
+                "board_id": board_id,
+                "created_by": user_ids[board.owner],
+                "x": rng.uniform(0, 2000),
+                "y": rng.uniform(0, 2000),
+                "layer_level": layer,
+                "text": f"Sticker {layer}",
+                "color": rng.choice(_STICKER_COLORS),
+            }
+            for board_id, board in zip(board_ids, plan.boards)
+            for layer in range(board.stickers)
+        ]
+        stickers = await _insert_returning(
+            conn,
+            insert(Sticker).returning(Sticker.sticker_id, Sticker.board_id),
+            sticker_rows,
+        )
+
+    sticker_ids: dict[int, list[int]] = {board_id: [] for board_id in board_ids}
+    for row in stickers:
+        sticker_ids[row.board_id].append(row.sticker_id)
+
+    seeded_boards = [
+        SeededBoard(
+            board_id=board_id,
+            owner_id=user_ids[board.owner],
+            sticker_ids=sticker_ids[board_id],
+            editors={
+                user_ids[user]
+                for user, permission in board.shares.items()
+                if permission == Permission.EDIT
+            },
+            viewers={
+                user_ids[user]
+                for user, permission in board.shares.items()
+                if permission == Permission.VIEW
+            },
+        )
+        for board_id, board in zip(board_ids, plan.boards)
+    ]
+    return SeededDataset(
+        run_id=run_id,
+        user_ids=user_ids,
+        logins={row.user_id: row.login for row in users},
+        boards=seeded_boards,
+    )
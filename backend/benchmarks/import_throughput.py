@@ -0,0 +1,120 @@
+"""
+Пропускная способность импорта доски (POST /api/v1/boards/import).
+
+Запуск из каталога backend/ (нужна БД из настроек):
+
+    python -m benchmarks.import_throughput --stickers 200000 --format ndjson
+
+Тело генерируется на лету и отправляется потоком через ASGI-транспорт
+httpx. Вывод — JSON со скоростью в стикерах в секунду и приростом пикового
+RSS процесса: при потоковом разборе он не должен зависеть от --stickers.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import resource
+import sys
+import time
+import uuid
+
+import httpx
+from sqlalchemy import delete, insert
+
+from core.database import engine
+from core.security import create_access_token
+from main import app
+from models.board import Board
+from models.user import User
+
+COLORS = ("#FFEB3B", "#FF8A80", "#80D8FF", "#CCFF90")
+
+
+def _sticker_line(rng: random.Random, index: int) -> bytes:
+    sticker = {
+        "x": round(rng.uniform(0, 5000), 1),
+        "y": round(rng.uniform(0, 5000), 1),
+        "width": 200,
+        "height": 150,
+        "color": rng.choice(COLORS),
+        "text": f"Импортированный стикер {index}",
+        "layerLevel": index % 10,
+    }
+    return json.dumps(sticker, ensure_ascii=False).encode("utf-8")
+
+
+async def _body(stickers: int, fmt: str, chunk_records: int = 500):
+    """Тело запроса порциями по chunk_records записей."""
+    rng = random.Random(42)
+    header = json.dumps({"title": "Import benchmark"}).encode("utf-8")
+    separator = b"\n" if fmt == "ndjson" else b","
+    parts = [b"[" + header if fmt == "json" else header]
+    for index in range(stickers):
+        parts.append(_sticker_line(rng, index))
+        if len(parts) >= chunk_records:
+            yield separator.join(parts) + separator
+            parts = []
+    tail = separator.join(parts)
+    yield tail + (b"]" if fmt == "json" else b"\n")
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss в Linux — килобайты
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def run(stickers: int, fmt: str) -> dict:
+    login = f"import_bench_{uuid.uuid4().hex[:8]}@example.com"
+    async with engine.begin() as conn:
+        user_id = await conn.scalar(
+            insert(User).values(login=login, hash_password="!").returning(User.user_id)
+        )
+    token = create_access_token({"sub": str(user_id), "login": login})
+    content_type = "application/x-ndjson" if fmt == "ndjson" else "application/json"
+
+    rss_before = _max_rss_mb()
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://bench",
+            timeout=None,
+        ) as client:
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/v1/boards/import",
+                content=_body(stickers, fmt),
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": content_type,
+                },
+            )
+            elapsed = time.perf_counter() - started
+        response.raise_for_status()
+        imported = response.json()["stickersImported"]
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(delete(Board).where(Board.creator_id == user_id))
+            await conn.execute(delete(User).where(User.user_id == user_id))
+        await engine.dispose()
+
+    return {
+        "format": fmt,
+        "stickers": imported,
+        "seconds": round(elapsed, 3),
+        "stickers_per_second": round(imported / elapsed, 1),
+        "peak_rss_growth_mb": round(_max_rss_mb() - rss_before, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_throughput")
+    parser.add_argument("--stickers", type=int, default=100_000)
+    parser.add_argument("--format", choices=("ndjson", "json"), default="ndjson")
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args.stickers, args.format)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Пропускная способность чтения публичной доски против обычного чтения.
+
+Запуск из каталога backend/ (нужна БД из настроек):
+
+    python -m benchmarks.public_board --stickers 500 --requests 2000 --concurrency 20
+
+Засевается одна публичная доска со стикерами. Затем одно и то же число
+запросов прогоняется через GET /api/v1/boards/{board_id} с авторизацией
+(get_board), через GET /api/v1/boards/{board_id}/public с Accept-Encoding:
+gzip (готовое тело из памяти) и через тот же путь с If-None-Match (304,
+как при перепроверке прокси). Вывод — JSON с запросами в секунду и p50/p99.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+
+import httpx
+from sqlalchemy import delete, insert
+
+from benchmarks.report import percentile
+from core.database import engine
+from core.security import create_access_token
+from main import app
+from models.board import Board
+from models.sticker import Sticker
+from models.user import User
+
+_STICKER_COLORS = ("#FFEB3B", "#FF9800", "#8BC34A", "#03A9F4", "#E91E63")
+
+
+async def seed(stickers: int, seed: int) -> tuple[int, int]:
+    rng = random.Random(seed)
+    async with engine.begin() as conn:
+        user_id = await conn.scalar(
+            insert(User)
+            .values(
+                login=f"public_bench_{uuid.uuid4().hex[:8]}@bench.local",
+                hash_password="!",
+            )
+            .returning(User.user_id)
+        )
+        board_id = await conn.scalar(
+            insert(Board)
+            .values(creator_id=user_id, title="Публичная доска", is_public=True)
+            .returning(Board.board_id)
+        )
+        if stickers:
+            await conn.execute(
+                insert(Sticker),
+                [
+                    {
+                        "board_id": board_id,
+                        "created_by": user_id,
+                        "x": rng.uniform(0, 2000),
+                        "y": rng.uniform(0, 2000),
+                        "layer_level": layer,
+                        "text": f"Sticker {layer}",
+                        "color": rng.choice(_STICKER_COLORS),
+                    }
+                    for layer in range(stickers)
+                ],
+            )
+    return user_id, board_id
+
+
+async def cleanup(user_id: int) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(delete(Sticker).where(Sticker.created_by == user_id))
+        await conn.execute(delete(Board).where(Board.creator_id == user_id))
+        await conn.execute(delete(User).where(User.user_id == user_id))
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: dict,
+    requests: int,
+    concurrency: int,
+    expected_status: int = 200,
+) -> dict:
+    # Прогрев: план запроса, кэш страниц и (для публичного пути) готовое тело
+    response = await client.get(url, headers=headers)
+    assert response.status_code == expected_status, response.text
+
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.get(url, headers=headers)
+            latencies.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == expected_status, response.text
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests_per_second": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        # Переданные байты: httpx распаковывает gzip в response.content
+        "body_bytes": int(response.headers.get("Content-Length", 0)),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    user_id, board_id = await seed(args.stickers, args.seed)
+    auth = {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+    public_url = f"/api/v1/boards/{board_id}/public"
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            get_board = await measure(
+                client,
+                f"/api/v1/boards/{board_id}",
+                auth,
+                args.requests,
+                args.concurrency,
+            )
+            gzip_headers = {"Accept-Encoding": "gzip"}
+            public = await measure(
+                client, public_url, gzip_headers, args.requests, args.concurrency
+            )
+            etag = (await client.get(public_url, headers=gzip_headers)).headers["ETag"]
+            revalidate = await measure(
+                client,
+                public_url,
+                gzip_headers | {"If-None-Match": etag},
+                args.requests,
+                args.concurrency,
+                expected_status=304,
+            )
+    finally:
+        await cleanup(user_id)
+        await engine.dispose()
+    return {
+        "stickers": args.stickers,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "get_board": get_board,
+        "public": public,
+        "public_not_modified": revalidate,
+        "public_speedup": round(
+            public["requests_per_second"] / get_board["requests_per_second"], 1
+        ),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.public_board")
+    parser.add_argument("--stickers", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args)), indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
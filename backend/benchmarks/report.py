@@ -0,0 +1,113 @@
+import math
+from collections.abc import Iterable
+
+from benchmarks.workload import Sample
+
+REPORT_VERSION = 1
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Перцентиль по ближайшему рангу; sorted_values должен быть отсортирован."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: Iterable[Sample], elapsed_seconds: float) -> dict:
+    """Считает пропускную способность и задержки по каждому эндпоинту и в целом."""
+    by_endpoint: dict[str, list[Sample]] = {}
+    all_samples = []
+    for sample in samples:
+        by_endpoint.setdefault(sample.endpoint, []).append(sample)
+        all_samples.append(sample)
+
+    def stats(group: list[Sample]) -> dict:
+        latencies = sorted(sample.seconds * 1000 for sample in group)
+        status_codes: dict[str, int] = {}
+        for sample in group:
+            key = str(sample.status_code)
+            status_codes[key] = status_codes.get(key, 0) + 1
+        return {
+            "requests": len(group),
+            "errors": sum(1 for sample in group if not sample.expected),
+            "throughput_rps": round(len(group) / elapsed_seconds, 2)
+            if elapsed_seconds > 0
+            else 0.0,
+            "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "p50_ms": round(percentile(latencies, 0.50), 3),
+            "p95_ms": round(percentile(latencies, 0.95), 3),
+            "p99_ms": round(percentile(latencies, 0.99), 3),
+            "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+            "status_codes": status_codes,
+        }
+
+    return {
+        "elapsed_seconds": round(elapsed_seconds, 3),
+        "total": stats(all_samples),
+        "endpoints": {
+            endpoint: stats(group) for endpoint, group in sorted(by_endpoint.items())
+        },
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """
+    Сравнивает отчёт с базовым.
+
+    Регрессия — рост p95 или падение пропускной способности больше чем на
+    tolerance (доля, например 0.1 = 10%), либо появление ошибок.
+    """
+    rows = []
+    current = {"total": report["total"], **report["endpoints"]}
+    previous = {"total": baseline["total"], **baseline["endpoints"]}
+    for endpoint, stats in current.items():
+        base = previous.get(endpoint)
+        if base is None:
+            continue
+
+        reasons = []
+        if base["p95_ms"] > 0 and stats["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            reasons.append("p95")
+        if stats["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            reasons.append("throughput")
+        if stats["errors"] > base["errors"]:
+            reasons.append("errors")
+
+        rows.append(
+            {
+                "endpoint": endpoint,
+                "p95_ms": stats["p95_ms"],
+                "baseline_p95_ms": base["p95_ms"],
+                "throughput_rps": stats["throughput_rps"],
+                "baseline_throughput_rps": base["throughput_rps"],
+                "regressions": reasons,
+            }
+        )
+    return rows
+
+
+def format_table(report: dict) -> str:
+    header = f"{'endpoint':<48} {'req':>7} {'err':>5} {'rps':>9} {'p50':>9} {'p95':>9} {'p99':>9}"
+    lines = [header, "-" * len(header)]
+    rows = [*report["endpoints"].items(), ("total", report["total"])]
+    for endpoint, stats in rows:
+        lines.append(
+            f"{endpoint:<48} {stats['requests']:>7} {stats['errors']:>5} "
+            f"{stats['throughput_rps']:>9.1f} {stats['p50_ms']:>9.2f} "
+            f"{stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(rows: list[dict]) -> str:
+    lines = []
+    for row in rows:
+        mark = (
+            "REGRESSION " + ",".join(row["regressions"]) if row["regressions"] else "ok"
+        )
+        lines.append(
+            f"{row['endpoint']:<48} p95 {row['baseline_p95_ms']:.2f} -> {row['p95_ms']:.2f} ms, "
+            f"rps {row['baseline_throughput_rps']:.1f} -> {row['throughput_rps']:.1f}  {mark}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,198 @@
+"""
+Задержка поиска по доскам (GET /api/v1/boards?q=...) у пользователя с
+большим числом доступных досок.
+
+Запуск из каталога backend/ (нужна БД из настроек):
+
+    python -m benchmarks.search_latency --own 6000 --shared 6000 --foreign 20000
+
+Засеиваются доски пользователя, доски, расшаренные ему другим владельцем, и
+чужие доски, которые поиск видеть не должен. Заголовки и описания собраны из
+общего словаря, поэтому частые слова совпадают с тысячами досок, а редкие —
+с единицами. Вывод — JSON с p50/p95/p99 по каждому запросу и по списку без q.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+
+import httpx
+from sqlalchemy import delete, insert, or_
+
+from benchmarks.report import percentile
+from core.database import engine
+from core.security import create_access_token
+from main import app
+from models.access import Access
+from models.board import Board
+from models.permission import Permission
+from models.user import User
+
+_INSERT_BATCH = 5000
+# Слова словаря встречаются с частотой по закону Ципфа: первые — в тысячах
+# досок, последние — в единицах
+VOCABULARY = (
+    "проект",
+    "спринт",
+    "команда",
+    "roadmap",
+    "дизайн",
+    "ретроспектива",
+    "маркетинг",
+    "бэклог",
+    "исследование",
+    "онбординг",
+    "архитектура",
+    "бюджет",
+    "интервью",
+    "релиз",
+    "инцидент",
+    "квартал",
+    "storyboard",
+    "воркшоп",
+    "гипотеза",
+    "миграция",
+)
+QUERIES = ("проект", "ретро", "команда спринт", "миграция", "storyb", "несуществующее")
+
+
+def _text(rng: random.Random, words: int) -> str:
+    weights = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+    return " ".join(rng.choices(VOCABULARY, weights=weights, k=words))
+
+
+def _board_rows(rng: random.Random, creator_id: int, count: int) -> list[dict]:
+    return [
+        {
+            "creator_id": creator_id,
+            "title": f"{_text(rng, 2)} {index}",
+            "description": _text(rng, 8),
+            "is_public": False,
+        }
+        for index in range(count)
+    ]
+
+
+async def _insert_boards(conn, rows: list[dict]) -> list[int]:
+    board_ids = []
+    for start in range(0, len(rows), _INSERT_BATCH):
+        result = await conn.execute(
+            insert(Board).returning(Board.board_id), rows[start : start + _INSERT_BATCH]
+        )
+        board_ids.extend(result.scalars().all())
+    return board_ids
+
+
+async def seed(own: int, shared: int, foreign: int, seed: int) -> tuple[list, int]:
+    rng = random.Random(seed)
+    run_id = uuid.uuid4().hex[:8]
+    async with engine.begin() as conn:
+        user_ids = list(
+            await conn.scalars(
+                insert(User).returning(User.user_id),
+                [
+                    {
+                        "login": f"search_bench_{run_id}_{role}@bench.local",
+                        "hash_password": "!",
+                    }
+                    for role in ("user", "owner", "stranger")
+                ],
+            )
+        )
+        user_id, owner_id, stranger_id = user_ids
+        await _insert_boards(conn, _board_rows(rng, user_id, own))
+        shared_ids = await _insert_boards(conn, _board_rows(rng, owner_id, shared))
+        await _insert_boards(conn, _board_rows(rng, stranger_id, foreign))
+        access_rows = [
+            {
+                "user_id": user_id,
+                "board_id": board_id,
+                "permission": Permission.VIEW,
+                "granted_by": owner_id,
+            }
+            for board_id in shared_ids
+        ]
+        for start in range(0, len(access_rows), _INSERT_BATCH):
+            await conn.execute(
+                insert(Access), access_rows[start : start + _INSERT_BATCH]
+            )
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("ANALYZE boards")
+        await conn.exec_driver_sql("ANALYZE accesses")
+    return user_ids, user_id
+
+
+async def cleanup(user_ids: list[int]) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(
+            delete(Access).where(
+                or_(Access.user_id.in_(user_ids), Access.granted_by.in_(user_ids))
+            )
+        )
+        await conn.execute(delete(Board).where(Board.creator_id.in_(user_ids)))
+        await conn.execute(delete(User).where(User.user_id.in_(user_ids)))
+
+
+async def measure(
+    client: httpx.AsyncClient, token: str, params: dict, repeats: int
+) -> dict:
+    headers = {"Authorization": f"Bearer {token}"}
+    # Прогрев: план запроса и кэш страниц
+    response = await client.get("/api/v1/boards", params=params, headers=headers)
+    response.raise_for_status()
+    latencies = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        response = await client.get("/api/v1/boards", params=params, headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+    latencies.sort()
+    return {
+        "results": len(response.json()["boards"]),
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    user_ids, user_id = await seed(args.own, args.shared, args.foreign, args.seed)
+    token = create_access_token({"sub": str(user_id)})
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            results = {"(no q)": await measure(client, token, {}, args.repeats)}
+            for query in QUERIES:
+                results[query] = await measure(
+                    client, token, {"q": query}, args.repeats
+                )
+    finally:
+        await cleanup(user_ids)
+        await engine.dispose()
+    return {
+        "accessible_boards": args.own + args.shared,
+        "foreign_boards": args.foreign,
+        "repeats": args.repeats,
+        "queries": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.search_latency")
+    parser.add_argument("--own", type=int, default=6000)
+    parser.add_argument("--shared", type=int, default=6000)
+    parser.add_argument("--foreign", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args)), indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
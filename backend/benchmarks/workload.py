@@ -0,0 +1,205 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+from benchmarks.dataset import SeededBoard, SeededDataset
+from core.security import create_access_token
+
+API_PREFIX = "/api/v1"
+
+# Доли операций в смешанной нагрузке
+DEFAULT_MIX = {
+    "list_boards": 40,
+    "open_board": 30,
+    "drag_sticker": 25,
+    "share_revoke": 5,
+}
+
+
+@dataclass
+class WorkloadConfig:
+    concurrency: int = 20
+    duration_seconds: float = 30.0
+    # Если задано, прогон останавливается после стольких операций
+    max_operations: int | None = None
+    warmup_seconds: float = 2.0
+    mix: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    seed: int = 42
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    status_code: int
+    seconds: float
+    expected: bool
+
+
+class Workload:
+    """
+    Смешанная нагрузка виртуальных пользователей поверх засеянного набора.
+
+    Токены выпускаются локально тем же SECRET_KEY, что у сервера, чтобы
+    в замеры не попадал bcrypt при входе каждого пользователя.
+    """
+
+    def __init__(
+        self, client: httpx.AsyncClient, dataset: SeededDataset, config: WorkloadConfig
+    ) -> None:
+        self.client = client
+        self.dataset = dataset
+        self.config = config
+        self.samples: list[Sample] = []
+        self._rng = random.Random(config.seed)
+        self._tokens = {
+            user_id: create_access_token({"sub": str(user_id), "login": login})
+            for user_id, login in dataset.logins.items()
+        }
+        self._draggable = [board for board in dataset.boards if board.sticker_ids]
+        # Пары (доска, пользователь), по которым сейчас идёт share/revoke
+        self._sharing: set[tuple[int, int]] = set()
+        self._recording = False
+        self._operations = 0
+
+    def _headers(self, user_id: int) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self._tokens[user_id]}"}
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        user_id: int,
+        expected: int,
+        **kwargs,
+    ) -> None:
+        started = time.perf_counter()
+        response = await self.client.request(
+            method, API_PREFIX + url, headers=self._headers(user_id), **kwargs
+        )
+        elapsed = time.perf_counter() - started
+        if self._recording:
+            self.samples.append(
+                Sample(
+                    endpoint=endpoint,
+                    status_code=response.status_code,
+                    seconds=elapsed,
+                    expected=response.status_code == expected,
+                )
+            )
+
+    async def list_boards(self) -> None:
+        user_id = self._rng.choice(self.dataset.user_ids)
+        await self._request(
+            "GET /boards", "GET", "/boards", user_id, 200, params={"limit": 20}
+        )
+
+    async def open_board(self) -> None:
+        board = self._rng.choice(self.dataset.boards)
+        members = [board.owner_id, *board.editors, *board.viewers]
+        await self._request(
+            "GET /boards/{board_id}",
+            "GET",
+            f"/boards/{board.board_id}",
+            self._rng.choice(members),
+            200,
+        )
+
+    async def drag_sticker(self) -> None:
+        if not self._draggable:
+            return await self.open_board()
+        board = self._rng.choice(self._draggable)
+        editor = self._rng.choice([board.owner_id, *board.editors])
+        sticker_id = self._rng.choice(board.sticker_ids)
+        await self._request(
+            "PATCH /boards/{board_id}/stickers/{sticker_id}",
+            "PATCH",
+            f"/boards/{board.board_id}/stickers/{sticker_id}",
+            editor,
+            200,
+            json={"x": self._rng.uniform(0, 2000), "y": self._rng.uniform(0, 2000)},
+        )
+
+    def _pick_share_target(self, board: SeededBoard) -> int | None:
+        for _ in range(10):
+            user_id = self._rng.choice(self.dataset.user_ids)
+            if (
+                user_id != board.owner_id
+                and user_id not in board.editors
+                and user_id not in board.viewers
+                and (board.board_id, user_id) not in self._sharing
+            ):
+                return user_id
+        return None
+
+    async def share_revoke(self) -> None:
+        board = self._rng.choice(self.dataset.boards)
+        target = self._pick_share_target(board)
+        if target is None:
+            return await self.list_boards()
+
+        key = (board.board_id, target)
+        self._sharing.add(key)
+        login = self.dataset.logins[target]
+        try:
+            await self._request(
+                "POST /boards/{board_id}/share",
+                "POST",
+                f"/boards/{board.board_id}/share",
+                board.owner_id,
+                200,
+                json={"userLogin": login, "permission": "view"},
+            )
+            await self._request(
+                "DELETE /boards/{board_id}/share",
+                "DELETE",
+                f"/boards/{board.board_id}/share",
+                board.owner_id,
+                204,
+                json={"userLogin": login},
+            )
+        finally:
+            self._sharing.discard(key)
+
+    async def _virtual_user(self, deadline: float) -> None:
+        operations = list(self.config.mix)
+        weights = list(self.config.mix.values())
+        while time.perf_counter() < deadline:
+            if (
+                self.config.max_operations is not None
+                and self._operations >= self.config.max_operations
+            ):
+                return
+            self._operations += 1
+            operation = self._rng.choices(operations, weights=weights)[0]
+            await getattr(self, operation)()
+
+    async def run(self) -> float:
+        """Прогревает сервер, затем гоняет нагрузку. Возвращает длительность замера."""
+        unknown = set(self.config.mix) - set(DEFAULT_MIX)
+        if unknown:
+            raise ValueError(f"Unknown operations in mix: {sorted(unknown)}")
+
+        if self.config.warmup_seconds > 0:
+            warmup_deadline = time.perf_counter() + self.config.warmup_seconds
+            await asyncio.gather(
+                *(
+                    self._virtual_user(warmup_deadline)
+                    for _ in range(self.config.concurrency)
+                )
+            )
+
+        self._operations = 0
+        self._recording = True
+        started = time.perf_counter()
+        deadline = started + self.config.duration_seconds
+        try:
+            await asyncio.gather(
+                *(self._virtual_user(deadline) for _ in range(self.config.concurrency))
+            )
+        finally:
+            self._recording = False
+        return time.perf_counter() - started
@@ -0,0 +1,230 @@
+import asyncio
+import itertools
+import re
+import time
+from collections import defaultdict
+from urllib.parse import parse_qs
+
+from core.config import settings
+from core.metrics import Counter, Gauge, Histogram
+
+# Классы запросов в порядке приоритета: меньше — раньше получает слот
+INTERACTIVE = "interactive"
+DEFAULT = "default"
+HEAVY = "heavy"
+PRIORITIES = {INTERACTIVE: 0, DEFAULT: 1, HEAVY: 2}
+
+# (методы, шаблон пути, класс, маршрут); первое совпадение выигрывает.
+# Имя маршрута — ключ ADMISSION_ROUTE_LIMITS: отдельный лимит не даёт одному
+# дорогому маршруту занять все слоты своего класса
+ROUTE_CLASSES: tuple[tuple[frozenset[str], re.Pattern, str, str], ...] = (
+    (
+        frozenset({"POST", "PATCH", "DELETE"}),
+        re.compile(r"^/api/v1/boards/\d+/stickers(/\d+)?$"),
+        INTERACTIVE,
+        "sticker_write",
+    ),
+    (frozenset({"GET"}), re.compile(r"^/api/v1/boards/\d+$"), INTERACTIVE, "board"),
+    (
+        frozenset({"GET"}),
+        re.compile(r"^/api/v1/boards/\d+/public$"),
+        INTERACTIVE,
+        "public_board",
+    ),
+    (
+        frozenset({"POST"}),
+        re.compile(r"^/api/v1/boards/\d+/duplicate$"),
+        HEAVY,
+        "board_duplicate",
+    ),
+    (
+        frozenset({"POST"}),
+        re.compile(r"^/api/v1/boards/import$"),
+        HEAVY,
+        "board_import",
+    ),
+)
+# Служебные пути не ограничиваются: метрики и проверки живости нужны под нагрузкой
+EXEMPT_PATHS = frozenset({"/", "/api", "/metrics"})
+
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight", "Запросов, допущенных к обработке", labelnames=("class",)
+)
+ADMISSION_QUEUED = Gauge(
+    "admission_queued", "Запросов, ждущих допуска", labelnames=("class",)
+)
+ADMISSION_REJECTED = Counter(
+    "admission_rejected_total",
+    "Запросов, отклонённых с 503",
+    labelnames=("class", "reason"),
+)
+ADMISSION_WAIT_SECONDS = Histogram(
+    "admission_wait_seconds",
+    "Ожидание допуска к обработке",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    labelnames=("class",),
+)
+
+
+def classify_request(
+    method: str, path: str, query_string: bytes
+) -> tuple[str, str | None] | None:
+    """
+    Класс и маршрут запроса для допуска; None — запрос не ограничивается.
+    Маршрут None — у запроса нет своего лимита, только лимит класса.
+    """
+    if path in EXEMPT_PATHS:
+        return None
+    for methods, pattern, request_class, route in ROUTE_CLASSES:
+        if method in methods and pattern.match(path):
+            return request_class, route
+    # Список досок с filter=all (по умолчанию) — самый дорогой запрос чтения
+    if method == "GET" and path == "/api/v1/boards":
+        board_filter = parse_qs(query_string.decode("latin-1")).get("filter", ["all"])
+        if board_filter[-1] == "all":
+            return HEAVY, "board_list"
+    return DEFAULT, None
+
+
+class Waiter:
+    __slots__ = ("future", "priority", "request_class", "route", "sequence")
+
+    def __init__(
+        self,
+        request_class: str,
+        route: str | None,
+        sequence: int,
+        future: asyncio.Future,
+    ) -> None:
+        self.request_class = request_class
+        self.route = route
+        self.priority = PRIORITIES.get(request_class, PRIORITIES[DEFAULT])
+        self.sequence = sequence
+        self.future = future
+
+
+class AdmissionController:
+    """
+    Ограничение числа одновременно обрабатываемых запросов.
+
+    Запрос допускается, если не превышены общий лимит, лимит его класса и
+    лимит его маршрута. Иначе он ждёт в очереди: освободившийся слот получает
+    самый приоритетный (затем самый ранний) ожидающий, которого пропускают
+    лимиты класса и маршрута.
+    Кто прождал дольше queue_timeout или не поместился в очередь, получает
+    отказ — лучше быстро ответить 503, чем замедлить всех.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        class_limits: dict[str, int],
+        max_queue: int,
+        queue_timeout: float,
+        route_limits: dict[str, int] | None = None,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.class_limits = class_limits
+        self.route_limits = route_limits or {}
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.class_in_flight: dict[str, int] = defaultdict(int)
+        self.route_in_flight: dict[str, int] = defaultdict(int)
+        self._waiters: list[Waiter] = []
+        self._sequence = itertools.count()
+
+    def _can_admit(self, request_class: str, route: str | None) -> bool:
+        if self.in_flight >= self.max_in_flight:
+            return False
+        limit = self.class_limits.get(request_class)
+        if limit is not None and self.class_in_flight[request_class] >= limit:
+            return False
+        limit = self.route_limits.get(route) if route is not None else None
+        return limit is None or self.route_in_flight[route] < limit
+
+    def _admit(self, request_class: str, route: str | None) -> None:
+        self.in_flight += 1
+        self.class_in_flight[request_class] += 1
+        if route is not None:
+            self.route_in_flight[route] += 1
+        ADMISSION_IN_FLIGHT.labels(request_class).inc()
+
+    async def acquire(self, request_class: str, route: str | None = None) -> str | None:
+        """Ждёт слот. Возвращает None при допуске или причину отказа."""
+        if self._can_admit(request_class, route):
+            self._admit(request_class, route)
+            return None
+        if len(self._waiters) >= self.max_queue:
+            ADMISSION_REJECTED.labels(request_class, "queue_full").inc()
+            return "queue_full"
+
+        waiter = Waiter(
+            request_class,
+            route,
+            next(self._sequence),
+            asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        queued = ADMISSION_QUEUED.labels(request_class)
+        queued.inc()
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter.future, self.queue_timeout)
+        except TimeoutError:
+            # Слот мог быть выдан в тот же момент, когда истёк таймаут
+            if not waiter.future.done() or waiter.future.cancelled():
+                ADMISSION_REJECTED.labels(request_class, "timeout").inc()
+                return "timeout"
+        except asyncio.CancelledError:
+            # Клиент ушёл: выданный слот нужно вернуть
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release(request_class, route)
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            queued.dec()
+            ADMISSION_WAIT_SECONDS.labels(request_class).observe(
+                time.perf_counter() - started
+            )
+        return None
+
+    def release(self, request_class: str, route: str | None = None) -> None:
+        self.in_flight -= 1
+        self.class_in_flight[request_class] -= 1
+        if route is not None:
+            self.route_in_flight[route] -= 1
+        ADMISSION_IN_FLIGHT.labels(request_class).dec()
+        self._grant()
+
+    def _grant(self) -> None:
+        while self.in_flight < self.max_in_flight:
+            candidates = [
+                waiter
+                for waiter in self._waiters
+                if not waiter.future.done()
+                and self._can_admit(waiter.request_class, waiter.route)
+            ]
+            if not candidates:
+                return
+            waiter = min(candidates, key=lambda w: (w.priority, w.sequence))
+            self._waiters.remove(waiter)
+            self._admit(waiter.request_class, waiter.route)
+            waiter.future.set_result(None)
+
+
+def create_admission_controller() -> AdmissionController | None:
+    """Контроллер по настройкам; None, если ADMISSION_MAX_IN_FLIGHT не задан."""
+    if not settings.ADMISSION_MAX_IN_FLIGHT:
+        return None
+    return AdmissionController(
+        max_in_flight=settings.ADMISSION_MAX_IN_FLIGHT,
+        class_limits=settings.ADMISSION_CLASS_LIMITS,
+        max_queue=settings.ADMISSION_MAX_QUEUE,
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        route_limits=settings.ADMISSION_ROUTE_LIMITS,
+    )
+
+
+admission_controller = create_admission_controller()
@@ -0,0 +1,52 @@
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from itertools import count
+
+from core.config import settings
+
+logger = logging.getLogger("mirumir.board_versions")
+
+# Версии досок в памяти процесса: каждая запись в доску даёт новую версию,
+# поэтому результат, посчитанный до записи, не выдаётся пришедшим после неё.
+# Версии берутся из общего счётчика и никогда не повторяются. Хранится не
+# больше BOARD_VERSIONS_MAX_ENTRIES досок, дольше всех не менявшиеся
+# вытесняются
+_versions: OrderedDict[int, int] = OrderedDict()
+_counter = count(1)
+# Версия досок без записи. После вытеснения она сдвигается за все выданные
+# версии: вытесненная доска не может вернуться к версии, под которой уже
+# лежит её закэшированное содержимое
+_untracked_version = 0
+# Вызываются с board_id после каждого увеличения версии
+_change_hooks: list[Callable[[int], None]] = []
+
+
+def board_version(board_id: int) -> int:
+    return _versions.get(board_id, _untracked_version)
+
+
+def on_board_change(hook: Callable[[int], None]) -> Callable[[int], None]:
+    """
+    Регистрирует hook(board_id), который вызывается после каждой записи в
+    доску или её стикеры, — например, чтобы сбросить кэш доски.
+    Используется и как декоратор.
+    """
+    _change_hooks.append(hook)
+    return hook
+
+
+def bump_board_version(board_id: int) -> None:
+    """Вызывается после коммита любого изменения доски или её стикеров."""
+    global _untracked_version
+    _versions[board_id] = next(_counter)
+    _versions.move_to_end(board_id)
+    if len(_versions) > settings.BOARD_VERSIONS_MAX_ENTRIES:
+        _versions.popitem(last=False)
+        _untracked_version = next(_counter)
+    for hook in _change_hooks:
+        # Запись уже зафиксирована: сбой одного hook не должен ронять ответ
+        try:
+            hook(board_id)
+        except Exception:
+            logger.exception("Board change hook failed for board %s", board_id)
@@ -0,0 +1,53 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+from core.metrics import CACHE_LOOKUPS
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """
+    Кэш в памяти процесса: не больше max_entries значений, каждое живёт
+    ttl секунд.
+
+    При переполнении вытесняется значение, к которому дольше всех не
+    обращались. Попадания и промахи считаются в cache_lookups_total с
+    меткой cache=name. У каждого воркера свой кэш, поэтому изменения
+    видны в нём с задержкой до ttl.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        self._hits = CACHE_LOOKUPS.labels(name, "hit")
+        self._misses = CACHE_LOOKUPS.labels(name, "miss")
+
+    def get(self, key: Hashable) -> T | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self._misses.inc()
+            return None
+        self._entries.move_to_end(key)
+        self._hits.inc()
+        return entry[1]
+
+    def set(self, key: Hashable, value: T) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
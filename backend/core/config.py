@@ -11,10 +11,134 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "password"
     POSTGRES_DB: str = "dbname"
 
+    # Реплика для чтения (если не задана, чтение идёт с основной БД)
+    POSTGRES_REPLICA_HOST: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None
+    # Сколько секунд после записи пользователь читает с основной БД
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # Пул соединений с БД
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    # Сколько соединений открыть при старте (None = DB_POOL_SIZE)
+    DB_POOL_WARMUP: int | None = None
+    # Кэш подготовленных выражений asyncpg на одно соединение
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Работа через PgBouncer в режиме pool_mode=transaction
+    DB_PGBOUNCER_TRANSACTION_MODE: bool = False
+
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 365
 
+    # Допуск запросов: общий лимит одновременных (0 — без ограничений),
+    # лимиты классов interactive/default/heavy и отдельных маршрутов (имена —
+    # в core.admission.ROUTE_CLASSES), очередь и время ожидания в ней
+    ADMISSION_MAX_IN_FLIGHT: int = 200
+    ADMISSION_CLASS_LIMITS: dict[str, int] = {"heavy": 20}
+    ADMISSION_ROUTE_LIMITS: dict[str, int] = {"board_import": 5, "board_duplicate": 10}
+    ADMISSION_MAX_QUEUE: int = 500
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+
+    # Лимиты записи стикеров (корзины токенов): запросов в секунду и запас
+    # на всплеск — на пользователя и на доску. RATE_LIMIT_REDIS_URL включает
+    # общий для всех воркеров бэкенд вместо памяти процесса
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_USER_PER_SECOND: float = 20.0
+    RATE_LIMIT_USER_BURST: int = 40
+    RATE_LIMIT_BOARD_PER_SECOND: float = 50.0
+    RATE_LIMIT_BOARD_BURST: int = 100
+    RATE_LIMIT_REDIS_URL: str | None = None
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    # Подсказки логинов (GET /users/lookup) — на пользователя
+    RATE_LIMIT_LOOKUP_PER_SECOND: float = 5.0
+    RATE_LIMIT_LOOKUP_BURST: int = 20
+
+    # Подсказки логинов: сколько отдавать не больше, сколько частых префиксов
+    # держать в памяти процесса и сколько секунд
+    USER_LOOKUP_MAX_RESULTS: int = 20
+    USER_LOOKUP_CACHE_MAX_ENTRIES: int = 10_000
+    USER_LOOKUP_CACHE_TTL_SECONDS: float = 30.0
+
+    # Ссылки на доску (подписанные токены): срок действия по умолчанию и
+    # наибольший; как часто подтягивать отозванные ссылки из БД; сколько
+    # секунд ответ по ссылке кэшируют клиенты и прокси и живёт общий снимок
+    # доски в памяти процесса
+    SHARE_LINK_DEFAULT_TTL_SECONDS: int = 7 * 24 * 60 * 60
+    SHARE_LINK_MAX_TTL_SECONDS: int = 90 * 24 * 60 * 60
+    SHARE_LINK_DENYLIST_REFRESH_SECONDS: float = 10.0
+    SHARE_LINK_CACHE_MAX_AGE_SECONDS: int = 30
+    SHARE_LINK_SNAPSHOT_MAX_ENTRIES: int = 1000
+    SHARE_LINK_SNAPSHOT_TTL_SECONDS: float = 5.0
+
+    # Публичные доски без входа: сколько секунд ответ свежий для клиентов и
+    # прокси, сколько ещё его можно отдавать устаревшим, пока прокси сходит
+    # за новым; сколько готовых тел держать в памяти процесса и сколько
+    # секунд (в других воркерах запись в доску видна не позже чем через ttl)
+    PUBLIC_BOARD_MAX_AGE_SECONDS: int = 10
+    PUBLIC_BOARD_STALE_WHILE_REVALIDATE_SECONDS: int = 60
+    PUBLIC_BOARD_CACHE_MAX_ENTRIES: int = 1000
+    PUBLIC_BOARD_CACHE_TTL_SECONDS: float = 10.0
+
+    # Версии досок в памяти процесса (ключ кэшей содержимого досок): сколько
+    # досок помнить; вытеснение сбрасывает кэши досок без версии
+    BOARD_VERSIONS_MAX_ENTRIES: int = 100_000
+
+    # Idempotency-Key для создания досок и стикеров: сколько ответов хранить
+    # в памяти процесса и сколько секунд
+    IDEMPOTENCY_MAX_ENTRIES: int = 10_000
+    IDEMPOTENCY_TTL_SECONDS: float = 24 * 60 * 60
+
+    # Фоновые задачи (таблица jobs): сколько выполнять одновременно, как часто
+    # опрашивать очередь, через сколько секунд без heartbeat задача считается
+    # брошенной упавшим процессом и как часто выполняющаяся задача его
+    # обновляет (заметно чаще JOB_STALE_SECONDS), сколько попыток давать
+    JOB_MAX_CONCURRENCY: int = 2
+    JOB_POLL_INTERVAL_SECONDS: float = 5.0
+    JOB_STALE_SECONDS: float = 60.0
+    JOB_HEARTBEAT_INTERVAL_SECONDS: float = 15.0
+    JOB_MAX_ATTEMPTS: int = 3
+    # Стикеров в одной транзакции при удалении и при фоновом копировании доски
+    JOB_DELETE_CHUNK_SIZE: int = 5000
+    JOB_COPY_CHUNK_SIZE: int = 5000
+    # Копия доски с большим числом стикеров делается фоновой задачей
+    BOARD_DUPLICATE_SYNC_MAX_STICKERS: int = 2000
+
+    # Импорт доски: стикеров в пачке проверки и COPY, предел длины одной
+    # записи и числа стикеров в файле
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_MAX_ITEM_BYTES: int = 64 * 1024
+    IMPORT_MAX_STICKERS: int = 100_000
+
+    # Потоков для bcrypt: хеширование не блокирует цикл событий
+    BCRYPT_MAX_WORKERS: int = 4
+
+    # Логины администраторов (JSON-список в переменной окружения)
+    ADMIN_LOGINS: list[str] = []
+
+    # Журнал медленных запросов (None — выключен)
+    SLOW_QUERY_THRESHOLD_MS: float | None = 500.0
+    SLOW_QUERY_LOG_FILE: str = "logs/slow_queries.log"
+    SLOW_QUERY_LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    SLOW_QUERY_LOG_BACKUP_COUNT: int = 5
+    SLOW_QUERY_EXPLAIN: bool = True
+
+    # Профилирование запросов по заголовку X-Profile (только ADMIN_LOGINS)
+    PROFILE_DIR: str = "profiles"
+    PROFILE_SAMPLE_INTERVAL_MS: float = 5.0
+    PROFILE_MAX_SECONDS: float = 30.0
+    PROFILE_MAX_PER_MINUTE: int = 10
+    PROFILE_MAX_CONCURRENT: int = 2
+    PROFILE_KEEP_FILES: int = 100
+
+    # Live-обновления досок
+    LIVE_QUEUE_SIZE: int = 256
+    LIVE_SEND_TIMEOUT_SECONDS: float = 10.0
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -30,5 +154,16 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def REPLICA_DATABASE_URL(self) -> str | None:
+        """Собирает URL реплики; учётные данные и имя БД совпадают с основной."""
+        if not self.POSTGRES_REPLICA_HOST:
+            return None
+        port = self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{self.POSTGRES_REPLICA_HOST}:{port}/{self.POSTGRES_DB}"
+        )
+
 
 settings = Settings()
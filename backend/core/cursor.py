@@ -0,0 +1,31 @@
+import base64
+import json
+from typing import Any
+
+
+class InvalidCursorError(ValueError):
+    """Курсор пагинации повреждён или выдан другим эндпоинтом."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Непрозрачный курсор keyset-пагинации из значений ключа сортировки
+    последней строки страницы.
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    """Значения курсора, приведённые к types; ошибка — InvalidCursorError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise InvalidCursorError("Некорректный курсор") from exc
+    if not isinstance(values, list) or len(values) != len(types):
+        raise InvalidCursorError("Некорректный курсор")
+    try:
+        return tuple(type_(value) for type_, value in zip(types, values))
+    except (TypeError, ValueError) as exc:
+        raise InvalidCursorError("Некорректный курсор") from exc
@@ -1,22 +1,179 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+import asyncio
+import time
+from contextvars import ContextVar
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    create_async_engine,
+    AsyncSession,
+    async_sessionmaker,
+)
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from core.config import settings
+from core.metrics import Counter, Gauge, Histogram
+from core.query_stats import instrument_engine
+
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Время получения соединения из пула",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total", "Запросов, не дождавшихся соединения из пула"
+)
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    future=True,
+
+# Базовый _do_get при переполнении вызывает self._do_get повторно; замер
+# ведёт только внешний вызов. ContextVar, а не threading.local: ожидание
+# соединения отдаёт управление циклу, и в тот же поток заходят другие задачи
+_pool_checkout_active: ContextVar[bool] = ContextVar(
+    "pool_checkout_active", default=False
 )
 
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, замеряющий время ожидания свободного соединения."""
+
+    def _do_get(self):
+        if _pool_checkout_active.get():
+            return super()._do_get()
+        token = _pool_checkout_active.set(True)
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
+            _pool_checkout_active.reset(token)
+
+
+def _connect_args() -> dict:
+    """Параметры asyncpg для обычного подключения или подключения через PgBouncer."""
+    if settings.DB_PGBOUNCER_TRANSACTION_MODE:
+        # В transaction pooling подготовленные выражения не переживают
+        # транзакцию, а имена могут совпасть на одном серверном соединении
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=_connect_args(),
+    )
+
+
+class PrimarySession(Session):
+    """Сессия основной БД: после коммита запоминает, что пользователь писал."""
+
+
+engine = _create_engine(settings.DATABASE_URL)
+instrument_engine(engine.sync_engine)
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=PrimarySession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+# Необязательная реплика для эндпоинтов, которые только читают
+read_engine: AsyncEngine | None = None
+if settings.REPLICA_DATABASE_URL:
+    read_engine = _create_engine(settings.REPLICA_DATABASE_URL)
+    instrument_engine(read_engine.sync_engine)
+
+ReadSessionLocal = async_sessionmaker(
+    read_engine or engine,
+    class_=AsyncSession,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
 )
 
 
+def session_target(session: AsyncSession) -> str:
+    """
+    Откуда читает сессия: "replica" или "primary". Часть ключей общих
+    загрузок: недавно писавший читает с основной БД и не должен получить
+    результат, загруженный с отстающей реплики.
+    """
+    if read_engine is not None and session.bind is read_engine:
+        return "replica"
+    return "primary"
+
+
+# user_id -> момент (time.monotonic), до которого пользователь читает с основной БД
+_recent_writers: dict[int, float] = {}
+_RECENT_WRITERS_PRUNE_SIZE = 10_000
+
+
+def mark_recent_write(user_id: int) -> None:
+    """Отмечает запись пользователя: его чтения временно идут на основную БД."""
+    now = time.monotonic()
+    if len(_recent_writers) >= _RECENT_WRITERS_PRUNE_SIZE:
+        for expired in [uid for uid, until in _recent_writers.items() if until <= now]:
+            del _recent_writers[expired]
+    _recent_writers[user_id] = now + settings.READ_YOUR_WRITES_SECONDS
+
+
+def wrote_recently(user_id: int) -> bool:
+    """Писал ли пользователь в основную БД в пределах READ_YOUR_WRITES_SECONDS."""
+    until = _recent_writers.get(user_id)
+    if until is None:
+        return False
+    if until <= time.monotonic():
+        _recent_writers.pop(user_id, None)
+        return False
+    return True
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _remember_writer(session: Session) -> None:
+    user_id = session.info.get("user_id")
+    if user_id is not None:
+        mark_recent_write(user_id)
+
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Соединений, выданных из пула",
+    callback=lambda: engine.pool.checkedout(),
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Соединений сверх pool_size",
+    callback=lambda: max(engine.pool.overflow(), 0),
+)
+
+
+async def warm_up_pool(db_engine: AsyncEngine, size: int) -> None:
+    """Заранее открывает size соединений, чтобы первые запросы не ждали подключения."""
+    connections = await asyncio.gather(*(db_engine.connect() for _ in range(size)))
+    for connection in connections:
+        await connection.close()
+
+
 class Base(DeclarativeBase):
     pass
@@ -0,0 +1,65 @@
+import gzip
+import hashlib
+from dataclasses import dataclass
+
+# Сжатие заранее, один раз на версию тела: уровень важнее скорости
+GZIP_LEVEL = 9
+
+
+@dataclass(frozen=True, slots=True)
+class CachedBody:
+    """
+    Готовое к отдаче тело ответа в двух представлениях: как есть и в gzip.
+
+    У представлений разные сильные ETag: они различаются побайтно, и прокси
+    не должен отдать сжатое тело клиенту, который прислал ETag несжатого.
+    """
+
+    body: bytes
+    etag: str
+    gzip_body: bytes
+    gzip_etag: str
+
+    @classmethod
+    def render(cls, body: bytes) -> "CachedBody":
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        # mtime=0: одно и то же тело сжимается в одни и те же байты
+        return cls(
+            body=body,
+            etag=f'"{digest}"',
+            gzip_body=gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+            gzip_etag=f'"{digest}-gzip"',
+        )
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Разрешает ли Accept-Encoding ответ в gzip (gzip или * без q=0)."""
+    if not accept_encoding:
+        return False
+    allowed: dict[str, bool] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        allowed[coding.strip().lower()] = quality > 0
+    if "gzip" in allowed:
+        return allowed["gzip"]
+    return allowed.get("*", False)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Совпадает ли If-None-Match с etag (слабое сравнение, RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,120 @@
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from core.config import settings
+from core.metrics import Counter
+
+# POST-маршруты, повтор которых создаёт дубликат: создание доски, стикера
+# и копии доски
+IDEMPOTENT_PATHS = (
+    re.compile(r"^/api/v1/boards/?$"),
+    re.compile(r"^/api/v1/boards/\d+/stickers$"),
+    re.compile(r"^/api/v1/boards/\d+/duplicate$"),
+)
+MAX_KEY_LENGTH = 255
+# Заголовки, которые описывают сам ответ и повторяются при воспроизведении.
+# Остальные (CORS, Server-Timing, X-RateLimit-*, ...) относятся к одному
+# запросу — их заново выставляют middleware и зависимости повтора
+REPLAYED_HEADERS = frozenset(
+    {
+        b"content-type",
+        b"content-encoding",
+        b"location",
+        b"etag",
+        b"cache-control",
+    }
+)
+
+IDEMPOTENCY_REQUESTS = Counter(
+    "idempotency_requests_total",
+    "Запросов с Idempotency-Key по исходу",
+    labelnames=("result",),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+
+class IdempotencyEntry:
+    """
+    Запись ключа: отпечаток тела запроса и future с ответом оригинала.
+
+    Пока оригинал выполняется, повторы ждут future; результат None значит,
+    что оригинал не завершился успешно и ключ свободен для новой попытки.
+    """
+
+    __slots__ = ("expires_at", "fingerprint", "future")
+
+    def __init__(self, fingerprint: bytes, future: asyncio.Future) -> None:
+        self.fingerprint = fingerprint
+        self.future = future
+        self.expires_at = float("inf")
+
+
+class IdempotencyStore:
+    """
+    Ответы на запросы с Idempotency-Key в памяти процесса.
+
+    Хранится не больше max_entries записей: при переполнении вытесняется
+    самая старая завершённая. Запись выполняющегося оригинала не
+    вытесняется — иначе его повтор выполнился бы заново и создал дубликат.
+    Сохранённый ответ живёт ttl секунд. Ключи разных пользователей и
+    маршрутов не пересекаются — это часть ключа записи.
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, IdempotencyEntry] = OrderedDict()
+
+    def get(self, key: tuple) -> IdempotencyEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry
+
+    def start(self, key: tuple, fingerprint: bytes) -> IdempotencyEntry | None:
+        """
+        Регистрирует выполняющийся оригинал запроса.
+
+        None — хранилище занято выполняющимися оригиналами и места нет.
+        """
+        if len(self._entries) >= self.max_entries and not self._evict():
+            return None
+        entry = IdempotencyEntry(
+            fingerprint, asyncio.get_running_loop().create_future()
+        )
+        self._entries[key] = entry
+        return entry
+
+    def _evict(self) -> bool:
+        """Вытесняет самую старую завершённую запись."""
+        for key, entry in self._entries.items():
+            if entry.future.done():
+                del self._entries[key]
+                return True
+        return False
+
+    def finish(
+        self, key: tuple, entry: IdempotencyEntry, response: StoredResponse | None
+    ) -> None:
+        """Сохраняет ответ оригинала (None — не сохранять) и будит повторы."""
+        if response is None:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+        else:
+            entry.expires_at = time.monotonic() + self.ttl
+        entry.future.set_result(response)
+
+
+idempotency_store = IdempotencyStore(
+    settings.IDEMPOTENCY_MAX_ENTRIES, settings.IDEMPOTENCY_TTL_SECONDS
+)
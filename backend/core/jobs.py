@@ -0,0 +1,339 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.config import settings
+from core.database import AsyncSessionLocal
+from core.metrics import Counter, Gauge, Histogram
+from models.job import Job, JobStatus
+
+logger = logging.getLogger("mirumir.jobs")
+
+JOBS_RUNNING = Gauge("jobs_running", "Фоновых задач, выполняющихся в процессе")
+JOBS_FINISHED = Counter(
+    "jobs_finished_total",
+    "Завершённых попыток фоновых задач",
+    labelnames=("kind", "status"),
+)
+JOB_DURATION_SECONDS = Histogram(
+    "job_duration_seconds",
+    "Длительность попытки фоновой задачи",
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0),
+    labelnames=("kind",),
+)
+
+
+class JobContext:
+    """
+    Окружение обработчика задачи.
+
+    Обработчик работает порциями, каждая — в своей короткой транзакции
+    (session()). Вместе с порцией он сохраняет прогресс и checkpoint через
+    report(db, ...): после перезапуска задача продолжится с последней
+    закоммиченной порции, поэтому обработчики должны быть идемпотентны.
+    """
+
+    def __init__(
+        self,
+        job_id: int,
+        params: dict[str, Any],
+        checkpoint: dict[str, Any] | None,
+        progress_done: int,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        self.job_id = job_id
+        self.params = params
+        self.checkpoint = checkpoint or {}
+        self.progress_done = progress_done
+        self.session = session_factory
+
+    async def report(
+        self,
+        db: AsyncSession,
+        done: int,
+        total: int | None = None,
+        checkpoint: dict[str, Any] | None = None,
+    ) -> None:
+        """Записывает прогресс в транзакции db; виден после её коммита."""
+        values: dict[str, Any] = {"progress_done": done, "heartbeat_at": func.now()}
+        if total is not None:
+            values["progress_total"] = total
+        if checkpoint is not None:
+            values["checkpoint"] = checkpoint
+            self.checkpoint = checkpoint
+        await db.execute(update(Job).where(Job.job_id == self.job_id).values(**values))
+        self.progress_done = done
+
+
+JobHandler = Callable[[JobContext], Awaitable[dict[str, Any] | None]]
+JobFailureHandler = Callable[[JobContext, AsyncSession], Awaitable[None]]
+
+_handlers: dict[str, JobHandler] = {}
+_failure_handlers: dict[str, JobFailureHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Регистрирует обработчик задач вида kind; результат сохраняется в Job.result."""
+
+    def register(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        return handler
+
+    return register
+
+
+def job_failure_handler(kind: str) -> Callable[[JobFailureHandler], JobFailureHandler]:
+    """
+    Регистрирует уборку за задачей вида kind, исчерпавшей попытки.
+
+    Вызывается с контекстом последней попытки (checkpoint — последний
+    сохранённый) и новой сессией, которую исполнитель затем коммитит.
+    """
+
+    def register(handler: JobFailureHandler) -> JobFailureHandler:
+        _failure_handlers[kind] = handler
+        return handler
+
+    return register
+
+
+def enqueue_job(
+    db: AsyncSession,
+    kind: str,
+    params: dict[str, Any],
+    created_by: int | None = None,
+) -> Job:
+    """
+    Добавляет задачу в сессию запроса.
+
+    Задача сохраняется вместе с остальными изменениями запроса одним
+    коммитом; после коммита вызовите job_runner.wake(), чтобы не ждать
+    следующего опроса очереди.
+    """
+    if kind not in _handlers:
+        raise ValueError(f"Unknown job kind: {kind}")
+    job = Job(kind=kind, params=params, status=JobStatus.QUEUED, created_by=created_by)
+    db.add(job)
+    return job
+
+
+class JobRunner:
+    """
+    Исполнитель фоновых задач из таблицы jobs внутри процесса.
+
+    Одновременно выполняется не больше concurrency задач. Задачи забираются
+    через SELECT ... FOR UPDATE SKIP LOCKED, поэтому несколько воркеров
+    не возьмут одну задачу дважды. Пока задача выполняется, фоновый
+    heartbeat обновляет heartbeat_at раз в JOB_HEARTBEAT_INTERVAL_SECONDS,
+    даже если шаг обработчика длится дольше JOB_STALE_SECONDS. Задача, чей
+    heartbeat_at старше JOB_STALE_SECONDS (процесс упал), снова считается
+    ждущей. Неудачная попытка повторяется, пока не исчерпано JOB_MAX_ATTEMPTS.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        concurrency: int = settings.JOB_MAX_CONCURRENCY,
+        poll_interval: float = settings.JOB_POLL_INTERVAL_SECONDS,
+        heartbeat_interval: float = settings.JOB_HEARTBEAT_INTERVAL_SECONDS,
+    ) -> None:
+        self.session_factory = session_factory
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._loop_task: asyncio.Task | None = None
+        self.heartbeat_interval = heartbeat_interval
+        self._running: dict[int, asyncio.Task] = {}
+
+    def start(self) -> None:
+        self._loop_task = asyncio.create_task(self._run_loop(), name="job-runner")
+
+    def wake(self) -> None:
+        """Будит цикл после постановки задачи в очередь."""
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        """Прерывает задачи и возвращает их в очередь для следующего запуска."""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
+        interrupted = list(self._running)
+        for task in self._running.values():
+            task.cancel()
+        await asyncio.gather(*self._running.values(), return_exceptions=True)
+        if interrupted:
+            async with self.session_factory() as db:
+                await db.execute(
+                    update(Job)
+                    .where(Job.job_id.in_(interrupted), Job.status == JobStatus.RUNNING)
+                    .values(status=JobStatus.QUEUED)
+                )
+                await db.commit()
+
+    async def _run_loop(self) -> None:
+        while True:
+            self._wakeup.clear()
+            free = self.concurrency - len(self._running)
+            if free > 0:
+                try:
+                    jobs = await self._claim(free)
+                except Exception:
+                    logger.exception("Failed to claim jobs")
+                    jobs = []
+                for job in jobs:
+                    task = asyncio.create_task(self._execute(job))
+                    self._running[job.job_id] = task
+                    task.add_done_callback(
+                        lambda _, job_id=job.job_id: self._finished(job_id)
+                    )
+            # Завершение задачи тоже будит цикл: освободившийся слот сразу
+            # получает следующую задачу из очереди
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except TimeoutError:
+                pass
+
+    def _finished(self, job_id: int) -> None:
+        self._running.pop(job_id, None)
+        self._wakeup.set()
+
+    async def _claim(self, limit: int) -> list[Job]:
+        stale_before = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.JOB_STALE_SECONDS
+        )
+        candidates = (
+            select(Job.job_id)
+            .where(
+                or_(
+                    Job.status == JobStatus.QUEUED,
+                    and_(
+                        Job.status == JobStatus.RUNNING,
+                        Job.heartbeat_at < stale_before,
+                    ),
+                )
+            )
+            .order_by(Job.job_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if self._running:
+            # Свои задачи не перехватываем, даже если heartbeat отстал
+            candidates = candidates.where(Job.job_id.not_in(list(self._running)))
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(Job)
+                .where(Job.job_id.in_(candidates.scalar_subquery()))
+                .values(
+                    status=JobStatus.RUNNING,
+                    attempts=Job.attempts + 1,
+                    started_at=func.coalesce(Job.started_at, func.now()),
+                    heartbeat_at=func.now(),
+                )
+                .returning(Job)
+            )
+            jobs = list(result.scalars().all())
+            await db.commit()
+        return sorted(jobs, key=lambda job: job.job_id)
+
+    async def run_pending(self) -> int:
+        """Выполняет ждущие задачи по одной, пока очередь не опустеет."""
+        completed = 0
+        while jobs := await self._claim(1):
+            await self._execute(jobs[0])
+            completed += 1
+        return completed
+
+    async def _execute(self, job: Job) -> None:
+        handler = _handlers.get(job.kind)
+        context = JobContext(
+            job.job_id,
+            job.params,
+            job.checkpoint,
+            job.progress_done,
+            self.session_factory,
+        )
+        JOBS_RUNNING.inc()
+        started = time.perf_counter()
+        heartbeat = asyncio.create_task(
+            self._heartbeat(job.job_id), name=f"job-heartbeat-{job.job_id}"
+        )
+        try:
+            if handler is None:
+                raise LookupError(f"No handler for job kind {job.kind}")
+            result = await handler(context)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed", job.job_id, job.kind)
+            retry = handler is not None and job.attempts < settings.JOB_MAX_ATTEMPTS
+            status = JobStatus.QUEUED if retry else JobStatus.FAILED
+            await self._finish(job.job_id, status, error=f"{type(exc).__name__}: {exc}")
+            JOBS_FINISHED.labels(job.kind, "retry" if retry else "failed").inc()
+            if not retry:
+                await self._clean_up_failed(job, context)
+        else:
+            await self._finish(job.job_id, JobStatus.SUCCEEDED, result=result)
+            JOBS_FINISHED.labels(job.kind, "succeeded").inc()
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            JOBS_RUNNING.dec()
+            JOB_DURATION_SECONDS.labels(job.kind).observe(time.perf_counter() - started)
+
+    async def _clean_up_failed(self, job: Job, context: JobContext) -> None:
+        """Убирает то, что окончательно упавшая задача успела создать."""
+        cleanup = _failure_handlers.get(job.kind)
+        if cleanup is None:
+            return
+        try:
+            async with self.session_factory() as db:
+                await cleanup(context, db)
+                await db.commit()
+        except Exception:
+            logger.exception("Failed to clean up after job %s", job.job_id)
+        # Уборка могла поставить свои задачи
+        self.wake()
+
+    async def _heartbeat(self, job_id: int) -> None:
+        """
+        Обновляет heartbeat_at, пока задача выполняется: долгий шаг
+        обработчика без report() не делает её брошенной. Пишет только в
+        статусе running, поэтому не спорит с завершением задачи.
+        """
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                async with self.session_factory() as db:
+                    await db.execute(
+                        update(Job)
+                        .where(Job.job_id == job_id, Job.status == JobStatus.RUNNING)
+                        .values(heartbeat_at=func.now())
+                    )
+                    await db.commit()
+            except Exception:
+                logger.exception("Failed to heartbeat job %s", job_id)
+
+    async def _finish(
+        self,
+        job_id: int,
+        status: JobStatus,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        values: dict[str, Any] = {"status": status, "error": error}
+        if status != JobStatus.QUEUED:
+            values["finished_at"] = func.now()
+            values["result"] = result
+        async with self.session_factory() as db:
+            await db.execute(update(Job).where(Job.job_id == job_id).values(**values))
+            await db.commit()
+
+
+job_runner = JobRunner()
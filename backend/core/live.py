@@ -0,0 +1,125 @@
+import asyncio
+import json
+from collections import defaultdict
+
+from core.config import settings
+from core.metrics import Counter, Gauge
+
+# Кадр, который получает отстающий клиент вместо выброшенных изменений:
+# он должен заново загрузить доску целиком (GET /boards/{board_id}).
+RESYNC_FRAME = json.dumps({"type": "resync", "reason": "slow_consumer"})
+
+
+class Subscriber:
+    """Подписчик live-обновлений доски с ограниченной очередью отправки."""
+
+    def __init__(self, board_id: int, maxsize: int) -> None:
+        self.board_id = board_id
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=maxsize)
+
+    def offer(self, frame: str) -> None:
+        """
+        Кладёт кадр в очередь, никогда не блокируя публикующего.
+
+        Если очередь переполнена, все накопленные изменения выбрасываются
+        и заменяются одним кадром resync.
+        """
+        try:
+            self.queue.put_nowait(frame)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        dropped = 1
+        while True:
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            dropped += 1
+
+        self.queue.put_nowait(RESYNC_FRAME)
+        LIVE_FRAMES_DROPPED.inc(dropped)
+        LIVE_RESYNCS.inc()
+
+
+class BoardHub:
+    """
+    Рассылка изменений досок подключённым клиентам.
+
+    Хаб живёт в памяти процесса: клиенты, подключённые к другому воркеру,
+    получают только изменения, сделанные через этот воркер.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[Subscriber]] = defaultdict(set)
+
+    def subscribe(self, board_id: int) -> Subscriber:
+        subscriber = Subscriber(board_id, self.queue_size)
+        self._subscribers[board_id].add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        subscribers = self._subscribers.get(subscriber.board_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscriber)
+        if not subscribers:
+            del self._subscribers[subscriber.board_id]
+
+    def publish(self, board_id: int, event: dict) -> None:
+        """Рассылает событие всем подписчикам доски (сериализуется один раз)."""
+        subscribers = self._subscribers.get(board_id)
+        if not subscribers:
+            return
+
+        frame = json.dumps(event, ensure_ascii=False)
+        for subscriber in subscribers:
+            subscriber.offer(frame)
+
+    def connection_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def queued_frames(self) -> int:
+        return sum(
+            subscriber.queue.qsize()
+            for subscribers in self._subscribers.values()
+            for subscriber in subscribers
+        )
+
+    def max_queue_depth(self) -> int:
+        return max(
+            (
+                subscriber.queue.qsize()
+                for subscribers in self._subscribers.values()
+                for subscriber in subscribers
+            ),
+            default=0,
+        )
+
+
+live_hub = BoardHub(queue_size=settings.LIVE_QUEUE_SIZE)
+
+LIVE_CONNECTIONS = Gauge(
+    "live_connections",
+    "Количество открытых live-подключений",
+    callback=live_hub.connection_count,
+)
+LIVE_QUEUED_FRAMES = Gauge(
+    "live_queued_frames",
+    "Суммарное число кадров в очередях отправки",
+    callback=live_hub.queued_frames,
+)
+LIVE_MAX_QUEUE_DEPTH = Gauge(
+    "live_max_queue_depth",
+    "Глубина самой длинной очереди отправки",
+    callback=live_hub.max_queue_depth,
+)
+LIVE_FRAMES_SENT = Counter("live_frames_sent_total", "Отправлено кадров клиентам")
+LIVE_FRAMES_DROPPED = Counter(
+    "live_frames_dropped_total", "Выброшено кадров из-за медленных клиентов"
+)
+LIVE_RESYNCS = Counter(
+    "live_resyncs_total", "Клиентов, переведённых на полную перезагрузку доски"
+)
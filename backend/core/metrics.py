@@ -0,0 +1,228 @@
+import math
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from typing import Self
+
+# Тип содержимого текстового формата Prometheus
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Metric:
+    """
+    Базовый класс метрики процесса.
+
+    Метрика с labelnames сама значений не хранит: labels(...) возвращает
+    дочернюю метрику для набора значений меток. Дочерняя создаётся при
+    первом обращении и дальше берётся из словаря, поэтому на горячем пути
+    остаются поиск по ключу и сложение без блокировок — всё выполняется
+    в потоке цикла событий.
+    """
+
+    kind = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Self] = {}
+        REGISTRY.append(self)
+
+    def labels(self, *values: str) -> Self:
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {values}"
+                )
+            child = object.__new__(type(self))
+            child._init_child(self)
+            self._children[values] = child
+        return child
+
+    def _init_child(self, parent: Self) -> None:
+        raise NotImplementedError
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        """Строки выдачи: (суффикс имени, метки в формате {..}, значение)."""
+        raise NotImplementedError
+
+    def collect(self) -> Iterator[tuple[str, str, float]]:
+        if not self.labelnames:
+            yield from self.samples()
+            return
+        for values, child in self._children.items():
+            labels = _format_labels(self.labelnames, values)
+            for suffix, extra, value in child.samples():
+                if extra:
+                    yield suffix, f"{labels[:-1]},{extra[1:]}", value
+                else:
+                    yield suffix, labels, value
+
+
+class Counter(Metric):
+    """Монотонно растущий счётчик."""
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.value = 0.0
+
+    def _init_child(self, parent: "Counter") -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        yield "", "", self.value
+
+
+class Gauge(Metric):
+    """
+    Текущее значение величины.
+
+    Если передан callback, значение вычисляется в момент чтения,
+    а не поддерживается на горячем пути.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], float] | None = None,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.value = 0.0
+        self._callback = callback
+
+    def _init_child(self, parent: "Gauge") -> None:
+        self.value = 0.0
+        self._callback = None
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def get(self) -> float:
+        if self._callback is not None:
+            return float(self._callback())
+        return self.value
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        yield "", "", self.get()
+
+
+class Histogram(Metric):
+    """
+    Распределение значений по заранее заданным корзинам.
+
+    Счётчики корзин выделяются один раз при создании, observe только
+    находит корзину двоичным поиском и увеличивает её счётчик.
+    """
+
+    kind = "histogram"
+
+    DEFAULT_BUCKETS = (
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Последняя ячейка — корзина +Inf
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def _init_child(self, parent: "Histogram") -> None:
+        self.buckets = parent.buckets
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        cumulative = 0
+        for bound, count in zip((*self.buckets, math.inf), self.counts):
+            cumulative += count
+            yield "_bucket", f'{{le="{_format_value(bound)}"}}', cumulative
+        yield "_sum", "", self.sum
+        yield "_count", "", self.count
+
+
+REGISTRY: list[Metric] = []
+
+# Общий счётчик для кэшей процесса: доля попаданий — result="hit" к сумме
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total", "Обращения к кэшам процесса", labelnames=("cache", "result")
+)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_text(registry: Sequence[Metric] = REGISTRY) -> str:
+    """Выдача всех метрик в текстовом формате Prometheus 0.0.4."""
+    lines = []
+    for metric in registry:
+        documentation = metric.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+        lines.append(f"# HELP {metric.name} {documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for suffix, labels, value in metric.collect():
+            lines.append(f"{metric.name}{suffix}{labels} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
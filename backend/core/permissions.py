@@ -0,0 +1,119 @@
+from collections.abc import Collection
+
+from sqlalchemy import Select, delete, exists, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import CTE
+
+from models.access import Access
+from models.effective_permission import EffectivePermission
+from models.group import GroupAccess, GroupMember, GroupNesting
+
+# Ключ pg_advisory_xact_lock, под которым пересчитываются effective_permissions
+EFFECTIVE_PERMISSIONS_LOCK = 0x6D69_7275_6D69_7201
+
+UserIds = Collection[int] | Select
+
+
+async def lock_effective_permissions(db: AsyncSession) -> None:
+    """
+    Берёт блокировку пересчёта прав до конца транзакции. Повторный вызов
+    в той же транзакции не ждёт.
+    """
+    await db.execute(select(func.pg_advisory_xact_lock(EFFECTIVE_PERMISSIONS_LOCK)))
+
+
+def group_descendants(group_id: int) -> CTE:
+    """Группа и все вложенные в неё группы на любой глубине (столбец group_id)."""
+    tree = select(literal(group_id).label("group_id")).cte(
+        "group_descendants", recursive=True
+    )
+    return tree.union(
+        select(GroupNesting.child_group_id).join(
+            tree, GroupNesting.parent_group_id == tree.c.group_id
+        )
+    )
+
+
+def group_user_ids(group_id: int) -> Select:
+    """ID участников группы, включая участников вложенных групп."""
+    descendants = group_descendants(group_id)
+    return select(GroupMember.user_id).where(
+        GroupMember.group_id.in_(select(descendants.c.group_id))
+    )
+
+
+def _granted_permissions(user_ids: UserIds, board_ids: Collection[int] | None):
+    """
+    Итоговые права пользователей user_ids: максимум по прямым доступам и
+    доступам групп, в которые пользователь входит напрямую или через
+    вложенные группы. Уровни enum упорядочены owner < view < edit.
+    """
+    memberships = (
+        select(GroupMember.user_id, GroupMember.group_id)
+        .where(GroupMember.user_id.in_(user_ids))
+        .cte("memberships", recursive=True)
+    )
+    # UNION, а не UNION ALL: повторная пара (пользователь, группа) не
+    # порождает новых строк, и рекурсия конечна при любой структуре групп
+    memberships = memberships.union(
+        select(memberships.c.user_id, GroupNesting.parent_group_id).join(
+            GroupNesting, GroupNesting.child_group_id == memberships.c.group_id
+        )
+    )
+    direct = select(Access.user_id, Access.board_id, Access.permission).where(
+        Access.user_id.in_(user_ids)
+    )
+    via_groups = select(
+        memberships.c.user_id, GroupAccess.board_id, GroupAccess.permission
+    ).join(GroupAccess, GroupAccess.group_id == memberships.c.group_id)
+    if board_ids is not None:
+        direct = direct.where(Access.board_id.in_(board_ids))
+        via_groups = via_groups.where(GroupAccess.board_id.in_(board_ids))
+
+    grants = union_all(direct, via_groups).subquery("grants")
+    return select(
+        grants.c.user_id,
+        grants.c.board_id,
+        func.max(grants.c.permission).label("permission"),
+    ).group_by(grants.c.user_id, grants.c.board_id)
+
+
+async def refresh_effective_permissions(
+    db: AsyncSession,
+    user_ids: UserIds,
+    board_ids: Collection[int] | None = None,
+) -> None:
+    """
+    Пересчитывает effective_permissions для пользователей user_ids (всех
+    их досок или только board_ids). Вызывается в той же транзакции, что
+    и изменение доступов или групп, после него.
+
+    Пересчёты идут по одному под транзакционной advisory-блокировкой:
+    следующий начинается после фиксации предыдущего и видит его
+    изменения, поэтому одновременные правки не оставляют устаревших прав.
+    Строки, где уровень не изменился, не перезаписываются.
+    """
+    await lock_effective_permissions(db)
+
+    granted = _granted_permissions(user_ids, board_ids).cte("granted")
+    stale = delete(EffectivePermission).where(
+        EffectivePermission.user_id.in_(user_ids),
+        ~exists().where(
+            granted.c.user_id == EffectivePermission.user_id,
+            granted.c.board_id == EffectivePermission.board_id,
+        ),
+    )
+    if board_ids is not None:
+        stale = stale.where(EffectivePermission.board_id.in_(board_ids))
+
+    # Удаление и запись — один оператор: они затрагивают разные строки
+    upsert = insert(EffectivePermission).from_select(
+        ["user_id", "board_id", "permission"], select(granted)
+    )
+    upsert = upsert.on_conflict_do_update(
+        index_elements=["user_id", "board_id"],
+        set_={"permission": upsert.excluded.permission},
+        where=EffectivePermission.permission != upsert.excluded.permission,
+    )
+    await db.execute(upsert.add_cte(stale.cte("stale")))
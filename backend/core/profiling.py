@@ -0,0 +1,239 @@
+import asyncio
+import json
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from datetime import datetime, timezone
+from pathlib import Path
+from types import CodeType, FrameType
+
+from core.config import settings
+
+try:
+    import greenlet
+except ImportError:  # greenlet ставится вместе с sqlalchemy[asyncio]
+    greenlet = None
+
+PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+
+# Корень проекта — для коротких путей в именах кадров
+_BACKEND_ROOT = str(Path(__file__).resolve().parent.parent) + "/"
+_frame_labels: dict[CodeType, str] = {}
+
+
+def _frame_label(code: CodeType) -> str:
+    label = _frame_labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        if filename.startswith(_BACKEND_ROOT):
+            filename = filename[len(_BACKEND_ROOT) :]
+        elif "site-packages/" in filename:
+            filename = filename.split("site-packages/", 1)[1]
+        label = f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+        # ; — разделитель кадров в collapsed-формате
+        label = label.replace(";", ":")
+        _frame_labels[code] = label
+    return label
+
+
+def _coroutine_chain(task: asyncio.Task) -> tuple[list[FrameType], str | None]:
+    """
+    Кадры цепочки await задачи от корня к листу.
+
+    Второе значение — что ожидает лист (например, Future), или None, если
+    лист сейчас выполняется.
+    """
+    frames = []
+    awaitable = task.get_coro()
+    while awaitable is not None:
+        frame = (
+            getattr(awaitable, "cr_frame", None)
+            or getattr(awaitable, "gi_frame", None)
+            or getattr(awaitable, "ag_frame", None)
+        )
+        if frame is None:
+            return frames, type(awaitable).__name__
+        frames.append(frame)
+        awaitable = (
+            getattr(awaitable, "cr_await", None)
+            or getattr(awaitable, "gi_yieldfrom", None)
+            or getattr(awaitable, "ag_await", None)
+        )
+    return frames, None
+
+
+def _frame_stack(frame: FrameType | None) -> list[FrameType]:
+    """Стек от внешнего кадра к frame."""
+    stack = []
+    while frame is not None:
+        stack.append(frame)
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+class RequestProfiler:
+    """
+    Сэмплирующий профайлер одного запроса.
+
+    Отдельный поток раз в PROFILE_SAMPLE_INTERVAL_MS снимает стек задачи
+    запроса. Если задача выполняется, берётся стек потока цикла событий
+    (включая код SQLAlchemy в greenlet); если ждёт — цепочка её await с
+    листом «(await …)», так в профиль попадает и время ожидания БД.
+    Другие запросы, выполняющиеся в это время, в профиль не попадают.
+
+    Пока цикл событий занят, поток сэмплера получает GIL не чаще
+    sys.getswitchinterval() (5 мс), поэтому интервал меньше не имеет смысла.
+    """
+
+    def __init__(self, root: FrameType) -> None:
+        self.profile_id = uuid.uuid4().hex
+        self.samples: Counter[str] = Counter()
+        self.sample_count = 0
+        self._root = root
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        self._loop_thread = threading.get_ident()
+        self._main_greenlet = greenlet.getcurrent() if greenlet is not None else None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"profiler-{self.profile_id[:8]}", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        interval = settings.PROFILE_SAMPLE_INTERVAL_MS / 1000
+        deadline = time.monotonic() + settings.PROFILE_MAX_SECONDS
+        while not self._stop.wait(interval) and time.monotonic() < deadline:
+            stack = self._sample()
+            if stack:
+                key = ";".join(
+                    item if isinstance(item, str) else _frame_label(item.f_code)
+                    for item in stack
+                )
+                self.samples[key] += 1
+                self.sample_count += 1
+
+    def _sample(self) -> list[FrameType | str]:
+        if asyncio.current_task(self._loop) is not self._task:
+            # Задача ждёт: цепочка await приостановленных корутин
+            chain, awaiting = _coroutine_chain(self._task)
+            if self._root not in chain:
+                return []
+            return [*chain[chain.index(self._root) :], f"(await {awaiting or 'idle'})"]
+
+        stack = _frame_stack(sys._current_frames().get(self._loop_thread))
+        if self._root in stack:
+            return stack[stack.index(self._root) :]
+
+        # Синхронный код SQLAlchemy в greenlet: его стек не связан с корутинами,
+        # а корутинная часть — в приостановленном главном greenlet
+        if self._main_greenlet is not None:
+            parent = _frame_stack(self._main_greenlet.gr_frame)
+            if self._root in parent:
+                return parent[parent.index(self._root) :] + stack
+        return stack
+
+    def collapsed(self) -> str:
+        """Стеки в collapsed-формате (flamegraph.pl, speedscope)."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.samples.most_common()
+        )
+
+
+class ProfileStore:
+    """
+    Файлы профилей в PROFILE_DIR и ограничение частоты профилирования.
+
+    Для каждого профиля пишутся <id>.collapsed и <id>.json с описанием
+    запроса; старые файлы сверх PROFILE_KEEP_FILES удаляются.
+    """
+
+    def __init__(self) -> None:
+        self._started: deque[float] = deque()
+        self._active = 0
+
+    @property
+    def directory(self) -> Path:
+        return Path(settings.PROFILE_DIR)
+
+    def try_acquire(self) -> bool:
+        """Разрешает профилирование не чаще PROFILE_MAX_PER_MINUTE раз в минуту."""
+        now = time.monotonic()
+        while self._started and now - self._started[0] > 60:
+            self._started.popleft()
+        if (
+            len(self._started) >= settings.PROFILE_MAX_PER_MINUTE
+            or self._active >= settings.PROFILE_MAX_CONCURRENT
+        ):
+            return False
+        self._started.append(now)
+        self._active += 1
+        return True
+
+    def release(self) -> None:
+        self._active -= 1
+
+    def save(self, profiler: RequestProfiler, info: dict) -> None:
+        directory = self.directory
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"{profiler.profile_id}.collapsed").write_text(
+            profiler.collapsed(), encoding="utf-8"
+        )
+        metadata = {
+            "profile_id": profiler.profile_id,
+            "samples": profiler.sample_count,
+            "interval_ms": settings.PROFILE_SAMPLE_INTERVAL_MS,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            **info,
+        }
+        (directory / f"{profiler.profile_id}.json").write_text(
+            json.dumps(metadata, ensure_ascii=False), encoding="utf-8"
+        )
+        self._prune()
+
+    def _prune(self) -> None:
+        stale = self._metadata_files()[settings.PROFILE_KEEP_FILES :]
+        for path in stale:
+            path.unlink(missing_ok=True)
+            path.with_suffix(".collapsed").unlink(missing_ok=True)
+
+    def _metadata_files(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            self.directory.glob("*.json"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+
+    def list(self, limit: int) -> list[dict]:
+        """Описания последних профилей, новые первыми."""
+        profiles = []
+        for path in self._metadata_files()[:limit]:
+            try:
+                profiles.append(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                continue
+        return profiles
+
+    def read(self, profile_id: str) -> str | None:
+        if not PROFILE_ID.match(profile_id):
+            return None
+        path = self.directory / f"{profile_id}.collapsed"
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+
+profile_store = ProfileStore()
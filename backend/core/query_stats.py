@@ -0,0 +1,77 @@
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL, Engine
+
+
+class QueryStats:
+    """Статистика SQL-запросов в пределах одного HTTP-запроса."""
+
+    __slots__ = (
+        "count",
+        "parent",
+        "slowest_seconds",
+        "slowest_statement",
+        "total_seconds",
+    )
+
+    def __init__(self, parent: "QueryStats | None" = None) -> None:
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: str | None = None
+        # Внешний сборщик (например, счётчик запросов в тесте) получает те же данные
+        self.parent = parent
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.total_seconds += duration
+        if duration >= self.slowest_seconds:
+            self.slowest_seconds = duration
+            self.slowest_statement = statement
+        if self.parent is not None:
+            self.parent.record(statement, duration)
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+@contextmanager
+def collect_query_stats() -> Iterator[QueryStats]:
+    """Собирает статистику запросов, выполненных внутри блока with."""
+    stats = QueryStats(parent=current_query_stats.get())
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+
+# Обработчики каждого выполненного запроса: (url, statement, parameters,
+# duration), где url — адрес БД движка, выполнившего запрос
+query_observers: list[Callable[[URL, str, Any, float], None]] = []
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_started_at"].pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+    for observer in query_observers:
+        observer(conn.engine.url, statement, parameters, duration)
+
+
+def instrument_engine(sync_engine: Engine) -> None:
+    """Подключает сбор статистики к движку (для AsyncEngine — его sync_engine)."""
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,221 @@
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from core.config import settings
+from core.metrics import Counter
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # extra redis нужен только при RATE_LIMIT_REDIS_URL
+    redis = None
+
+logger = logging.getLogger("mirumir.rate_limit")
+
+RATE_LIMITED = Counter(
+    "rate_limited_total", "Запросов, отклонённых с 429", labelnames=("scope",)
+)
+RATE_LIMIT_BACKEND_ERRORS = Counter(
+    "rate_limit_backend_errors_total", "Ошибки общего бэкенда лимитов"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BucketLimit:
+    """Корзина токенов: rate токенов в секунду, не больше burst."""
+
+    rate: float
+    burst: int
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    allowed: bool
+    remaining: int
+    # Через сколько секунд появится следующий токен (0, если запрос допущен)
+    retry_after: float
+
+
+def _refill(tokens: float, updated_at: float, now: float, limit: BucketLimit) -> float:
+    return min(limit.burst, tokens + (now - updated_at) * limit.rate)
+
+
+def _result(tokens: float, allowed: bool, limit: BucketLimit) -> RateLimitResult:
+    retry_after = 0.0 if allowed else (1 - tokens) / limit.rate
+    return RateLimitResult(allowed, math.floor(tokens), retry_after)
+
+
+class MemoryRateLimiter:
+    """
+    Корзины токенов в памяти процесса.
+
+    Каждая корзина — пара (токены, время обновления); пополнение считается
+    лениво при обращении, поэтому проверка стоит O(1) без фоновых задач.
+    Число корзин ограничено max_keys: дольше всех не использованные
+    вытесняются (полная корзина и отсутствующая ведут себя одинаково).
+    При нескольких воркерах лимит действует на каждый процесс отдельно.
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str, limit: BucketLimit) -> RateLimitResult:
+        return (await self.consume_all([(key, limit)]))[0]
+
+    async def check(self, key: str, limit: BucketLimit) -> RateLimitResult:
+        """Есть ли в корзине токен; ничего не списывает."""
+        return self._take([(key, limit)], spend=False)[0]
+
+    async def consume_all(
+        self, buckets: Sequence[tuple[str, BucketLimit]]
+    ) -> list[RateLimitResult]:
+        """
+        Списывает по токену из каждой корзины, только если токен есть во
+        всех: отклонённый запрос не расходует ни одну.
+        """
+        return self._take(buckets, spend=True)
+
+    def _take(
+        self, buckets: Sequence[tuple[str, BucketLimit]], spend: bool
+    ) -> list[RateLimitResult]:
+        now = time.monotonic()
+        levels = []
+        for key, limit in buckets:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                levels.append(float(limit.burst))
+            else:
+                levels.append(_refill(*bucket, now, limit))
+                self._buckets.move_to_end(key)
+        if not spend or any(tokens < 1 for tokens in levels):
+            return [
+                _result(tokens, tokens >= 1, limit)
+                for tokens, (_, limit) in zip(levels, buckets)
+            ]
+
+        for tokens, (key, _) in zip(levels, buckets):
+            if key not in self._buckets and len(self._buckets) >= self.max_keys:
+                self._buckets.popitem(last=False)
+            self._buckets[key] = (tokens - 1, now)
+            self._buckets.move_to_end(key)
+        return [
+            _result(tokens - 1, True, limit)
+            for tokens, (_, limit) in zip(levels, buckets)
+        ]
+
+
+# Пополнение, проверка и списание всех корзин запроса одним атомарным скриптом:
+# один запрос к Redis, и токены списываются, только если их хватает во всех
+# корзинах. ARGV: списывать ли (1/0), затем rate и burst каждой корзины.
+# Время берётся у Redis, чтобы часы воркеров не влияли на лимит
+_TOKEN_BUCKET_SCRIPT = """
+local spend = tonumber(ARGV[1])
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local levels = {}
+local allowed = 1
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i])
+    local burst = tonumber(ARGV[2 * i + 1])
+    local bucket = redis.call('HMGET', key, 'tokens', 'updated_at')
+    local tokens = tonumber(bucket[1])
+    if tokens == nil then
+        tokens = burst
+    else
+        tokens = math.min(burst, tokens + (now - tonumber(bucket[2])) * rate)
+    end
+    if tokens < 1 then
+        allowed = 0
+    end
+    levels[i] = tokens
+end
+local result = {allowed}
+for i, key in ipairs(KEYS) do
+    if allowed == 1 and spend == 1 then
+        local rate = tonumber(ARGV[2 * i])
+        local burst = tonumber(ARGV[2 * i + 1])
+        levels[i] = levels[i] - 1
+        redis.call('HSET', key, 'tokens', tostring(levels[i]), 'updated_at', tostring(now))
+        redis.call('EXPIRE', key, math.ceil(burst / rate) + 1)
+    end
+    result[i + 1] = tostring(levels[i])
+end
+return result
+"""
+
+
+class RedisRateLimiter:
+    """
+    Корзины токенов в Redis — общий лимит для всех воркеров и реплик.
+
+    Ключ живёт, пока корзина не наполнилась заново. Если Redis недоступен,
+    запрос пропускается: ограничение нагрузки не должно ронять API.
+    """
+
+    def __init__(self, url: str) -> None:
+        self._client = redis.from_url(url)
+        self._script = self._client.register_script(_TOKEN_BUCKET_SCRIPT)
+
+    async def consume(self, key: str, limit: BucketLimit) -> RateLimitResult:
+        return (await self.consume_all([(key, limit)]))[0]
+
+    async def check(self, key: str, limit: BucketLimit) -> RateLimitResult:
+        return (await self._take([(key, limit)], spend=False))[0]
+
+    async def consume_all(
+        self, buckets: Sequence[tuple[str, BucketLimit]]
+    ) -> list[RateLimitResult]:
+        return await self._take(buckets, spend=True)
+
+    async def _take(
+        self, buckets: Sequence[tuple[str, BucketLimit]], spend: bool
+    ) -> list[RateLimitResult]:
+        args: list[float] = [int(spend)]
+        for _, limit in buckets:
+            args += [limit.rate, limit.burst]
+        try:
+            allowed, *levels = await self._script(
+                keys=[f"mirumir:rate:{key}" for key, _ in buckets], args=args
+            )
+        except redis.RedisError:
+            RATE_LIMIT_BACKEND_ERRORS.inc()
+            logger.warning("Rate limit backend unavailable", exc_info=True)
+            return [RateLimitResult(True, limit.burst, 0.0) for _, limit in buckets]
+        spent = bool(allowed) and spend
+        return [
+            # Без списания корзина допускает запрос, если в ней есть токен
+            _result(float(tokens), spent or float(tokens) >= 1, limit)
+            for tokens, (_, limit) in zip(levels, buckets)
+        ]
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+RateLimiter = MemoryRateLimiter | RedisRateLimiter
+
+
+def create_rate_limiter() -> RateLimiter | None:
+    """
+    Бэкенд по настройкам; None, если ограничение выключено.
+
+    Вызывается при импорте модуля, поэтому Redis в настройках без
+    установленного пакета останавливает запуск, а не первый запрос на запись.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return None
+    if settings.RATE_LIMIT_REDIS_URL:
+        if redis is None:
+            raise RuntimeError(
+                "RATE_LIMIT_REDIS_URL задан, но пакет redis не установлен: "
+                "установите зависимости с extra redis (uv sync --extra redis)"
+            )
+        return RedisRateLimiter(settings.RATE_LIMIT_REDIS_URL)
+    return MemoryRateLimiter(settings.RATE_LIMIT_MAX_KEYS)
+
+
+rate_limiter = create_rate_limiter()
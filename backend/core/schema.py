@@ -0,0 +1,45 @@
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateColumn
+
+import models  # noqa: F401 — регистрирует все таблицы в Base.metadata
+from core.database import Base
+
+logger = logging.getLogger("mirumir.schema")
+
+
+def sync_schema(connection: Connection) -> None:
+    """
+    Приводит схему БД к моделям при старте (миграций в проекте нет).
+
+    Создаёт недостающие таблицы, а в существующих — недостающие столбцы и
+    индексы. Добавлять можно только столбцы, допускающие NULL или со
+    server_default; существующие столбцы не меняются и не удаляются.
+    Вызывается через AsyncConnection.run_sync.
+    """
+    Base.metadata.create_all(connection)
+
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable and column.server_default is None:
+                raise RuntimeError(
+                    f"Cannot add NOT NULL column {table.name}.{column.name} "
+                    "without server_default"
+                )
+            ddl = CreateColumn(column).compile(dialect=connection.dialect)
+            connection.execute(
+                text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN IF NOT EXISTS {ddl}"
+                )
+            )
+            logger.info("Added column %s.%s", table.name, column.name)
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
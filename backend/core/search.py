@@ -0,0 +1,30 @@
+import re
+
+from sqlalchemy import func
+from sqlalchemy.sql.elements import ColumnElement
+
+# Конфигурация полнотекстового поиска Postgres: русская морфология, латиница
+# стеммится английским словарём. Должна совпадать с выражениями
+# сгенерированных столбцов *_search_vector в моделях
+SEARCH_CONFIG = "russian"
+MAX_SEARCH_TERMS = 8
+
+_TERM = re.compile(r"\w+")
+
+
+def prefix_tsquery(text: str) -> str | None:
+    """
+    Строка для to_tsquery: все слова запроса как префиксы, через И.
+
+    Спецсимволы tsquery (&, |, !, :, скобки) отбрасываются, поэтому ввод
+    пользователя не ломает разбор. None — в запросе нет ни одного слова.
+    """
+    terms = _TERM.findall(text.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def search_query(query: str) -> ColumnElement:
+    """tsquery для строки из prefix_tsquery."""
+    return func.to_tsquery(SEARCH_CONFIG, query)
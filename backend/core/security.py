@@ -1,9 +1,56 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import TypeVar
 
 import bcrypt
 from jose import JWTError, jwt
 
 from core.config import settings
+from core.metrics import Gauge, Histogram
+
+T = TypeVar("T")
+
+# bcrypt намеренно медленный (~0.25 с), поэтому выполняется в отдельном
+# ограниченном пуле потоков, а не в цикле событий
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_MAX_WORKERS, thread_name_prefix="bcrypt"
+)
+
+BCRYPT_IN_FLIGHT = Gauge("bcrypt_in_flight", "Операций bcrypt в очереди и в работе")
+BCRYPT_QUEUE_DEPTH = Gauge(
+    "bcrypt_queue_depth",
+    "Операций bcrypt, ждущих свободного потока",
+    callback=lambda: max(BCRYPT_IN_FLIGHT.value - settings.BCRYPT_MAX_WORKERS, 0),
+)
+BCRYPT_SECONDS = Histogram(
+    "bcrypt_duration_seconds",
+    "Время операции bcrypt вместе с ожиданием в очереди",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+
+async def run_bcrypt(func: Callable[..., T], *args) -> T:
+    """Выполняет hash_password/verify_password в пуле потоков bcrypt."""
+    BCRYPT_IN_FLIGHT.inc()
+    started = time.perf_counter()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            _bcrypt_executor, func, *args
+        )
+    finally:
+        BCRYPT_IN_FLIGHT.dec()
+        BCRYPT_SECONDS.observe(time.perf_counter() - started)
+
+
+def hash_password(password: str) -> str:
+    """Хеширует пароль с использованием bcrypt."""
+    password_bytes = password.encode("utf-8")
+    salt = bcrypt.gensalt()
+    hashed = bcrypt.hashpw(password_bytes, salt)
+    return hashed.decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
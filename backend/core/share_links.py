@@ -0,0 +1,167 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.config import settings
+from core.database import AsyncSessionLocal
+from models.permission import Permission
+from models.share_link import ShareLink
+
+logger = logging.getLogger("mirumir.share_links")
+
+
+class InvalidShareLinkError(ValueError):
+    """Токен ссылки повреждён, подделан, истёк или отозван."""
+
+
+@dataclass(frozen=True, slots=True)
+class ShareLinkClaims:
+    """Содержимое токена ссылки на доску."""
+
+    link_id: str
+    board_id: int
+    permission: Permission
+    expires_at: int  # Unix-время
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _signing_key() -> bytes:
+    # Отдельный ключ от SECRET_KEY: подпись ссылки не годится как подпись JWT
+    return hashlib.sha256(b"share-link:" + settings.SECRET_KEY.encode()).digest()
+
+
+def _signature(payload: str) -> str:
+    digest = hmac.new(_signing_key(), payload.encode("ascii"), hashlib.sha256)
+    return _b64encode(digest.digest())
+
+
+def sign_share_link(claims: ShareLinkClaims) -> str:
+    """Токен ссылки: данные и их HMAC-SHA256, оба в base64url через точку."""
+    raw = json.dumps(
+        [claims.link_id, claims.board_id, claims.permission.value, claims.expires_at],
+        separators=(",", ":"),
+    )
+    payload = _b64encode(raw.encode("utf-8"))
+    return f"{payload}.{_signature(payload)}"
+
+
+def verify_share_link(token: str, now: float | None = None) -> ShareLinkClaims:
+    """
+    Проверяет подпись, срок и deny-list; к БД не обращается.
+
+    Raises:
+        InvalidShareLinkError: Если ссылка недействительна
+    """
+    payload, _, signature = token.partition(".")
+    if not token.isascii() or not hmac.compare_digest(signature, _signature(payload)):
+        raise InvalidShareLinkError("Неверная подпись ссылки")
+    try:
+        link_id, board_id, permission, expires_at = json.loads(_b64decode(payload))
+        claims = ShareLinkClaims(
+            str(link_id), int(board_id), Permission(permission), int(expires_at)
+        )
+    except (TypeError, ValueError) as exc:
+        raise InvalidShareLinkError("Некорректная ссылка") from exc
+    if claims.expires_at <= (time.time() if now is None else now):
+        raise InvalidShareLinkError("Срок действия ссылки истёк")
+    if claims.link_id in share_link_denylist:
+        raise InvalidShareLinkError("Ссылка отозвана")
+    return claims
+
+
+class ShareLinkDenyList:
+    """
+    Отозванные ссылки, срок которых ещё не истёк, в памяти процесса.
+
+    Истёкшая ссылка отклоняется и без deny-list, поэтому записи живут только
+    до expires_at, и список остаётся маленьким. Отзыв в этом процессе
+    действует сразу; остальные воркеры подтягивают отозванные ссылки из
+    share_links раз в refresh_interval секунд.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        refresh_interval: float = settings.SHARE_LINK_DENYLIST_REFRESH_SECONDS,
+    ) -> None:
+        self.session_factory = session_factory
+        self.refresh_interval = refresh_interval
+        self._entries: dict[str, float] = {}
+        self._loop_task: asyncio.Task | None = None
+
+    def add(self, link_id: str, expires_at: float) -> None:
+        self._entries[link_id] = expires_at
+
+    def __contains__(self, link_id: str) -> bool:
+        expires_at = self._entries.get(link_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            del self._entries[link_id]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def refresh(self) -> None:
+        """
+        Добавляет отозванные неистёкшие ссылки из БД и убирает истёкшие.
+        Отзыв не отменяется, поэтому локальные записи не затираются.
+        """
+        now = datetime.now(timezone.utc)
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(ShareLink.link_id, ShareLink.expires_at).where(
+                    ShareLink.revoked_at.is_not(None), ShareLink.expires_at > now
+                )
+            )
+            loaded = {row.link_id: row.expires_at.timestamp() for row in result}
+        self._entries = {
+            link_id: expires_at
+            for link_id, expires_at in self._entries.items()
+            if expires_at > now.timestamp()
+        } | loaded
+
+    async def start(self) -> None:
+        """Загружает список до приёма запросов и запускает его обновление."""
+        try:
+            await self.refresh()
+        except Exception:
+            logger.exception("Failed to load share link deny-list")
+        self._loop_task = asyncio.create_task(
+            self._run_loop(), name="share-link-denylist"
+        )
+
+    async def stop(self) -> None:
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
+
+    async def _run_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Failed to refresh share link deny-list")
+
+
+share_link_denylist = ShareLinkDenyList()
@@ -0,0 +1,59 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from core.metrics import Counter
+
+T = TypeVar("T")
+
+SINGLEFLIGHT_CALLS = Counter(
+    "singleflight_calls_total",
+    "Вызовы single-flight: leader выполнил работу, follower дождался чужого результата",
+    labelnames=("group", "role"),
+)
+
+
+class SingleFlight(Generic[T]):
+    """
+    Объединение одновременных вызовов с одинаковым ключом.
+
+    Первый вызов (leader) выполняет работу, остальные с тем же ключом ждут
+    его результат или исключение. Если leader отменён (клиент отключился),
+    ожидающие не падают: один из них становится новым leader.
+    Результат не кэшируется — после завершения ключ освобождается.
+    """
+
+    def __init__(self, group: str) -> None:
+        self.group = group
+        self._inflight: dict[Hashable, asyncio.Future[T]] = {}
+        self._leader_calls = SINGLEFLIGHT_CALLS.labels(group, "leader")
+        self._follower_calls = SINGLEFLIGHT_CALLS.labels(group, "follower")
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        while (future := self._inflight.get(key)) is not None:
+            self._follower_calls.inc()
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+        self._leader_calls.inc()
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Помечаем исключение полученным, даже если ожидающих не было
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
@@ -0,0 +1,265 @@
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from core.config import settings
+from core.query_stats import query_observers
+
+logger = logging.getLogger("mirumir.slow_queries")
+
+_WHITESPACE = re.compile(r"\s+")
+# Раскрытые списки IN ($1::INTEGER, $2::INTEGER, ...) дают один отпечаток
+_PLACEHOLDER_LIST = re.compile(
+    r"\(\s*\$\d+(?:::[\w ]+)?(?:\s*,\s*\$\d+(?:::[\w ]+)?)+\s*\)"
+)
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+_MAX_PARAMETER_SHAPES = 50
+
+
+def normalize_statement(statement: str) -> str:
+    """Приводит запрос к виду, по которому считается отпечаток."""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST.sub("(...)", statement)
+
+
+def statement_fingerprint(normalized: str) -> str:
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def parameter_shapes(parameters: Any) -> list[str]:
+    """Типы параметров без значений, например ['int', 'str', 'list[3]', 'null']."""
+    if not parameters:
+        return []
+
+    values = parameters.values() if isinstance(parameters, dict) else parameters
+    shapes = []
+    for value in list(values)[:_MAX_PARAMETER_SHAPES]:
+        if value is None:
+            shapes.append("null")
+        elif isinstance(value, (list, tuple)):
+            shapes.append(f"list[{len(value)}]")
+        else:
+            shapes.append(type(value).__name__)
+    return shapes
+
+
+class SlowQueryEntry:
+    """Накопленная статистика медленного запроса с одним отпечатком."""
+
+    __slots__ = (
+        "calls",
+        "fingerprint",
+        "last_seen_at",
+        "max_ms",
+        "parameter_shapes",
+        "plan",
+        "plan_captured_at",
+        "statement",
+        "total_ms",
+    )
+
+    def __init__(self, fingerprint: str, statement: str, shapes: list[str]) -> None:
+        self.fingerprint = fingerprint
+        self.statement = statement
+        self.parameter_shapes = shapes
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_seen_at = datetime.now(timezone.utc)
+        self.plan: Any | None = None
+        self.plan_captured_at: float | None = None
+
+
+class SlowQueryLog:
+    """
+    Журнал запросов дольше SLOW_QUERY_THRESHOLD_MS.
+
+    Каждый медленный запрос пишется в ротируемый файл с типами параметров
+    (без значений). Для нового отпечатка в фоне снимается
+    EXPLAIN (ANALYZE off, FORMAT JSON) через отдельное соединение, не
+    занимающее слот в пуле приложения, — к той же БД, что выполнила запрос:
+    запросы с реплики объясняются на реплике.
+    """
+
+    MAX_FINGERPRINTS = 500
+    PLAN_TTL_SECONDS = 600.0
+    MAX_CONCURRENT_EXPLAINS = 2
+
+    def __init__(self) -> None:
+        self.entries: dict[str, SlowQueryEntry] = {}
+        self._explaining: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._explain_engines: dict[str, AsyncEngine] = {}
+
+    def observe(
+        self, url: URL, statement: str, parameters: Any, duration: float
+    ) -> None:
+        threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+        duration_ms = duration * 1000
+        if threshold_ms is None or duration_ms < threshold_ms:
+            return
+        self.record(statement, parameters, duration_ms, url)
+
+    def record(
+        self,
+        statement: str,
+        parameters: Any,
+        duration_ms: float,
+        url: URL | None = None,
+    ) -> None:
+        """url — БД, выполнившая запрос; без него план снимается на основной."""
+        normalized = normalize_statement(statement)
+        fingerprint = statement_fingerprint(normalized)
+
+        entry = self.entries.get(fingerprint)
+        if entry is None:
+            if len(self.entries) >= self.MAX_FINGERPRINTS:
+                coldest = min(self.entries.values(), key=lambda e: e.total_ms)
+                del self.entries[coldest.fingerprint]
+            entry = SlowQueryEntry(
+                fingerprint, normalized, parameter_shapes(parameters)
+            )
+            self.entries[fingerprint] = entry
+
+        entry.calls += 1
+        entry.total_ms += duration_ms
+        entry.max_ms = max(entry.max_ms, duration_ms)
+        entry.last_seen_at = datetime.now(timezone.utc)
+
+        logger.warning(
+            json.dumps(
+                {
+                    "event": "slow_query",
+                    "at": entry.last_seen_at.isoformat(),
+                    "fingerprint": fingerprint,
+                    "duration_ms": round(duration_ms, 2),
+                    "statement": normalized,
+                    "parameter_shapes": entry.parameter_shapes,
+                },
+                ensure_ascii=False,
+            )
+        )
+
+        if settings.SLOW_QUERY_EXPLAIN:
+            self._schedule_explain(entry, statement, parameters, url)
+
+    def top(self, limit: int) -> list[SlowQueryEntry]:
+        """Самые дорогие отпечатки по суммарному времени."""
+        return sorted(self.entries.values(), key=lambda e: e.total_ms, reverse=True)[
+            :limit
+        ]
+
+    def _schedule_explain(
+        self,
+        entry: SlowQueryEntry,
+        statement: str,
+        parameters: Any,
+        url: URL | None,
+    ) -> None:
+        if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            return
+        # executemany передаёт список наборов параметров — такой запрос не объяснить
+        if parameters is not None and not isinstance(parameters, (tuple, dict)):
+            return
+        if entry.fingerprint in self._explaining:
+            return
+        if len(self._explaining) >= self.MAX_CONCURRENT_EXPLAINS:
+            return
+        if (
+            entry.plan_captured_at is not None
+            and time.monotonic() - entry.plan_captured_at < self.PLAN_TTL_SECONDS
+        ):
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._explaining.add(entry.fingerprint)
+        task = loop.create_task(self._explain(entry, statement, parameters, url))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _explain_engine(self, url: URL | None) -> AsyncEngine:
+        """Движок без пула для EXPLAIN — по одному на каждую БД."""
+        key = (
+            url.render_as_string(hide_password=False)
+            if url is not None
+            else settings.DATABASE_URL
+        )
+        explain_engine = self._explain_engines.get(key)
+        if explain_engine is None:
+            explain_engine = create_async_engine(key, poolclass=NullPool)
+            self._explain_engines[key] = explain_engine
+        return explain_engine
+
+    async def _explain(
+        self,
+        entry: SlowQueryEntry,
+        statement: str,
+        parameters: Any,
+        url: URL | None,
+    ) -> None:
+        try:
+            async with self._explain_engine(url).connect() as conn:
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE off, FORMAT JSON) {statement}", parameters
+                )
+                plan = result.scalar()
+            entry.plan = json.loads(plan) if isinstance(plan, str) else plan
+            entry.plan_captured_at = time.monotonic()
+            logger.warning(
+                json.dumps(
+                    {
+                        "event": "slow_query_plan",
+                        "fingerprint": entry.fingerprint,
+                        "plan": entry.plan,
+                    },
+                    ensure_ascii=False,
+                )
+            )
+        except Exception:
+            logger.exception("EXPLAIN failed for fingerprint %s", entry.fingerprint)
+        finally:
+            self._explaining.discard(entry.fingerprint)
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        for explain_engine in self._explain_engines.values():
+            await explain_engine.dispose()
+        self._explain_engines.clear()
+
+
+def setup_slow_query_log() -> None:
+    """Направляет журнал медленных запросов в ротируемый файл."""
+    if logger.handlers:
+        return
+    path = Path(settings.SLOW_QUERY_LOG_FILE)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handler = RotatingFileHandler(
+        path,
+        maxBytes=settings.SLOW_QUERY_LOG_MAX_BYTES,
+        backupCount=settings.SLOW_QUERY_LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+slow_query_log = SlowQueryLog()
+query_observers.append(slow_query_log.observe)
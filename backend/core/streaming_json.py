@@ -0,0 +1,128 @@
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+
+# Вне строки интересны только скобки и начало строки, внутри — конец строки
+# и экранирование; всё остальное регулярное выражение пропускает целиком
+_STRUCTURAL = re.compile(rb'[{}\[\]"]')
+_IN_STRING = re.compile(rb'["\\]')
+_WHITESPACE = b" \t\r\n"
+
+
+class StreamFormatError(ValueError):
+    """Поток не разбирается на JSON-объекты."""
+
+
+async def iter_ndjson(
+    chunks: AsyncIterable[bytes], max_item_bytes: int
+) -> AsyncIterator[bytes]:
+    """
+    Строки NDJSON-потока без перевода строки; пустые строки пропускаются.
+
+    В памяти держится только незаконченная строка, не длиннее max_item_bytes.
+    Сами строки не разбираются — это делает валидация пачками.
+    """
+    tail = b""
+    async for chunk in chunks:
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        if len(tail) > max_item_bytes:
+            raise StreamFormatError(f"Запись длиннее {max_item_bytes} байт")
+        for line in lines:
+            line = line.strip()
+            if line:
+                if len(line) > max_item_bytes:
+                    raise StreamFormatError(f"Запись длиннее {max_item_bytes} байт")
+                yield line
+    tail = tail.strip()
+    if tail:
+        yield tail
+
+
+async def iter_json_array(
+    chunks: AsyncIterable[bytes], max_item_bytes: int
+) -> AsyncIterator[bytes]:
+    """
+    Объекты JSON-массива верхнего уровня ([{...}, {...}]) по мере поступления.
+
+    Разбирается только структура — скобки и строки, — чтобы найти границы
+    элементов; сам элемент отдаётся байтами. Элементы должны быть объектами.
+    """
+    buffer = bytearray()
+    pos = 0  # до этой позиции буфер уже просмотрен
+    started = False  # встречена открывающая [ массива
+    finished = False
+    depth = 0  # вложенность внутри текущего элемента
+    in_string = False
+    item_start: int | None = None
+
+    async for chunk in chunks:
+        buffer += chunk
+        while pos < len(buffer):
+            if in_string:
+                match = _IN_STRING.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if match.group() == b"\\":
+                    if match.end() >= len(buffer):
+                        # Экранированный символ ещё не пришёл
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                in_string = False
+                pos = match.end()
+                continue
+
+            if item_start is None:
+                # Между элементами: пробелы, запятые и скобки массива
+                byte = buffer[pos]
+                if byte in _WHITESPACE:
+                    pos += 1
+                elif finished:
+                    raise StreamFormatError("Данные после конца массива")
+                elif not started:
+                    if byte != ord("["):
+                        raise StreamFormatError("Ожидался JSON-массив")
+                    started = True
+                    pos += 1
+                elif byte == ord(","):
+                    pos += 1
+                elif byte == ord("]"):
+                    finished = True
+                    pos += 1
+                elif byte == ord("{"):
+                    item_start = pos
+                    depth = 1
+                    pos += 1
+                else:
+                    raise StreamFormatError("Элементы массива должны быть объектами")
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            pos = match.end()
+            token = match.group()
+            if token == b'"':
+                in_string = True
+            elif token in (b"{", b"["):
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    yield bytes(buffer[item_start:pos])
+                    item_start = None
+
+        # Отбрасываем просмотренное, оставляя только незаконченный элемент
+        keep_from = pos if item_start is None else item_start
+        del buffer[:keep_from]
+        pos -= keep_from
+        if item_start is not None:
+            item_start = 0
+            if len(buffer) > max_item_bytes:
+                raise StreamFormatError(f"Запись длиннее {max_item_bytes} байт")
+
+    if not finished or item_start is not None or in_string:
+        raise StreamFormatError("Массив не закончен")
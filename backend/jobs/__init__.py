@@ -0,0 +1,2 @@
+# Обработчики фоновых задач регистрируются при импорте модулей пакета
+from . import boards  # noqa: F401
@@ -0,0 +1,294 @@
+from typing import Any
+
+from sqlalchemy import (
+    delete,
+    false,
+    func,
+    insert,
+    literal,
+    null,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.jobs import JobContext, enqueue_job, job_failure_handler, job_handler
+from models.access import Access
+from models.board import Board
+from models.effective_permission import EffectivePermission
+from models.group import GroupAccess
+from models.sticker import Sticker
+
+BOARD_DELETE = "board.delete"
+BOARD_DUPLICATE = "board.duplicate"
+
+
+@job_handler(BOARD_DELETE)
+async def purge_board(ctx: JobContext) -> dict[str, Any]:
+    """
+    Окончательно удаляет доску, помеченную deleted_at.
+
+    Стикеры удаляются порциями по JOB_DELETE_CHUNK_SIZE, каждая в своей
+    транзакции вместе с прогрессом: долгих блокировок нет, а после
+    перезапуска удаление продолжается с оставшихся строк.
+    """
+    board_id = ctx.params["board_id"]
+    chunk_size = settings.JOB_DELETE_CHUNK_SIZE
+    deleted = ctx.progress_done
+
+    async with ctx.session() as db:
+        remaining = await db.scalar(
+            select(func.count())
+            .select_from(Sticker)
+            .where(Sticker.board_id == board_id)
+        )
+        await ctx.report(db, deleted, total=deleted + remaining)
+        await db.commit()
+
+    while True:
+        async with ctx.session() as db:
+            chunk = (
+                select(Sticker.sticker_id)
+                .where(Sticker.board_id == board_id)
+                .order_by(Sticker.sticker_id)
+                .limit(chunk_size)
+                .scalar_subquery()
+            )
+            result = await db.execute(
+                delete(Sticker).where(Sticker.sticker_id.in_(chunk))
+            )
+            deleted += result.rowcount
+            await ctx.report(db, deleted)
+            await db.commit()
+        if result.rowcount < chunk_size:
+            break
+
+    async with ctx.session() as db:
+        await db.execute(delete(Access).where(Access.board_id == board_id))
+        await db.execute(delete(GroupAccess).where(GroupAccess.board_id == board_id))
+        await db.execute(
+            delete(EffectivePermission).where(EffectivePermission.board_id == board_id)
+        )
+        # Только помеченную доску: задача не удалит живую по ошибке в params
+        await db.execute(
+            delete(Board).where(
+                Board.board_id == board_id, Board.deleted_at.is_not(None)
+            )
+        )
+        await db.commit()
+
+    return {"boardId": board_id, "stickersDeleted": deleted}
+
+
+def sticker_selection(board_id: int, sticker_ids: list[int] | None):
+    """Условие на стикеры доски для копирования: все или только sticker_ids."""
+    conditions = [Sticker.board_id == board_id]
+    if sticker_ids is not None:
+        conditions.append(Sticker.sticker_id.in_(sticker_ids))
+    return conditions
+
+
+def _copy_board_row(board_id: int, owner_id: int, title: str, hidden: bool = False):
+    """INSERT ... SELECT новой доски из доски board_id; hidden — сразу с deleted_at."""
+    return (
+        insert(Board)
+        .from_select(
+            [
+                Board.creator_id,
+                Board.title,
+                Board.description,
+                Board.background_color,
+                Board.is_public,
+                Board.deleted_at,
+            ],
+            select(
+                literal(owner_id),
+                literal(title),
+                Board.description,
+                Board.background_color,
+                false(),
+                func.now() if hidden else null(),
+            ).where(Board.board_id == board_id, Board.deleted_at.is_(None)),
+        )
+        .returning(
+            Board.board_id,
+            Board.title,
+            Board.description,
+            Board.background_color,
+            Board.creator_id,
+            Board.created_at,
+            Board.updated_at,
+        )
+    )
+
+
+def _copy_stickers(
+    new_board_id: int, owner_id: int, offset_x: float, offset_y: float, *conditions
+):
+    """INSERT ... SELECT стикеров, подходящих под conditions, на доску new_board_id."""
+    return insert(Sticker).from_select(
+        [
+            Sticker.board_id,
+            Sticker.created_by,
+            Sticker.x,
+            Sticker.y,
+            Sticker.layer_level,
+            Sticker.text,
+            Sticker.width,
+            Sticker.height,
+            Sticker.color,
+        ],
+        select(
+            literal(new_board_id),
+            literal(owner_id),
+            Sticker.x + offset_x,
+            Sticker.y + offset_y,
+            Sticker.layer_level,
+            Sticker.text,
+            Sticker.width,
+            Sticker.height,
+            Sticker.color,
+        )
+        .where(*conditions)
+        .order_by(Sticker.sticker_id),
+    )
+
+
+async def duplicate_board(
+    db: AsyncSession,
+    board_id: int,
+    owner_id: int,
+    title: str,
+    offset_x: float = 0,
+    offset_y: float = 0,
+    sticker_ids: list[int] | None = None,
+):
+    """
+    Копирует доску и её стикеры внутри Postgres: INSERT ... SELECT для доски
+    и один INSERT ... SELECT для всех стикеров, строки в Python не читаются.
+
+    Копия принадлежит owner_id, доступы не копируются. Возвращает строку
+    новой доски (board_id, даты) и число скопированных стикеров; коммит —
+    за вызывающим.
+    """
+    board_result = await db.execute(_copy_board_row(board_id, owner_id, title))
+    new_board = board_result.one_or_none()
+    if new_board is None:
+        raise LookupError(f"Board {board_id} not found")
+
+    sticker_result = await db.execute(
+        _copy_stickers(
+            new_board.board_id,
+            owner_id,
+            offset_x,
+            offset_y,
+            *sticker_selection(board_id, sticker_ids),
+        )
+    )
+    return new_board, sticker_result.rowcount
+
+
+@job_handler(BOARD_DUPLICATE)
+async def duplicate_board_job(ctx: JobContext) -> dict[str, Any]:
+    """
+    Копия большой доски порциями.
+
+    Сначала создаётся скрытая (с deleted_at) доска, и её ID сохраняется в
+    checkpoint той же транзакцией. Затем стикеры копируются порциями по
+    JOB_COPY_CHUNK_SIZE в порядке sticker_id, каждая порция — в своей
+    транзакции вместе с прогрессом и последним скопированным ID. После
+    перезапуска задача продолжает ту же доску с места остановки, а не
+    создаёт новую. Когда всё скопировано, доска становится видимой; если
+    попытки исчерпаны, её удаляет discard_partial_copy.
+    """
+    params = ctx.params
+    board_id = params["board_id"]
+    owner_id = params["owner_id"]
+    selection = sticker_selection(board_id, params["sticker_ids"])
+    chunk_size = settings.JOB_COPY_CHUNK_SIZE
+    copied = ctx.progress_done
+
+    if "new_board_id" not in ctx.checkpoint:
+        async with ctx.session() as db:
+            new_board = (
+                await db.execute(
+                    _copy_board_row(board_id, owner_id, params["title"], hidden=True)
+                )
+            ).one_or_none()
+            if new_board is None:
+                raise LookupError(f"Board {board_id} not found")
+            total = await db.scalar(
+                select(func.count()).select_from(Sticker).where(*selection)
+            )
+            await ctx.report(
+                db,
+                0,
+                total=total,
+                checkpoint={"new_board_id": new_board.board_id, "last_sticker_id": 0},
+            )
+            await db.commit()
+        copied = 0
+    new_board_id = ctx.checkpoint["new_board_id"]
+
+    while True:
+        last_sticker_id = ctx.checkpoint["last_sticker_id"]
+        async with ctx.session() as db:
+            chunk = (
+                select(Sticker.sticker_id)
+                .where(*selection, Sticker.sticker_id > last_sticker_id)
+                .order_by(Sticker.sticker_id)
+                .limit(chunk_size)
+                .subquery()
+            )
+            chunk_end = await db.scalar(select(func.max(chunk.c.sticker_id)))
+            if chunk_end is None:
+                break
+            result = await db.execute(
+                _copy_stickers(
+                    new_board_id,
+                    owner_id,
+                    params["offset_x"],
+                    params["offset_y"],
+                    *selection,
+                    Sticker.sticker_id > last_sticker_id,
+                    Sticker.sticker_id <= chunk_end,
+                )
+            )
+            copied += result.rowcount
+            await ctx.report(
+                db,
+                copied,
+                checkpoint={"new_board_id": new_board_id, "last_sticker_id": chunk_end},
+            )
+            await db.commit()
+
+    async with ctx.session() as db:
+        await db.execute(
+            update(Board).where(Board.board_id == new_board_id).values(deleted_at=None)
+        )
+        await db.commit()
+    return {"boardId": new_board_id, "stickersCopied": copied}
+
+
+@job_failure_handler(BOARD_DUPLICATE)
+async def discard_partial_copy(ctx: JobContext, db: AsyncSession) -> None:
+    """
+    Копия, исчерпавшая попытки, так и осталась скрытой: её доску и уже
+    скопированные стикеры удаляет задача BOARD_DELETE.
+    """
+    new_board_id = ctx.checkpoint.get("new_board_id")
+    if new_board_id is None:
+        return
+    hidden = await db.scalar(
+        select(Board.board_id).where(
+            Board.board_id == new_board_id, Board.deleted_at.is_not(None)
+        )
+    )
+    if hidden is not None:
+        enqueue_job(
+            db,
+            BOARD_DELETE,
+            {"board_id": new_board_id},
+            created_by=ctx.params["owner_id"],
+        )
@@ -1,23 +1,65 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from core.config import settings
 from api.v1.api import api_router
-from core.database import engine, Base
+from api.middleware import (
+    AdmissionMiddleware,
+    IdempotencyMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    QueryStatsMiddleware,
+)
+from core.database import engine, read_engine, warm_up_pool
+from core.jobs import job_runner
+from core.metrics import CONTENT_TYPE, render_text
+from core.rate_limit import RedisRateLimiter, rate_limiter
+from core.schema import sync_schema
+from core.share_links import share_link_denylist
+from core.slow_queries import setup_slow_query_log, slow_query_log
+import jobs  # noqa: F401 — регистрирует обработчики фоновых задач
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Create tables on startup (for simplicity, usually use Alembic)
+    setup_slow_query_log()
+    # Startup: недостающие таблицы, столбцы и индексы (миграций нет)
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(sync_schema)
+    # Прогреваем пул, чтобы первые запросы не платили за установку соединений
+    warmup_size = settings.DB_POOL_WARMUP
+    if warmup_size is None:
+        warmup_size = settings.DB_POOL_SIZE
+    await warm_up_pool(engine, min(warmup_size, settings.DB_POOL_SIZE))
+    if read_engine is not None:
+        await warm_up_pool(read_engine, min(warmup_size, settings.DB_POOL_SIZE))
+    # Отозванные ссылки на доски — до первого запроса со ссылкой
+    await share_link_denylist.start()
+    # Фоновые задачи, в том числе прерванные прошлым запуском
+    job_runner.start()
     yield
     # Shutdown: cleanup if needed
+    await job_runner.stop()
+    await share_link_denylist.stop()
+    await slow_query_log.close()
+    if isinstance(rate_limiter, RedisRateLimiter):
+        await rate_limiter.close()
     await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
 
 
 app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
 
+# Допуск под нагрузкой: лишние запросы получают 503 до зависимостей и БД.
+# Добавлен до CORS, чтобы ответ 503 тоже получал CORS-заголовки
+app.add_middleware(AdmissionMiddleware)
+
+# Idempotency-Key для POST создания досок и стикеров; снаружи допуска, чтобы
+# повтор, ждущий оригинал или получающий сохранённый ответ, не занимал слот
+app.add_middleware(IdempotencyMiddleware)
+
 # CORS middleware для работы с фронтендом
 app.add_middleware(
     CORSMiddleware,
@@ -32,6 +74,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Число SQL-запросов и время в БД: заголовок Server-Timing и лог mirumir.requests
+app.add_middleware(QueryStatsMiddleware)
+
+# Профилирование по заголовку X-Profile для администраторов
+app.add_middleware(ProfilingMiddleware)
+
+# Метрики по маршрутам для /metrics; добавлен последним, чтобы замерять весь стек
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(api_router, prefix="/api/v1")
 
 
@@ -39,3 +90,9 @@ app.include_router(api_router, prefix="/api/v1")
 @app.get("/api")
 def root():
     return {"message": "Hello World"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> PlainTextResponse:
+    """Метрики процесса в текстовом формате Prometheus."""
+    return PlainTextResponse(render_text(), media_type=CONTENT_TYPE)
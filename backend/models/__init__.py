@@ -3,3 +3,7 @@ from .user import User
 from .board import Board
 from .access import Access
 from .sticker import Sticker
+from .job import Job
+from .group import Group, GroupAccess, GroupMember, GroupNesting
+from .effective_permission import EffectivePermission
+from .share_link import ShareLink
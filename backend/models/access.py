@@ -4,7 +4,14 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from core.database import Base
-from sqlalchemy import ForeignKey, DateTime, UniqueConstraint, func, Enum as SQLEnum
+from sqlalchemy import (
+    ForeignKey,
+    DateTime,
+    Index,
+    UniqueConstraint,
+    func,
+    Enum as SQLEnum,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .permission import Permission
@@ -46,4 +53,9 @@ class Access(Base):
         "User", foreign_keys=[granted_by], overlaps="granted_accesses"
     )
 
-    __table_args__ = (UniqueConstraint("user_id", "board_id", name="uq_user_board"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "board_id", name="uq_user_board"),
+        # Список участников доски: фильтр по уровню доступа и keyset-пагинация
+        # по (permission, user_id) идут по индексу без сортировки
+        Index("ix_accesses_board_permission_user", "board_id", "permission", "user_id"),
+    )
@@ -4,8 +4,10 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from core.database import Base
+from core.search import SEARCH_CONFIG
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, func
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Computed, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 
 if TYPE_CHECKING:
     from .user import User
@@ -17,7 +19,9 @@ class Board(Base):
     __tablename__ = "boards"
 
     board_id: Mapped[int] = mapped_column("board_id", primary_key=True, index=True)
-    creator_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"), nullable=False)
+    creator_id: Mapped[int] = mapped_column(
+        ForeignKey("users.user_id"), nullable=False, index=True
+    )
     title: Mapped[str | None] = mapped_column(String, nullable=True)
     description: Mapped[str | None] = mapped_column(String, nullable=True)
     background_color: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -31,6 +35,21 @@ class Board(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    # Доска удалена и ждёт очистки фоновой задачей; для API её уже нет
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Документ полнотекстового поиска: совпадение в заголовке весит больше,
+    # чем в описании. Postgres пересчитывает его сам; в ORM не загружается
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # Relationships
     creator: Mapped["User"] = relationship(
@@ -42,3 +61,7 @@ class Board(Base):
     stickers: Mapped[list["Sticker"]] = relationship(
         "Sticker", back_populates="board", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        Index("ix_boards_search_vector", "search_vector", postgresql_using="gin"),
+    )
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from core.database import Base
+from sqlalchemy import DDL, ForeignKey, Index, event, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .access import Access
+from .permission import Permission
+
+
+class EffectivePermission(Base):
+    """
+    Итоговый уровень доступа пользователя к доске: максимум из прямого
+    доступа (accesses) и доступов всех его групп с учётом вложенности.
+
+    Таблица производная и поддерживается core.permissions при каждом
+    изменении доступов, групп и их состава. Проверка прав — одно чтение
+    по первичному ключу, сколько бы уровней вложенности ни было у групп.
+    Владелец доски здесь не хранится.
+    """
+
+    __tablename__ = "effective_permissions"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True
+    )
+    board_id: Mapped[int] = mapped_column(
+        ForeignKey("boards.board_id", ondelete="CASCADE"), primary_key=True
+    )
+    permission: Mapped[Permission] = mapped_column(SQLEnum(Permission), nullable=False)
+
+    __table_args__ = (Index("ix_effective_permissions_board", "board_id"),)
+
+
+# Таблица появляется при старте (core/schema.py) в уже работающей БД: сразу
+# заполняем её прямыми доступами, иначе расшаренные доски пропадут у всех
+EffectivePermission.__table__.add_is_dependent_on(Access.__table__)
+event.listen(
+    EffectivePermission.__table__,
+    "after_create",
+    DDL(
+        "INSERT INTO effective_permissions (user_id, board_id, permission) "
+        "SELECT user_id, board_id, permission FROM accesses"
+    ),
+)
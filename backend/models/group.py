@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from core.database import Base
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    func,
+    Enum as SQLEnum,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .permission import Permission
+
+
+class Group(Base):
+    __tablename__ = "groups"
+
+    group_id: Mapped[int] = mapped_column("group_id", primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    owner_id: Mapped[int] = mapped_column(
+        ForeignKey("users.user_id"),
+        nullable=False,
+        index=True,
+        comment="ID пользователя, управляющего составом группы",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class GroupMember(Base):
+    __tablename__ = "group_members"
+
+    group_id: Mapped[int] = mapped_column(
+        ForeignKey("groups.group_id", ondelete="CASCADE"), primary_key=True
+    )
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True
+    )
+    added_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        # Группы пользователя — отправная точка пересчёта его прав
+        Index("ix_group_members_user", "user_id"),
+    )
+
+
+class GroupNesting(Base):
+    """Вложенная группа: участники child_group_id — участники parent_group_id."""
+
+    __tablename__ = "group_nestings"
+
+    parent_group_id: Mapped[int] = mapped_column(
+        ForeignKey("groups.group_id", ondelete="CASCADE"), primary_key=True
+    )
+    child_group_id: Mapped[int] = mapped_column(
+        ForeignKey("groups.group_id", ondelete="CASCADE"), primary_key=True
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "parent_group_id <> child_group_id", name="ck_group_nestings_not_self"
+        ),
+        # Подъём от группы к родителям при пересчёте прав
+        Index("ix_group_nestings_child", "child_group_id"),
+    )
+
+
+class GroupAccess(Base):
+    __tablename__ = "group_accesses"
+
+    board_id: Mapped[int] = mapped_column(
+        ForeignKey("boards.board_id", ondelete="CASCADE"), primary_key=True
+    )
+    group_id: Mapped[int] = mapped_column(
+        ForeignKey("groups.group_id", ondelete="CASCADE"), primary_key=True
+    )
+    permission: Mapped[Permission] = mapped_column(
+        SQLEnum(Permission),
+        nullable=False,
+        comment="Уровень доступа участников группы: view или edit",
+    )
+    granted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    granted_by: Mapped[int] = mapped_column(
+        ForeignKey("users.user_id"),
+        nullable=False,
+        comment="ID пользователя, предоставившего доступ",
+    )
+
+    __table_args__ = (Index("ix_group_accesses_group", "group_id"),)
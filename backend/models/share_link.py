@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from core.database import Base
+from sqlalchemy import DateTime, ForeignKey, Index, String, func, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .permission import Permission
+
+
+class ShareLink(Base):
+    """
+    Выданная ссылка на доску. Сам токен ссылки подписан и проверяется без
+    БД (core.share_links); таблица нужна для списка ссылок владельца и
+    для отзыва.
+    """
+
+    __tablename__ = "share_links"
+
+    link_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    board_id: Mapped[int] = mapped_column(
+        ForeignKey("boards.board_id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    permission: Mapped[Permission] = mapped_column(SQLEnum(Permission), nullable=False)
+    created_by: Mapped[int] = mapped_column(ForeignKey("users.user_id"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    revoked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Ссылка отозвана и до expires_at входит в deny-list воркеров",
+    )
+
+    __table_args__ = (
+        # Deny-list: отозванные ссылки, срок которых ещё не истёк
+        Index(
+            "ix_share_links_revoked",
+            "expires_at",
+            postgresql_where=revoked_at.is_not(None),
+        ),
+    )
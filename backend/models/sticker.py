@@ -4,8 +4,19 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from core.database import Base
+from core.search import SEARCH_CONFIG
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Float, Integer, ForeignKey, DateTime, func
+from sqlalchemy import (
+    String,
+    Float,
+    Integer,
+    ForeignKey,
+    DateTime,
+    Computed,
+    Index,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 
 if TYPE_CHECKING:
     from .board import Board
@@ -36,9 +47,23 @@ class Sticker(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    # Документ полнотекстового поиска по тексту стикера. Postgres пересчитывает
+    # его при каждой записи строки, а GIN-индекс обновляется инкрементально
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{SEARCH_CONFIG}', coalesce(text, ''))", persisted=True),
+        deferred=True,
+    )
 
     # Relationships
     board: Mapped["Board"] = relationship("Board", back_populates="stickers")
     creator: Mapped["User"] = relationship(
         "User", foreign_keys=[created_by], overlaps="created_stickers"
     )
+
+    __table_args__ = (
+        Index("ix_stickers_search_vector", "search_vector", postgresql_using="gin"),
+        # Стикеры доски по порядку: загрузка доски, подсчёт, порционные
+        # удаление и копирование идут по индексу, а не по всей таблице
+        Index("ix_stickers_board_id_sticker_id", "board_id", "sticker_id"),
+    )
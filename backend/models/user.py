@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from core.database import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, DateTime, func
+from sqlalchemy import String, DateTime, Index, func
 
 if TYPE_CHECKING:
     from .board import Board
@@ -36,3 +36,9 @@ class User(Base):
     created_stickers: Mapped[list["Sticker"]] = relationship(
         "Sticker", foreign_keys="Sticker.created_by"
     )
+
+
+# Поиск логинов по префиксу (подсказки в диалоге выдачи доступа). Порядок
+# COLLATE "C" побайтовый, как у text_pattern_ops, поэтому индекс обслуживает
+# и диапазон login >= prefix AND login < следующий префикс, и ORDER BY login
+Index("ix_users_login_prefix", User.login.collate("C"))
@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class SlowQueryInfo(BaseModel):
+    """Схема статистики медленного запроса."""
+
+    fingerprint: str = Field(
+        ...,
+        description="Отпечаток нормализованного запроса",
+        examples=["3f2a9c1b7d4e5f60"],
+    )
+    statement: str = Field(
+        ...,
+        description="Нормализованный текст запроса",
+        examples=[
+            "SELECT stickers.sticker_id, ... WHERE stickers.board_id = $1::INTEGER"
+        ],
+    )
+    parameterShapes: list[str] = Field(
+        default_factory=list,
+        description="Типы параметров без значений",
+        examples=[["int"]],
+    )
+    calls: int = Field(
+        ..., description="Сколько раз запрос превысил порог", examples=[12]
+    )
+    totalMs: float = Field(..., description="Суммарное время, мс", examples=[8400.5])
+    maxMs: float = Field(..., description="Максимальное время, мс", examples=[1200.0])
+    meanMs: float = Field(..., description="Среднее время, мс", examples=[700.0])
+    lastSeenAt: datetime = Field(
+        ...,
+        description="Когда запрос был медленным последний раз",
+        examples=["2024-01-15T10:30:00Z"],
+    )
+    plan: Any | None = Field(
+        default=None, description="План EXPLAIN (FORMAT JSON), если уже снят"
+    )
+
+
+class SlowQueryListResponse(BaseModel):
+    """Схема ответа со списком самых дорогих медленных запросов."""
+
+    thresholdMs: float | None = Field(
+        ..., description="Текущий порог медленного запроса, мс", examples=[500.0]
+    )
+    queries: list[SlowQueryInfo] = Field(
+        ..., description="Запросы по убыванию суммарного времени"
+    )
+
+
+class ProfileInfo(BaseModel):
+    """Схема описания профиля запроса."""
+
+    profileId: str = Field(
+        ..., description="ID профиля", examples=["4f1c2e9a0b7d4c3e8a6f5b2d1c0e9f8a"]
+    )
+    method: str = Field(..., description="HTTP-метод запроса", examples=["PATCH"])
+    path: str = Field(
+        ..., description="Путь запроса", examples=["/api/v1/boards/1/stickers/5"]
+    )
+    statusCode: int = Field(..., description="Статус ответа", examples=[200])
+    durationMs: float = Field(
+        ..., description="Длительность запроса, мс", examples=[48.2]
+    )
+    samples: int = Field(..., description="Число снятых стеков", examples=[24])
+    intervalMs: float = Field(
+        ..., description="Интервал сэмплирования, мс", examples=[2.0]
+    )
+    createdAt: datetime = Field(
+        ..., description="Когда снят профиль", examples=["2024-01-15T10:30:00Z"]
+    )
+
+
+class ProfileListResponse(BaseModel):
+    """Схема ответа со списком профилей."""
+
+    profiles: list[ProfileInfo] = Field(..., description="Профили, новые первыми")
@@ -204,6 +204,11 @@ class BoardUpdate(BaseModel):
         description="Обновленный цвет фона доски (hex формат)",
         examples=["#F0F0F0"],
     )
+    isPublic: bool | None = Field(
+        default=None,
+        description="Доска доступна всем без входа (менять может только владелец)",
+        examples=[True],
+    )
 
     @field_validator("backgroundColor")
     @classmethod
@@ -211,3 +216,36 @@ class BoardUpdate(BaseModel):
         if v is not None and not v.startswith("#"):
             raise ValueError("Background color must be in hex format (e.g., #FFFFFF)")
         return v
+
+
+class BoardDuplicate(BaseModel):
+    """Схема запроса на копирование доски."""
+
+    title: str | None = Field(
+        default=None,
+        min_length=1,
+        max_length=200,
+        description="Название копии (по умолчанию — название исходной доски с пометкой «копия»)",
+        examples=["Проектирование системы (копия)"],
+    )
+    offsetX: float = Field(
+        default=0, description="Сдвиг стикеров копии по X", examples=[0]
+    )
+    offsetY: float = Field(
+        default=0, description="Сдвиг стикеров копии по Y", examples=[0]
+    )
+    stickerIds: list[int] | None = Field(
+        default=None,
+        max_length=10000,
+        description="Копировать только эти стикеры (по умолчанию — все)",
+        examples=[[1, 2, 3]],
+    )
+
+
+class BoardImportResponse(BaseModel):
+    """Схема ответа на импорт доски."""
+
+    board: BoardResponse = Field(..., description="Созданная доска")
+    stickersImported: int = Field(
+        ..., description="Сколько стикеров импортировано", examples=[12000]
+    )
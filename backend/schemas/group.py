@@ -0,0 +1,82 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class GroupCreate(BaseModel):
+    """Схема запроса на создание группы."""
+
+    name: str = Field(
+        ...,
+        min_length=1,
+        max_length=255,
+        description="Название группы",
+        examples=["Отдел продаж"],
+    )
+
+    @field_validator("name")
+    @classmethod
+    def validate_name(cls, v: str) -> str:
+        if not v.strip():
+            raise ValueError("Name cannot be empty")
+        return v.strip()
+
+
+class GroupResponse(BaseModel):
+    """Схема группы."""
+
+    groupId: int = Field(..., description="ID группы", examples=[3])
+    name: str = Field(..., description="Название группы", examples=["Отдел продаж"])
+    ownerId: int = Field(
+        ..., description="ID пользователя, управляющего группой", examples=[1]
+    )
+    createdAt: datetime = Field(
+        ..., description="Дата и время создания", examples=["2024-01-15T10:30:00Z"]
+    )
+
+
+class GroupListResponse(BaseModel):
+    """Схема ответа со списком групп пользователя."""
+
+    groups: list[GroupResponse] = Field(..., description="Группы по возрастанию ID")
+
+
+class GroupMemberInfo(BaseModel):
+    """Участник группы."""
+
+    userId: int = Field(..., description="ID пользователя", examples=[2])
+    userLogin: str = Field(
+        ..., description="Логин пользователя", examples=["user2@example.com"]
+    )
+
+
+class SubgroupInfo(BaseModel):
+    """Вложенная группа."""
+
+    groupId: int = Field(..., description="ID группы", examples=[4])
+    name: str = Field(..., description="Название группы", examples=["Стажёры"])
+
+
+class GroupDetailResponse(GroupResponse):
+    """Схема группы с прямыми участниками и вложенными группами."""
+
+    members: list[GroupMemberInfo] = Field(
+        ..., description="Участники группы (без участников вложенных групп)"
+    )
+    subgroups: list[SubgroupInfo] = Field(
+        ..., description="Группы, вложенные в эту напрямую"
+    )
+
+
+class GroupMemberRequest(BaseModel):
+    """Схема запроса на добавление или удаление участника группы."""
+
+    userLogin: str = Field(
+        ..., description="Логин пользователя", examples=["user2@example.com"]
+    )
+
+
+class SubgroupRequest(BaseModel):
+    """Схема запроса на вложение группы."""
+
+    groupId: int = Field(..., description="ID вкладываемой группы", examples=[4])
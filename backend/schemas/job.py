@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class JobResponse(BaseModel):
+    """Схема состояния фоновой задачи."""
+
+    jobId: int = Field(..., description="ID задачи", examples=[42])
+    kind: str = Field(..., description="Вид задачи", examples=["board.delete"])
+    status: str = Field(
+        ...,
+        description="Состояние: queued, running, succeeded или failed",
+        examples=["running"],
+    )
+    progressDone: int = Field(
+        ..., description="Сколько единиц работы выполнено", examples=[15000]
+    )
+    progressTotal: int | None = Field(
+        default=None,
+        description="Сколько всего единиц работы (null — ещё неизвестно)",
+        examples=[500000],
+    )
+    attempts: int = Field(..., description="Номер текущей попытки", examples=[1])
+    result: dict[str, Any] | None = Field(
+        default=None,
+        description="Результат успешной задачи",
+        examples=[{"boardId": 7, "stickersDeleted": 500000}],
+    )
+    error: str | None = Field(
+        default=None, description="Ошибка последней неудачной попытки"
+    )
+    createdAt: datetime = Field(
+        ..., description="Когда задача поставлена", examples=["2024-01-15T10:30:00Z"]
+    )
+    startedAt: datetime | None = Field(
+        default=None, description="Когда задача начала выполняться"
+    )
+    finishedAt: datetime | None = Field(
+        default=None, description="Когда задача завершилась"
+    )
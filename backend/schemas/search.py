@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+
+
+class StickerSearchHit(BaseModel):
+    """Найденный стикер."""
+
+    stickerId: int = Field(..., description="ID стикера", examples=[101])
+    boardId: int = Field(..., description="ID доски стикера", examples=[7])
+    boardTitle: str = Field(..., description="Название доски", examples=["Финансы"])
+    snippet: str = Field(
+        ...,
+        description="Фрагмент текста стикера: HTML, совпадения выделены <mark>",
+        examples=["Согласовать <mark>бюджет</mark> на Q3 с отделом продаж"],
+    )
+
+
+class StickerSearchResponse(BaseModel):
+    """Схема страницы результатов поиска по стикерам."""
+
+    results: list[StickerSearchHit] = Field(
+        default_factory=list, description="Стикеры по убыванию релевантности"
+    )
+    nextCursor: str | None = Field(
+        default=None,
+        description="Курсор следующей страницы (null — страница последняя)",
+    )
@@ -1,9 +1,22 @@
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
+from core.config import settings
 from models.permission import Permission
 
+# Логинов в одном пакетном запросе выдачи или отзыва доступа
+SHARE_BATCH_MAX_USERS = 500
+
+
+def _reject_duplicate_logins(logins: list[str]) -> None:
+    seen = set()
+    for login in logins:
+        if login in seen:
+            raise ValueError(f"Login {login} is listed more than once")
+        seen.add(login)
+
 
 class ShareRequest(BaseModel):
     """Схема запроса на предоставление доступа."""
@@ -36,6 +49,11 @@ class ShareResponse(BaseModel):
     grantedBy: int = Field(
         ..., description="ID пользователя, предоставившего доступ", examples=[1]
     )
+    created: bool = Field(
+        ...,
+        description="true — доступ выдан впервые, false — обновлён существующий",
+        examples=[True],
+    )
 
 
 class ShareInfo(BaseModel):
@@ -62,6 +80,16 @@ class ShareListResponse(BaseModel):
 
     boardId: int = Field(..., description="ID доски", examples=[1])
     shares: list[ShareInfo] = Field(..., description="Список пользователей с доступом")
+    nextCursor: str | None = Field(
+        default=None,
+        description="Курсор следующей страницы (null — страница последняя)",
+    )
+    total: int | None = Field(
+        default=None,
+        description="Сколько всего пользователей подходит под фильтры "
+        "(только при includeTotal=true)",
+        examples=[1250],
+    )
 
 
 class RevokeShareRequest(BaseModel):
@@ -72,3 +100,171 @@ class RevokeShareRequest(BaseModel):
         description="Логин пользователя, у которого отзывается доступ",
         examples=["user2@example.com"],
     )
+
+
+class ShareBatchRequest(BaseModel):
+    """Схема запроса на пакетную выдачу доступа."""
+
+    shares: list[ShareRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=SHARE_BATCH_MAX_USERS,
+        description="Пользователи и уровни доступа; логины не повторяются",
+    )
+
+    @field_validator("shares")
+    @classmethod
+    def validate_unique_logins(cls, v: list[ShareRequest]) -> list[ShareRequest]:
+        _reject_duplicate_logins([share.userLogin for share in v])
+        return v
+
+
+class RevokeShareBatchRequest(BaseModel):
+    """Схема запроса на пакетный отзыв доступа."""
+
+    userLogins: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=SHARE_BATCH_MAX_USERS,
+        description="Логины пользователей, у которых отзывается доступ",
+        examples=[["user2@example.com", "user3@example.com"]],
+    )
+
+    @field_validator("userLogins")
+    @classmethod
+    def validate_unique_logins(cls, v: list[str]) -> list[str]:
+        _reject_duplicate_logins(v)
+        return v
+
+
+class ShareBatchResult(BaseModel):
+    """Итог пакетной операции для одного логина."""
+
+    userLogin: str = Field(
+        ..., description="Логин из запроса", examples=["user2@example.com"]
+    )
+    status: Literal[
+        "created", "updated", "revoked", "user_not_found", "not_shared", "owner"
+    ] = Field(
+        ...,
+        description="created/updated — доступ выдан или изменён, revoked — отозван, "
+        "user_not_found — нет такого пользователя, not_shared — доступа и не было, "
+        "owner — пользователь владеет доской",
+        examples=["created"],
+    )
+    userId: int | None = Field(
+        default=None, description="ID пользователя, если он найден", examples=[2]
+    )
+    permission: Permission | None = Field(
+        default=None,
+        description="Уровень доступа после выдачи",
+        examples=[Permission.EDIT],
+    )
+    grantedAt: datetime | None = Field(
+        default=None,
+        description="Дата и время выдачи доступа",
+        examples=["2024-01-15T10:30:00Z"],
+    )
+
+
+class ShareBatchResponse(BaseModel):
+    """Схема ответа пакетной операции с доступами."""
+
+    boardId: int = Field(..., description="ID доски", examples=[1])
+    results: list[ShareBatchResult] = Field(
+        ..., description="Итоги по каждому логину в порядке запроса"
+    )
+
+
+class GroupShareRequest(BaseModel):
+    """Схема запроса на предоставление доступа группе."""
+
+    groupId: int = Field(..., description="ID группы", examples=[3])
+    permission: Permission = Field(
+        ...,
+        description="Уровень доступа участников группы: view или edit",
+        examples=[Permission.VIEW],
+    )
+
+
+class GroupShareInfo(BaseModel):
+    """Схема информации о доступе группы к доске."""
+
+    groupId: int = Field(..., description="ID группы", examples=[3])
+    groupName: str = Field(..., description="Название группы", examples=["Продажи"])
+    permission: Permission = Field(
+        ..., description="Уровень доступа", examples=[Permission.VIEW]
+    )
+    grantedAt: datetime = Field(
+        ...,
+        description="Дата и время предоставления доступа",
+        examples=["2024-01-15T10:30:00Z"],
+    )
+
+
+class GroupShareResponse(GroupShareInfo):
+    """Схема ответа при предоставлении доступа группе."""
+
+    boardId: int = Field(..., description="ID доски", examples=[1])
+    created: bool = Field(
+        ...,
+        description="true — доступ выдан впервые, false — обновлён существующий",
+        examples=[True],
+    )
+
+
+class GroupShareListResponse(BaseModel):
+    """Схема ответа со списком групп с доступом."""
+
+    boardId: int = Field(..., description="ID доски", examples=[1])
+    groups: list[GroupShareInfo] = Field(..., description="Группы с доступом")
+
+
+class ShareLinkCreate(BaseModel):
+    """Схема запроса на создание ссылки на доску."""
+
+    permission: Literal["view"] = Field(
+        default="view",
+        description="Уровень доступа по ссылке; изменять доску можно только после входа",
+        examples=["view"],
+    )
+    expiresInSeconds: int = Field(
+        default=settings.SHARE_LINK_DEFAULT_TTL_SECONDS,
+        ge=60,
+        le=settings.SHARE_LINK_MAX_TTL_SECONDS,
+        description="Через сколько секунд ссылка перестанет действовать",
+        examples=[604800],
+    )
+
+
+class ShareLinkInfo(BaseModel):
+    """Схема ссылки на доску."""
+
+    linkId: str = Field(
+        ..., description="ID ссылки", examples=["3f2b9c0e1a7d4e5f8a6b2c1d0e9f8a7b"]
+    )
+    token: str = Field(
+        ...,
+        description="Токен для параметра link в GET /boards/{board_id}",
+        examples=["WyIzZjJiIiwxLCJ2aWV3IiwxNzA1MzE0MjAwXQ.c2lnbmF0dXJl"],
+    )
+    permission: Permission = Field(
+        ..., description="Уровень доступа по ссылке", examples=[Permission.VIEW]
+    )
+    createdAt: datetime = Field(
+        ...,
+        description="Дата и время создания ссылки",
+        examples=["2024-01-15T10:30:00Z"],
+    )
+    expiresAt: datetime = Field(
+        ...,
+        description="Дата и время, когда ссылка перестанет действовать",
+        examples=["2024-01-22T10:30:00Z"],
+    )
+
+
+class ShareLinkListResponse(BaseModel):
+    """Схема ответа со списком действующих ссылок на доску."""
+
+    boardId: int = Field(..., description="ID доски", examples=[1])
+    links: list[ShareLinkInfo] = Field(..., description="Ссылки по дате создания")
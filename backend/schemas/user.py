@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class UserBase(BaseModel):
@@ -13,3 +13,18 @@ class User(UserBase):
     id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class UserLookupItem(BaseModel):
+    """Подсказка пользователя по началу логина."""
+
+    userId: int = Field(..., description="ID пользователя", examples=[2])
+    login: str = Field(..., description="Логин", examples=["user2@example.com"])
+
+
+class UserLookupResponse(BaseModel):
+    """Схема ответа с подсказками пользователей."""
+
+    users: list[UserLookupItem] = Field(
+        ..., description="Пользователи по возрастанию логина"
+    )
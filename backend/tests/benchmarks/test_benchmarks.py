@@ -0,0 +1,61 @@
+import pytest
+
+from benchmarks.dataset import DatasetConfig, generate_dataset
+from benchmarks.import_throughput import _body
+from benchmarks.report import compare, percentile, summarize
+from benchmarks.workload import Sample
+from core.streaming_json import iter_json_array, iter_ndjson
+
+
+def test_dataset_is_deterministic_and_heavy_tailed():
+    """Один seed даёт один набор; стикеры распределены с длинным хвостом."""
+    config = DatasetConfig(users=50, boards=2000, max_stickers=1000, seed=7)
+    first = generate_dataset(config)
+    second = generate_dataset(config)
+
+    assert [(b.owner, b.stickers, b.shares) for b in first.boards] == [
+        (b.owner, b.stickers, b.shares) for b in second.boards
+    ]
+
+    counts = sorted(board.stickers for board in first.boards)
+    median = counts[len(counts) // 2]
+    assert counts[-1] <= config.max_stickers
+    assert counts[-1] > 20 * max(median, 1)
+    assert all(board.owner not in board.shares for board in first.boards)
+
+
+def test_percentile_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.99) == 0.0
+
+
+def test_compare_flags_regressions():
+    """Рост p95 сверх допуска и новые ошибки считаются регрессией."""
+    baseline = summarize(
+        [Sample("GET /boards", 200, 0.010, True) for _ in range(100)], 1.0
+    )
+    slower = summarize(
+        [Sample("GET /boards", 200, 0.020, True) for _ in range(99)]
+        + [Sample("GET /boards", 500, 0.020, False)],
+        1.0,
+    )
+
+    rows = {row["endpoint"]: row for row in compare(slower, baseline, tolerance=0.1)}
+
+    assert rows["GET /boards"]["regressions"] == ["p95", "errors"]
+    assert compare(baseline, baseline, tolerance=0.1)[0]["regressions"] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fmt, splitter", [("ndjson", iter_ndjson), ("json", iter_json_array)]
+)
+async def test_import_body_is_valid_stream(fmt, splitter):
+    """Сгенерированное тело импорта разбирается на доску и все стикеры."""
+    records = [record async for record in splitter(_body(1234, fmt), 4096)]
+
+    assert len(records) == 1235
@@ -9,6 +9,7 @@ from sqlalchemy.pool import NullPool
 from main import app
 from api.deps import get_db
 from core.config import settings
+from core.query_stats import collect_query_stats, instrument_engine
 
 # Для тестов используем localhost вместо postgres (для Docker)
 # Можно переопределить через переменную окружения TEST_DATABASE_URL
@@ -26,6 +27,7 @@ engine = create_async_engine(
     echo=False,
     poolclass=NullPool,  # Не используем пул для тестов
 )
+instrument_engine(engine.sync_engine)
 TestingSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -77,3 +79,43 @@ def random_login():
 def random_password():
     """Генерирует пароль для тестов."""
     return f"TestPass_{uuid.uuid4().hex[:8]}!"
+
+
+@pytest.fixture
+def count_queries():
+    """
+    Считает SQL-запросы внутри блока with.
+
+    Пример:
+        with count_queries() as stats:
+            await client.get(...)
+        assert stats.count <= 3
+    """
+    return collect_query_stats
+
+
+@pytest.fixture
+def register_and_login(client: AsyncClient):
+    """
+    Регистрирует нового пользователя и входит им.
+    Возвращает логин и заголовки с токеном.
+
+    Пример:
+        login, headers = await register_and_login()
+        await client.get("/api/v1/boards", headers=headers)
+    """
+
+    async def register(login: str | None = None) -> tuple[str, dict]:
+        login = login or f"test_{uuid.uuid4().hex[:8]}@example.com"
+        password = f"TestPass_{uuid.uuid4().hex[:8]}!"
+        response = await client.post(
+            "/api/v1/auth/register", json={"login": login, "password": password}
+        )
+        assert response.status_code == 201, response.text
+        response = await client.post(
+            "/api/v1/auth/login", json={"login": login, "password": password}
+        )
+        assert response.status_code == 200, response.text
+        return login, {"Authorization": f"Bearer {response.json()['token']}"}
+
+    return register
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from core.admission import (
+    DEFAULT,
+    HEAVY,
+    INTERACTIVE,
+    AdmissionController,
+    classify_request,
+)
+
+
+def test_classify_request():
+    assert classify_request("GET", "/metrics", b"") is None
+    assert classify_request("GET", "/api/v1/boards/5", b"") == (INTERACTIVE, "board")
+    assert classify_request("PATCH", "/api/v1/boards/5/stickers/7", b"") == (
+        INTERACTIVE,
+        "sticker_write",
+    )
+    assert classify_request("POST", "/api/v1/boards/5/stickers", b"") == (
+        INTERACTIVE,
+        "sticker_write",
+    )
+    assert classify_request("POST", "/api/v1/boards/import", b"") == (
+        HEAVY,
+        "board_import",
+    )
+    assert classify_request("GET", "/api/v1/boards", b"") == (HEAVY, "board_list")
+    assert classify_request("GET", "/api/v1/boards", b"filter=my") == (DEFAULT, None)
+    assert classify_request("POST", "/api/v1/auth/login", b"") == (DEFAULT, None)
+
+
+@pytest.mark.asyncio
+async def test_freed_slot_goes_to_highest_priority_waiter():
+    """Освободившийся слот получает интерактивный запрос, а не более ранний тяжёлый."""
+    controller = AdmissionController(1, {}, max_queue=10, queue_timeout=1.0)
+    assert await controller.acquire(DEFAULT) is None
+
+    order = []
+
+    async def wait(request_class: str) -> None:
+        assert await controller.acquire(request_class) is None
+        order.append(request_class)
+        controller.release(request_class)
+
+    heavy = asyncio.create_task(wait(HEAVY))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(wait(INTERACTIVE))
+    await asyncio.sleep(0)
+
+    controller.release(DEFAULT)
+    await asyncio.gather(heavy, interactive)
+
+    assert order == [INTERACTIVE, HEAVY]
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_class_limit_does_not_block_other_classes():
+    controller = AdmissionController(10, {HEAVY: 1}, max_queue=10, queue_timeout=0.05)
+    assert await controller.acquire(HEAVY) is None
+
+    assert await controller.acquire(HEAVY) == "timeout"
+    assert await controller.acquire(INTERACTIVE) is None
+    assert controller.class_in_flight[HEAVY] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_immediately():
+    controller = AdmissionController(1, {}, max_queue=1, queue_timeout=1.0)
+    assert await controller.acquire(DEFAULT) is None
+    waiter = asyncio.create_task(controller.acquire(DEFAULT))
+    await asyncio.sleep(0)
+
+    assert await controller.acquire(DEFAULT) == "queue_full"
+
+    controller.release(DEFAULT)
+    assert await waiter is None
+    assert controller.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    controller = AdmissionController(1, {}, max_queue=10, queue_timeout=1.0)
+    assert await controller.acquire(DEFAULT) is None
+    waiter = asyncio.create_task(controller.acquire(DEFAULT))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    controller.release(DEFAULT)
+    assert controller.in_flight == 0
+    assert controller._waiters == []
+
+
+@pytest.mark.asyncio
+async def test_route_limit_leaves_class_slots_to_other_routes():
+    """Исчерпавший свой лимит маршрут не занимает остальные слоты класса."""
+    controller = AdmissionController(
+        10,
+        {HEAVY: 3},
+        max_queue=10,
+        queue_timeout=0.05,
+        route_limits={"board_import": 1},
+    )
+    assert await controller.acquire(HEAVY, "board_import") is None
+
+    assert await controller.acquire(HEAVY, "board_import") == "timeout"
+    assert await controller.acquire(HEAVY, "board_list") is None
+    assert controller.route_in_flight["board_import"] == 1
+
+    waiter = asyncio.create_task(controller.acquire(HEAVY, "board_import"))
+    await asyncio.sleep(0)
+    controller.release(HEAVY, "board_import")
+    assert await waiter is None
+    assert controller.route_in_flight["board_import"] == 1
+    assert controller.class_in_flight[HEAVY] == 2
@@ -0,0 +1,31 @@
+from core import board_versions
+from core.board_versions import board_version, bump_board_version
+from core.config import settings
+
+
+def test_versions_are_bounded_and_never_repeat(monkeypatch):
+    """Вытесненная доска получает новую версию, а не одну из прежних."""
+    monkeypatch.setattr(settings, "BOARD_VERSIONS_MAX_ENTRIES", 2)
+    monkeypatch.setattr(board_versions, "_versions", board_versions.OrderedDict())
+    monkeypatch.setattr(
+        board_versions, "_untracked_version", board_versions._untracked_version
+    )
+    seen = {board_version(1)}
+
+    bump_board_version(1)
+    seen.add(board_version(1))
+    bump_board_version(2)
+    bump_board_version(1)
+    seen.add(board_version(1))
+    assert len(seen) == 3
+
+    bump_board_version(3)
+    assert list(board_versions._versions) == [1, 3]
+    assert board_version(2) not in seen | {board_version(1), board_version(3)}
+    untracked = board_version(4)
+    assert board_version(4) == untracked
+
+    bump_board_version(4)
+    assert board_version(1) not in seen
+    assert board_version(1) == board_version(2)
+    assert board_version(4) != untracked
@@ -0,0 +1,28 @@
+from core import cache
+from core.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+    ttl_cache: TTLCache[int] = TTLCache("test_ttl", max_entries=10, ttl=5)
+
+    ttl_cache.set("a", 1)
+    assert ttl_cache.get("a") == 1
+
+    now += 5
+    assert ttl_cache.get("a") is None
+    assert len(ttl_cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    ttl_cache: TTLCache[int] = TTLCache("test_lru", max_entries=2, ttl=60)
+
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("c") == 3
@@ -0,0 +1,18 @@
+import pytest
+
+from core.cursor import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(0.1, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, float, int) == (0.1, 42)
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not-a-cursor", encode_cursor(1.0), encode_cursor("x", 1), "e30"]
+)
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, float, int)
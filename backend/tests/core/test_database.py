@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+from sqlalchemy.util.queue import Empty
+
+from core.database import (
+    DB_POOL_CHECKOUT_SECONDS,
+    DB_POOL_TIMEOUTS,
+    InstrumentedQueuePool,
+)
+
+
+class FakeConnection:
+    def rollback(self):
+        return None
+
+    def close(self):
+        return None
+
+
+def make_pool(max_overflow: int) -> InstrumentedQueuePool:
+    return InstrumentedQueuePool(
+        FakeConnection, pool_size=1, max_overflow=max_overflow, timeout=0.01
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_timeout_is_counted():
+    """Исключение пула SQLAlchemy — не встроенный TimeoutError, но учитывается."""
+    pool = make_pool(max_overflow=0)
+    held = await greenlet_spawn(pool.connect)
+    timeouts = DB_POOL_TIMEOUTS.value
+    checkouts = DB_POOL_CHECKOUT_SECONDS.count
+
+    with pytest.raises(PoolTimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    assert DB_POOL_TIMEOUTS.value == timeouts + 1
+    assert DB_POOL_CHECKOUT_SECONDS.count == checkouts + 1
+    await greenlet_spawn(held.close)
+
+
+@pytest.mark.asyncio
+async def test_pool_retry_is_observed_once():
+    """Повторный заход базового _do_get при переполнении не дублирует замер."""
+    pool = make_pool(max_overflow=1)
+    await greenlet_spawn(lambda: pool.connect().close())
+    queue_get = pool._pool.get
+
+    def lose_race(block, timeout):
+        # Пока очередь была пуста, другой запрос занял последнее место
+        # переполнения: базовый пул уходит на второй круг
+        pool._pool.get = queue_get
+        pool._overflow = pool._max_overflow
+        raise Empty()
+
+    pool._pool.get = lose_race
+    checkouts = DB_POOL_CHECKOUT_SECONDS.count
+
+    connection = await greenlet_spawn(pool.connect)
+
+    assert pool._pool.get is queue_get
+    assert DB_POOL_CHECKOUT_SECONDS.count == checkouts + 1
+    await greenlet_spawn(connection.close)
@@ -0,0 +1,33 @@
+import gzip
+
+from core.http_cache import CachedBody, accepts_gzip, etag_matches
+
+
+def test_cached_body_is_deterministic():
+    first = CachedBody.render(b'{"boardId": 1}')
+    second = CachedBody.render(b'{"boardId": 1}')
+
+    assert first == second
+    assert gzip.decompress(first.gzip_body) == first.body
+    assert first.etag != first.gzip_etag
+    assert CachedBody.render(b'{"boardId": 2}').etag != first.etag
+
+
+def test_accepts_gzip_respects_quality():
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("br;q=1.0, gzip;q=0.5")
+    assert accepts_gzip("*")
+    assert not accepts_gzip(None)
+    assert not accepts_gzip("identity")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("*, gzip;q=0")
+
+
+def test_etag_matches_list_and_weak_tags():
+    etag = '"abc"'
+
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"other", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"abc-gzip"', etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,58 @@
+import pytest
+
+from core import idempotency
+from core.idempotency import IdempotencyStore, StoredResponse
+
+RESPONSE = StoredResponse(201, [(b"content-type", b"application/json")], b"{}")
+
+
+@pytest.mark.asyncio
+async def test_stored_response_expires_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(idempotency.time, "monotonic", lambda: now[0])
+    store = IdempotencyStore(max_entries=10, ttl=60)
+
+    entry = store.start(("1", "/boards", b"key"), b"fp")
+    assert store.get(("1", "/boards", b"key")) is entry
+    store.finish(("1", "/boards", b"key"), entry, RESPONSE)
+    assert await entry.future is RESPONSE
+
+    now[0] += 59
+    assert store.get(("1", "/boards", b"key")) is entry
+    now[0] += 1
+    assert store.get(("1", "/boards", b"key")) is None
+
+
+@pytest.mark.asyncio
+async def test_failed_original_frees_key_and_store_is_bounded():
+    store = IdempotencyStore(max_entries=2, ttl=60)
+
+    failed = store.start(("1", "/boards", b"a"), b"fp")
+    store.finish(("1", "/boards", b"a"), failed, None)
+    assert await failed.future is None
+    assert store.get(("1", "/boards", b"a")) is None
+
+    for name in (b"a", b"b", b"c"):
+        store.finish(
+            ("1", "/boards", name), store.start(("1", "/boards", name), b""), RESPONSE
+        )
+    assert store.get(("1", "/boards", b"a")) is None
+    assert store.get(("1", "/boards", b"c")) is not None
+
+
+@pytest.mark.asyncio
+async def test_in_flight_original_is_never_evicted():
+    """Выполняющийся оригинал не вытесняется: иначе его повтор создал бы дубликат."""
+    store = IdempotencyStore(max_entries=2, ttl=60)
+    running = store.start(("1", "/boards", b"running"), b"")
+    done = store.start(("1", "/boards", b"done"), b"")
+    store.finish(("1", "/boards", b"done"), done, RESPONSE)
+
+    fresh = store.start(("1", "/boards", b"fresh"), b"")
+    assert fresh is not None
+    assert store.get(("1", "/boards", b"running")) is running
+    assert store.get(("1", "/boards", b"done")) is None
+
+    assert store.start(("1", "/boards", b"overflow"), b"") is None
+    assert store.get(("1", "/boards", b"running")) is running
+    assert store.get(("1", "/boards", b"fresh")) is fresh
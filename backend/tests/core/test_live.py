@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from core.live import LIVE_FRAMES_DROPPED, LIVE_RESYNCS, RESYNC_FRAME, BoardHub
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_to_board_subscribers():
+    """Событие получают только подписчики своей доски."""
+    hub = BoardHub(queue_size=4)
+    first = hub.subscribe(1)
+    second = hub.subscribe(1)
+    other = hub.subscribe(2)
+
+    hub.publish(1, {"type": "sticker.deleted", "stickerId": 10})
+
+    assert json.loads(first.queue.get_nowait())["stickerId"] == 10
+    assert json.loads(second.queue.get_nowait())["stickerId"] == 10
+    assert other.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_switched_to_resync():
+    """Переполненная очередь сбрасывается и заменяется одним кадром resync."""
+    hub = BoardHub(queue_size=3)
+    slow = hub.subscribe(1)
+    fast = hub.subscribe(1)
+    dropped_before = LIVE_FRAMES_DROPPED.value
+    resyncs_before = LIVE_RESYNCS.value
+
+    for i in range(3):
+        hub.publish(1, {"type": "sticker.deleted", "stickerId": i})
+        fast.queue.get_nowait()
+    hub.publish(1, {"type": "sticker.deleted", "stickerId": 3})
+
+    assert slow.queue.qsize() == 1
+    assert slow.queue.get_nowait() == RESYNC_FRAME
+    assert json.loads(fast.queue.get_nowait())["stickerId"] == 3
+    assert LIVE_FRAMES_DROPPED.value - dropped_before == 4
+    assert LIVE_RESYNCS.value - resyncs_before == 1
+
+    # После resync подписчик снова получает изменения
+    hub.publish(1, {"type": "sticker.deleted", "stickerId": 4})
+    assert json.loads(slow.queue.get_nowait())["stickerId"] == 4
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_releases_board():
+    """После отписки доска без подписчиков удаляется из хаба."""
+    hub = BoardHub(queue_size=4)
+    subscriber = hub.subscribe(1)
+    assert hub.connection_count() == 1
+
+    hub.unsubscribe(subscriber)
+
+    assert hub.connection_count() == 0
+    assert hub.queued_frames() == 0
@@ -0,0 +1,46 @@
+import pytest
+
+from core.metrics import Counter, Gauge, Histogram, render_text
+
+
+def test_labeled_histogram_renders_cumulative_buckets():
+    """Корзины выдаются накопительно, метки маршрута идут перед le."""
+    histogram = Histogram(
+        "test_route_seconds",
+        "Test histogram",
+        buckets=(0.1, 1.0),
+        labelnames=("method", "route"),
+    )
+    child = histogram.labels("GET", "/boards/{board_id}")
+    child.observe(0.05)
+    child.observe(0.5)
+    child.observe(5.0)
+
+    assert histogram.labels("GET", "/boards/{board_id}") is child
+    assert render_text([histogram]).splitlines() == [
+        "# HELP test_route_seconds Test histogram",
+        "# TYPE test_route_seconds histogram",
+        'test_route_seconds_bucket{method="GET",route="/boards/{board_id}",le="0.1"} 1',
+        'test_route_seconds_bucket{method="GET",route="/boards/{board_id}",le="1"} 2',
+        'test_route_seconds_bucket{method="GET",route="/boards/{board_id}",le="+Inf"} 3',
+        'test_route_seconds_sum{method="GET",route="/boards/{board_id}"} 5.55',
+        'test_route_seconds_count{method="GET",route="/boards/{board_id}"} 3',
+    ]
+
+
+def test_counter_and_gauge_render():
+    counter = Counter("test_events_total", "Test counter", labelnames=("kind",))
+    counter.labels('say "hi"').inc(2)
+    gauge = Gauge("test_depth", "Test gauge", callback=lambda: 7)
+
+    assert render_text([counter, gauge]).splitlines()[2::3] == [
+        'test_events_total{kind="say \\"hi\\""} 2',
+        "test_depth 7",
+    ]
+
+
+def test_labels_arity_is_checked():
+    counter = Counter("test_arity_total", "Test counter", labelnames=("a", "b"))
+
+    with pytest.raises(ValueError):
+        counter.labels("only-one")
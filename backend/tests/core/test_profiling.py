@@ -0,0 +1,24 @@
+from core.config import settings
+from core.profiling import ProfileStore
+
+
+def test_rate_limit_and_concurrency(monkeypatch):
+    """Профилирование ограничено числом в минуту и одновременных запросов."""
+    monkeypatch.setattr(settings, "PROFILE_MAX_PER_MINUTE", 2)
+    monkeypatch.setattr(settings, "PROFILE_MAX_CONCURRENT", 1)
+    store = ProfileStore()
+
+    assert store.try_acquire()
+    assert not store.try_acquire()
+    store.release()
+    assert store.try_acquire()
+    store.release()
+    assert not store.try_acquire()
+
+
+def test_read_rejects_foreign_paths(monkeypatch, tmp_path):
+    """Id профиля не может указывать за пределы PROFILE_DIR."""
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path / "profiles"))
+    (tmp_path / "secret.collapsed").write_text("secret 1\n")
+
+    assert ProfileStore().read("../secret") is None
@@ -0,0 +1,73 @@
+import pytest
+
+from core import rate_limit
+from core.rate_limit import BucketLimit, MemoryRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_refills(clock):
+    """Сверх запаса запросы отклоняются, пока корзина не пополнится."""
+    limiter = MemoryRateLimiter(max_keys=10)
+    limit = BucketLimit(rate=2.0, burst=3)
+
+    results = [await limiter.consume("user:1", limit) for _ in range(4)]
+
+    assert [result.allowed for result in results] == [True, True, True, False]
+    assert results[2].remaining == 0
+    assert results[3].retry_after == pytest.approx(0.5)
+
+    clock[0] += 0.5
+    assert (await limiter.consume("user:1", limit)).allowed
+    assert not (await limiter.consume("user:1", limit)).allowed
+
+    clock[0] += 60
+    assert (await limiter.consume("user:1", limit)).remaining == 2
+
+
+@pytest.mark.asyncio
+async def test_keys_are_independent_and_bounded(clock):
+    limiter = MemoryRateLimiter(max_keys=2)
+    limit = BucketLimit(rate=1.0, burst=1)
+
+    assert (await limiter.consume("user:1", limit)).allowed
+    assert (await limiter.consume("user:2", limit)).allowed
+    assert not (await limiter.consume("user:1", limit)).allowed
+
+    # Новая корзина вытесняет дольше всех не использованную (user:2)
+    assert (await limiter.consume("user:3", limit)).allowed
+    assert len(limiter._buckets) == 2
+    assert (await limiter.consume("user:2", limit)).allowed
+
+
+@pytest.mark.asyncio
+async def test_consume_all_spends_nothing_when_any_bucket_is_empty(clock):
+    """Пустая корзина отклоняет запрос, не расходуя остальные."""
+    limiter = MemoryRateLimiter(max_keys=10)
+    limit = BucketLimit(rate=1.0, burst=2)
+
+    await limiter.consume("board:1", limit)
+    await limiter.consume("board:1", limit)
+    results = await limiter.consume_all([("user:1", limit), ("board:1", limit)])
+
+    assert [result.allowed for result in results] == [True, False]
+    assert (await limiter.check("user:1", limit)).remaining == 2
+    assert (await limiter.consume("user:1", limit)).remaining == 1
+
+
+def test_redis_backend_without_package_fails_at_startup(monkeypatch):
+    """Redis в настройках без установленного extra — понятная ошибка запуска."""
+    monkeypatch.setattr(rate_limit, "redis", None)
+    monkeypatch.setattr(rate_limit.settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(
+        rate_limit.settings, "RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0"
+    )
+
+    with pytest.raises(RuntimeError, match="extra redis"):
+        rate_limit.create_rate_limiter()
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import pytest
+
+from api import deps
+from core import database
+from core.config import settings
+
+
+class FakeReplicaSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def close(self):
+        return None
+
+
+async def resolve_read_db(primary, user_id: int):
+    generator = deps.get_read_db(primary, SimpleNamespace(user_id=user_id))
+    session = await anext(generator)
+    await generator.aclose()
+    return session
+
+
+def test_recent_write_expires(monkeypatch):
+    """Пользователь читает с основной БД только в пределах окна после записи."""
+    monkeypatch.setattr(settings, "READ_YOUR_WRITES_SECONDS", 60.0)
+    database.mark_recent_write(101)
+    assert database.wrote_recently(101)
+    assert not database.wrote_recently(102)
+
+    monkeypatch.setattr(settings, "READ_YOUR_WRITES_SECONDS", 0.0)
+    database.mark_recent_write(101)
+    assert not database.wrote_recently(101)
+
+
+@pytest.mark.asyncio
+async def test_reads_use_primary_without_replica(monkeypatch):
+    """Без реплики ReadSessionDep отдаёт ту же сессию, что и SessionDep."""
+    monkeypatch.setattr(deps, "read_engine", None)
+    primary = object()
+
+    assert await resolve_read_db(primary, 201) is primary
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_unless_user_wrote_recently(monkeypatch):
+    """С репликой чтения идут на неё, кроме недавно писавших пользователей."""
+    monkeypatch.setattr(deps, "read_engine", object())
+    monkeypatch.setattr(deps, "ReadSessionLocal", FakeReplicaSession)
+    monkeypatch.setattr(settings, "READ_YOUR_WRITES_SECONDS", 60.0)
+    primary = object()
+
+    assert isinstance(await resolve_read_db(primary, 301), FakeReplicaSession)
+
+    database.mark_recent_write(301)
+    assert await resolve_read_db(primary, 301) is primary
+
+
+def test_session_target_separates_replica_from_primary(monkeypatch):
+    """Загрузки с реплики и с основной БД не делят ключ общей загрузки."""
+    replica = object()
+    monkeypatch.setattr(database, "read_engine", replica)
+
+    assert database.session_target(SimpleNamespace(bind=replica)) == "replica"
+    assert database.session_target(SimpleNamespace(bind=object())) == "primary"
+
+    monkeypatch.setattr(database, "read_engine", None)
+    assert database.session_target(SimpleNamespace(bind=None)) == "primary"
@@ -0,0 +1,17 @@
+from core.search import MAX_SEARCH_TERMS, prefix_tsquery
+
+
+def test_prefix_tsquery_joins_words_as_prefixes():
+    assert prefix_tsquery("Ретро  Команды") == "ретро:* & команды:*"
+
+
+def test_prefix_tsquery_drops_tsquery_syntax():
+    """Операторы tsquery из ввода не попадают в запрос."""
+    assert prefix_tsquery("a&b | !c:*") == "a:* & b:* & c:*"
+    assert prefix_tsquery("&|!:*()") is None
+
+
+def test_prefix_tsquery_limits_terms():
+    words = " ".join(f"w{index}" for index in range(MAX_SEARCH_TERMS + 5))
+
+    assert prefix_tsquery(words).count(":*") == MAX_SEARCH_TERMS
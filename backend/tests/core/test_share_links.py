@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from core.share_links import (
+    InvalidShareLinkError,
+    ShareLinkClaims,
+    ShareLinkDenyList,
+    share_link_denylist,
+    sign_share_link,
+    verify_share_link,
+)
+from models.permission import Permission
+
+
+def make_claims(**overrides) -> ShareLinkClaims:
+    values = {
+        "link_id": "abc123",
+        "board_id": 7,
+        "permission": Permission.VIEW,
+        "expires_at": int(time.time()) + 3600,
+    }
+    return ShareLinkClaims(**(values | overrides))
+
+
+def test_share_link_round_trip():
+    claims = make_claims()
+    token = sign_share_link(claims)
+
+    assert "=" not in token
+    assert verify_share_link(token) == claims
+
+
+def test_tampered_share_link_is_rejected():
+    token = sign_share_link(make_claims())
+    other = sign_share_link(make_claims(board_id=8))
+    forged = other.split(".")[0] + "." + token.split(".")[1]
+
+    for bad in (forged, token[:-2], "no-signature", "ключ.подпись", ""):
+        with pytest.raises(InvalidShareLinkError):
+            verify_share_link(bad)
+
+
+def test_expired_share_link_is_rejected():
+    claims = make_claims(expires_at=1_000)
+    token = sign_share_link(claims)
+
+    assert verify_share_link(token, now=999) == claims
+    with pytest.raises(InvalidShareLinkError):
+        verify_share_link(token, now=1_000)
+
+
+def test_denied_share_link_is_rejected(monkeypatch):
+    monkeypatch.setattr(share_link_denylist, "_entries", {})
+    claims = make_claims(link_id="revoked")
+    token = sign_share_link(claims)
+
+    share_link_denylist.add("revoked", claims.expires_at)
+
+    with pytest.raises(InvalidShareLinkError):
+        verify_share_link(token)
+
+
+def test_denylist_forgets_expired_links():
+    denylist = ShareLinkDenyList()
+    denylist.add("old", time.time() - 1)
+    denylist.add("new", time.time() + 60)
+
+    assert "old" not in denylist
+    assert "new" in denylist
+    assert len(denylist) == 1
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from core.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """Одновременные вызовы с одним ключом выполняют работу один раз."""
+    flight: SingleFlight[int] = SingleFlight("test")
+    calls = 0
+    release = asyncio.Event()
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    waiters = [asyncio.create_task(flight.do(("board", 1), load)) for _ in range(20)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [42] * 20
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_different_keys_and_sequential_calls_run_separately():
+    flight: SingleFlight[int] = SingleFlight("test")
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await asyncio.gather(
+        flight.do(("board", 1, 0), load), flight.do(("board", 1, 1), load)
+    ) == [1, 2]
+    assert await flight.do(("board", 1, 0), load) == 3
+
+
+@pytest.mark.asyncio
+async def test_exception_reaches_every_waiter():
+    flight: SingleFlight[int] = SingleFlight("test")
+
+    async def fail() -> int:
+        await asyncio.sleep(0)
+        raise LookupError("boom")
+
+    results = await asyncio.gather(
+        *(flight.do("key", fail) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, LookupError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_follower_takes_over_when_leader_is_cancelled():
+    """Отключение первого клиента не роняет остальных."""
+    flight: SingleFlight[str] = SingleFlight("test")
+    started = asyncio.Event()
+
+    async def slow() -> str:
+        started.set()
+        await asyncio.sleep(10)
+        return "leader"
+
+    async def fast() -> str:
+        return "follower"
+
+    leader = asyncio.create_task(flight.do("key", slow))
+    await started.wait()
+    follower = asyncio.create_task(flight.do("key", fast))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "follower"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
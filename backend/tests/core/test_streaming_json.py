@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from core.streaming_json import StreamFormatError, iter_json_array, iter_ndjson
+
+ITEMS = [
+    {"title": "Доска"},
+    {"x": 1, "y": 2, "text": 'кавычка " и скобки {[]} и \\ слеш'},
+    {"x": 3, "y": 4, "nested": {"a": [1, {"b": "}"}]}},
+]
+
+
+async def chunked(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def collect(iterator) -> list:
+    return [json.loads(item) async for item in iterator]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 2, 7, 1024])
+async def test_json_array_items_survive_any_chunking(size):
+    data = json.dumps(ITEMS, ensure_ascii=False, indent=1).encode("utf-8")
+
+    assert await collect(iter_json_array(chunked(data, size), 1024)) == ITEMS
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 5, 1024])
+async def test_ndjson_lines_survive_any_chunking(size):
+    data = b"\n".join(
+        json.dumps(item, ensure_ascii=False).encode("utf-8") for item in ITEMS
+    )
+    data = data.replace(b"\n", b"\r\n\n", 1)
+
+    assert await collect(iter_ndjson(chunked(data, size), 1024)) == ITEMS
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "data",
+    [b'{"x": 1}', b"[1, 2]", b'[{"x": 1}', b'[{"x": 1}] []', b'[{"x": "' + b"a" * 100],
+)
+async def test_json_array_rejects_malformed_stream(data):
+    with pytest.raises(StreamFormatError):
+        await collect(iter_json_array(chunked(data, 4), 64))
+
+
+@pytest.mark.asyncio
+async def test_ndjson_rejects_oversized_record():
+    data = b'{"x": 1}\n{"text": "' + b"a" * 100 + b'"}\n'
+
+    with pytest.raises(StreamFormatError):
+        await collect(iter_ndjson(chunked(data, 16), 64))
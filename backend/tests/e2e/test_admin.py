@@ -0,0 +1,41 @@
+import pytest
+from httpx import AsyncClient
+
+from core.config import settings
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_requires_admin(client: AsyncClient, register_and_login):
+    """Обычный пользователь не видит журнал медленных запросов."""
+    _, headers = await register_and_login()
+
+    response = await client.get(
+        "/api/v1/admin/slow-queries",
+        headers=headers,
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_lists_recorded(
+    client: AsyncClient, monkeypatch, register_and_login
+):
+    """Администратор видит запросы дольше порога."""
+    login, headers = await register_and_login()
+    monkeypatch.setattr(settings, "ADMIN_LOGINS", [login])
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0.0)
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN", False)
+
+    await client.get("/api/v1/boards", headers=headers)
+    response = await client.get(
+        "/api/v1/admin/slow-queries",
+        params={"limit": 5},
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["thresholdMs"] == 0.0
+    assert 0 < len(data["queries"]) <= 5
+    assert all(query["calls"] >= 1 for query in data["queries"])
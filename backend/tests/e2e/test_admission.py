@@ -0,0 +1,32 @@
+import pytest
+from httpx import AsyncClient
+
+from core import admission
+from core.admission import AdmissionController
+
+
+@pytest.mark.asyncio
+async def test_overloaded_request_gets_503_with_retry_after(
+    client: AsyncClient, monkeypatch
+):
+    """Без свободных слотов запрос отклоняется 503 с Retry-After, /metrics доступен."""
+    controller = AdmissionController(1, {}, max_queue=0, queue_timeout=0.01)
+    monkeypatch.setattr(admission, "admission_controller", controller)
+    assert await controller.acquire(admission.DEFAULT) is None
+
+    response = await client.get("/api/v1/boards/999999")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert response.json()["detail"]["error"] == "OVERLOADED"
+
+    metrics = await client.get("/metrics")
+    assert metrics.status_code == 200
+    assert (
+        'admission_rejected_total{class="interactive",reason="queue_full"}'
+        in metrics.text
+    )
+
+    controller.release(admission.DEFAULT)
+    response = await client.get("/api/v1/boards/999999")
+    assert response.status_code == 401
@@ -0,0 +1,205 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.config import settings
+from core.jobs import JobContext, JobRunner
+from models.board import Board
+from models.job import Job
+from models.sticker import Sticker
+
+
+async def create_board_with_stickers(
+    client: AsyncClient, headers: dict, count: int
+) -> tuple[int, list[int]]:
+    board_response = await client.post(
+        "/api/v1/boards",
+        json={"title": "Original", "backgroundColor": "#EEEEEE"},
+        headers=headers,
+    )
+    board_id = board_response.json()["boardId"]
+    sticker_ids = []
+    for index in range(count):
+        response = await client.post(
+            f"/api/v1/boards/{board_id}/stickers",
+            json={"x": index * 10, "y": 5, "text": f"s{index}", "layerLevel": index},
+            headers=headers,
+        )
+        sticker_ids.append(response.json()["stickerId"])
+    return board_id, sticker_ids
+
+
+@pytest.mark.asyncio
+async def test_duplicate_board_copies_selected_stickers_with_offset(
+    client: AsyncClient,
+    register_and_login,
+):
+    """Копия содержит выбранные стикеры со сдвигом и принадлежит копирующему."""
+    _, owner_headers = await register_and_login()
+    board_id, sticker_ids = await create_board_with_stickers(client, owner_headers, 3)
+
+    response = await client.post(
+        f"/api/v1/boards/{board_id}/duplicate",
+        json={"offsetX": 100, "offsetY": -5, "stickerIds": sticker_ids[1:]},
+        headers=owner_headers,
+    )
+
+    assert response.status_code == 201
+    copy = response.json()
+    assert copy["boardId"] != board_id
+    assert copy["title"] == "Original (копия)"
+    assert copy["backgroundColor"] == "#EEEEEE"
+
+    detail = (
+        await client.get(f"/api/v1/boards/{copy['boardId']}", headers=owner_headers)
+    ).json()
+    stickers = sorted(detail["stickers"], key=lambda sticker: sticker["layerLevel"])
+    assert [(s["x"], s["y"], s["text"]) for s in stickers] == [
+        (110, 0, "s1"),
+        (120, 0, "s2"),
+    ]
+
+    _, stranger_headers = await register_and_login()
+    forbidden = await client.post(
+        f"/api/v1/boards/{board_id}/duplicate", headers=stranger_headers
+    )
+    assert forbidden.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_large_board_is_duplicated_by_job(
+    client: AsyncClient, db: AsyncSession, monkeypatch, register_and_login
+):
+    monkeypatch.setattr(settings, "BOARD_DUPLICATE_SYNC_MAX_STICKERS", 2)
+    _, headers = await register_and_login()
+    board_id, _ = await create_board_with_stickers(client, headers, 3)
+
+    response = await client.post(
+        f"/api/v1/boards/{board_id}/duplicate",
+        json={"title": "Big copy"},
+        headers=headers,
+    )
+
+    assert response.status_code == 202
+    assert response.json()["kind"] == "board.duplicate"
+    job_url = response.headers["location"]
+
+    runner = JobRunner(
+        session_factory=async_sessionmaker(db.bind, expire_on_commit=False)
+    )
+    await runner.run_pending()
+
+    job = (await client.get(job_url, headers=headers)).json()
+    assert job["status"] == "succeeded"
+    assert job["result"]["stickersCopied"] == 3
+    copy = await client.get(
+        f"/api/v1/boards/{job['result']['boardId']}", headers=headers
+    )
+    assert copy.json()["title"] == "Big copy"
+    assert len(copy.json()["stickers"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_duplicate_job_resumes_same_board_after_failure(
+    client: AsyncClient, db: AsyncSession, monkeypatch, register_and_login
+):
+    """Упавшая посреди копирования задача продолжает ту же доску, а не создаёт новую."""
+    monkeypatch.setattr(settings, "BOARD_DUPLICATE_SYNC_MAX_STICKERS", 2)
+    monkeypatch.setattr(settings, "JOB_COPY_CHUNK_SIZE", 2)
+    _, headers = await register_and_login()
+    board_id, _ = await create_board_with_stickers(client, headers, 5)
+    title = f"Resumed {uuid.uuid4().hex[:8]}"
+
+    response = await client.post(
+        f"/api/v1/boards/{board_id}/duplicate", json={"title": title}, headers=headers
+    )
+    job_url = response.headers["location"]
+
+    # Третий report — вторая порция стикеров — падает до коммита
+    report = JobContext.report
+    calls = 0
+
+    async def failing_report(self, *args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 3:
+            raise RuntimeError("crash")
+        await report(self, *args, **kwargs)
+
+    monkeypatch.setattr(JobContext, "report", failing_report)
+    runner = JobRunner(
+        session_factory=async_sessionmaker(db.bind, expire_on_commit=False)
+    )
+    await runner.run_pending()
+
+    job = (await client.get(job_url, headers=headers)).json()
+    assert job["status"] == "succeeded"
+    assert job["attempts"] == 2
+    assert job["result"]["stickersCopied"] == 5
+    assert (
+        await db.scalar(
+            select(func.count()).select_from(Board).where(Board.title == title)
+        )
+        == 1
+    )
+    copy = await client.get(
+        f"/api/v1/boards/{job['result']['boardId']}", headers=headers
+    )
+    assert sorted(sticker["text"] for sticker in copy.json()["stickers"]) == [
+        f"s{index}" for index in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_duplicate_job_purges_hidden_copy(
+    client: AsyncClient, db: AsyncSession, monkeypatch, register_and_login
+):
+    """Копия, исчерпавшая попытки, не остаётся скрытой доской в БД навсегда."""
+    monkeypatch.setattr(settings, "BOARD_DUPLICATE_SYNC_MAX_STICKERS", 2)
+    monkeypatch.setattr(settings, "JOB_COPY_CHUNK_SIZE", 2)
+    monkeypatch.setattr(settings, "JOB_MAX_ATTEMPTS", 2)
+    _, headers = await register_and_login()
+    board_id, _ = await create_board_with_stickers(client, headers, 5)
+    runner = JobRunner(
+        session_factory=async_sessionmaker(db.bind, expire_on_commit=False)
+    )
+    # Чужие задачи из очереди не должны выполняться с падающим report
+    await runner.run_pending()
+
+    response = await client.post(
+        f"/api/v1/boards/{board_id}/duplicate",
+        json={"title": f"Failed {uuid.uuid4().hex[:8]}"},
+        headers=headers,
+    )
+    job_url = response.headers["location"]
+
+    # Доска и первая порция копии сохраняются, дальше каждая порция падает;
+    # удаление копии (без checkpoint) работает как обычно
+    report = JobContext.report
+
+    async def failing_report(self, db, done, *args, **kwargs):
+        if done > 2 and kwargs.get("checkpoint"):
+            raise RuntimeError("crash")
+        await report(self, db, done, *args, **kwargs)
+
+    monkeypatch.setattr(JobContext, "report", failing_report)
+    await runner.run_pending()
+
+    job = (await client.get(job_url, headers=headers)).json()
+    assert job["status"] == "failed"
+    assert job["attempts"] == 2
+    new_board_id = (await db.get(Job, job["jobId"], populate_existing=True)).checkpoint[
+        "new_board_id"
+    ]
+    assert await db.get(Board, new_board_id, populate_existing=True) is None
+    assert (
+        await db.scalar(
+            select(func.count())
+            .select_from(Sticker)
+            .where(Sticker.board_id == new_board_id)
+        )
+        == 0
+    )
@@ -0,0 +1,184 @@
+import pytest
+from httpx import AsyncClient
+
+
+async def create_group(client: AsyncClient, headers: dict, name: str) -> int:
+    response = await client.post("/api/v1/groups", json={"name": name}, headers=headers)
+    assert response.status_code == 201
+    return response.json()["groupId"]
+
+
+async def board_permission(
+    client: AsyncClient, headers: dict, board_id: int
+) -> str | None:
+    response = await client.get(f"/api/v1/boards/{board_id}", headers=headers)
+    if response.status_code == 403:
+        return None
+    assert response.status_code == 200
+    return response.json()["permission"]
+
+
+@pytest.mark.asyncio
+async def test_nested_group_grant_reaches_members(
+    client: AsyncClient, register_and_login
+):
+    """Доступ группы получают участники вложенных групп; снятие вложенности его отзывает."""
+    _, owner_headers = await register_and_login()
+    member_login, member_headers = await register_and_login()
+
+    board_id = (
+        await client.post(
+            "/api/v1/boards", json={"title": "Команда"}, headers=owner_headers
+        )
+    ).json()["boardId"]
+    company = await create_group(client, owner_headers, "Компания")
+    sales = await create_group(client, owner_headers, "Продажи")
+    interns = await create_group(client, owner_headers, "Стажёры")
+
+    await client.post(
+        f"/api/v1/groups/{interns}/members",
+        json={"userLogin": member_login},
+        headers=owner_headers,
+    )
+    # Компания > Продажи > Стажёры
+    for parent, child in ((company, sales), (sales, interns)):
+        response = await client.post(
+            f"/api/v1/groups/{parent}/subgroups",
+            json={"groupId": child},
+            headers=owner_headers,
+        )
+        assert response.status_code == 204
+
+    response = await client.post(
+        f"/api/v1/boards/{board_id}/share/groups",
+        json={"groupId": company, "permission": "view"},
+        headers=owner_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["created"] is True
+    assert await board_permission(client, member_headers, board_id) == "view"
+
+    boards = (
+        await client.get("/api/v1/boards?filter=shared", headers=member_headers)
+    ).json()["boards"]
+    assert [board["boardId"] for board in boards] == [board_id]
+
+    response = await client.delete(
+        f"/api/v1/groups/{company}/subgroups/{sales}", headers=owner_headers
+    )
+    assert response.status_code == 204
+    assert await board_permission(client, member_headers, board_id) is None
+
+
+@pytest.mark.asyncio
+async def test_effective_permission_is_highest_grant(
+    client: AsyncClient, register_and_login
+):
+    """Итоговые права — максимум прямого доступа и доступов групп."""
+    _, owner_headers = await register_and_login()
+    member_login, member_headers = await register_and_login()
+
+    board_id = (
+        await client.post(
+            "/api/v1/boards", json={"title": "Права"}, headers=owner_headers
+        )
+    ).json()["boardId"]
+    editors = await create_group(client, owner_headers, "Редакторы")
+    await client.post(
+        f"/api/v1/groups/{editors}/members",
+        json={"userLogin": member_login},
+        headers=owner_headers,
+    )
+    await client.post(
+        f"/api/v1/boards/{board_id}/share",
+        json={"userLogin": member_login, "permission": "view"},
+        headers=owner_headers,
+    )
+    await client.post(
+        f"/api/v1/boards/{board_id}/share/groups",
+        json={"groupId": editors, "permission": "edit"},
+        headers=owner_headers,
+    )
+    assert await board_permission(client, member_headers, board_id) == "edit"
+
+    # Прямой доступ отозван — остаётся доступ группы
+    await client.request(
+        "DELETE",
+        f"/api/v1/boards/{board_id}/share",
+        json={"userLogin": member_login},
+        headers=owner_headers,
+    )
+    assert await board_permission(client, member_headers, board_id) == "edit"
+
+    # Участник исключён — доступа не остаётся
+    response = await client.request(
+        "DELETE",
+        f"/api/v1/groups/{editors}/members",
+        json={"userLogin": member_login},
+        headers=owner_headers,
+    )
+    assert response.status_code == 204
+    assert await board_permission(client, member_headers, board_id) is None
+
+    await client.post(
+        f"/api/v1/groups/{editors}/members",
+        json={"userLogin": member_login},
+        headers=owner_headers,
+    )
+    assert await board_permission(client, member_headers, board_id) == "edit"
+
+    response = await client.delete(f"/api/v1/groups/{editors}", headers=owner_headers)
+    assert response.status_code == 204
+    assert await board_permission(client, member_headers, board_id) is None
+    shares = (
+        await client.get(
+            f"/api/v1/boards/{board_id}/share/groups", headers=owner_headers
+        )
+    ).json()
+    assert shares["groups"] == []
+
+
+@pytest.mark.asyncio
+async def test_group_management_rules(client: AsyncClient, register_and_login):
+    """Группой управляет только владелец, циклы вложенности отклоняются."""
+    _, owner_headers = await register_and_login()
+    _, other_headers = await register_and_login()
+
+    outer = await create_group(client, owner_headers, "Внешняя")
+    inner = await create_group(client, owner_headers, "Внутренняя")
+    await client.post(
+        f"/api/v1/groups/{outer}/subgroups",
+        json={"groupId": inner},
+        headers=owner_headers,
+    )
+
+    response = await client.post(
+        f"/api/v1/groups/{inner}/subgroups",
+        json={"groupId": outer},
+        headers=owner_headers,
+    )
+    assert response.status_code == 409
+    assert response.json()["detail"]["error"] == "GROUP_CYCLE"
+
+    response = await client.post(
+        f"/api/v1/groups/{outer}/subgroups",
+        json={"groupId": outer},
+        headers=owner_headers,
+    )
+    assert response.status_code == 409
+
+    response = await client.get(f"/api/v1/groups/{outer}", headers=other_headers)
+    assert response.status_code == 403
+    assert response.json()["detail"]["error"] == "NOT_GROUP_OWNER"
+
+    response = await client.get(f"/api/v1/groups/{outer}", headers=owner_headers)
+    assert response.status_code == 200
+    assert response.json()["subgroups"] == [{"groupId": inner, "name": "Внутренняя"}]
+
+    response = await client.post(
+        f"/api/v1/groups/{outer}/members",
+        json={"userLogin": "nobody@example.com"},
+        headers=owner_headers,
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"]["error"] == "USER_NOT_FOUND"
@@ -0,0 +1,140 @@
+import asyncio
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from api import middleware
+from core.idempotency import IdempotencyStore
+
+
+@pytest.mark.asyncio
+async def test_retried_sticker_creation_returns_original(
+    client: AsyncClient, register_and_login
+):
+    """Повтор с тем же Idempotency-Key возвращает тот же стикер, а не дубликат."""
+    _, auth = await register_and_login()
+    board_response = await client.post(
+        "/api/v1/boards",
+        json={"title": f"Idempotent Board {uuid.uuid4().hex[:8]}"},
+        headers={**auth, "Idempotency-Key": uuid.uuid4().hex},
+    )
+    assert board_response.status_code == 201
+    board_id = board_response.json()["boardId"]
+
+    headers = {**auth, "Idempotency-Key": uuid.uuid4().hex}
+    first = await client.post(
+        f"/api/v1/boards/{board_id}/stickers",
+        json={"x": 1, "y": 2, "text": "once"},
+        headers=headers,
+    )
+    retry = await client.post(
+        f"/api/v1/boards/{board_id}/stickers",
+        json={"x": 1, "y": 2, "text": "once"},
+        headers=headers,
+    )
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+
+    board = await client.get(f"/api/v1/boards/{board_id}", headers=auth)
+    assert len(board.json()["stickers"]) == 1
+
+    reused = await client.post(
+        f"/api/v1/boards/{board_id}/stickers",
+        json={"x": 5, "y": 5, "text": "other"},
+        headers=headers,
+    )
+    assert reused.status_code == 422
+    assert reused.json()["detail"]["error"] == "IDEMPOTENCY_KEY_REUSED"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_retries_wait_for_original(
+    client: AsyncClient, register_and_login
+):
+    """Одновременные повторы ждут оригинал и не создают доски заново."""
+    _, auth = await register_and_login()
+    headers = {
+        **auth,
+        "Idempotency-Key": uuid.uuid4().hex,
+    }
+    title = f"Concurrent Board {uuid.uuid4().hex[:8]}"
+
+    responses = await asyncio.gather(
+        *(
+            client.post("/api/v1/boards", json={"title": title}, headers=headers)
+            for _ in range(5)
+        )
+    )
+
+    assert {response.status_code for response in responses} == {201}
+    assert len({response.json()["boardId"] for response in responses}) == 1
+    assert (
+        sum(
+            response.headers.get("idempotent-replayed") == "true"
+            for response in responses
+        )
+        == 4
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_store_of_running_originals_is_503(
+    client: AsyncClient, monkeypatch, register_and_login
+):
+    """Когда все записи заняты выполняющимися оригиналами, новый ключ — 503."""
+    _, auth = await register_and_login()
+    store = IdempotencyStore(max_entries=1, ttl=60)
+    running = store.start(("other", "/api/v1/boards", b"running"), b"")
+    monkeypatch.setattr(middleware, "idempotency_store", store)
+
+    response = await client.post(
+        "/api/v1/boards",
+        json={"title": "Не влезла"},
+        headers={
+            **auth,
+            "Idempotency-Key": uuid.uuid4().hex,
+        },
+    )
+
+    assert response.status_code == 503
+    assert response.json()["detail"]["error"] == "IDEMPOTENCY_STORE_FULL"
+    assert "retry-after" in response.headers
+    assert store.get(("other", "/api/v1/boards", b"running")) is running
+
+
+@pytest.mark.asyncio
+async def test_replay_keeps_only_content_headers(
+    client: AsyncClient, register_and_login
+):
+    """Повтор с другого Origin не получает заголовки, выставленные для оригинала."""
+    _, auth = await register_and_login()
+    board_id = (
+        await client.post("/api/v1/boards", json={"title": "Cors"}, headers=auth)
+    ).json()["boardId"]
+    headers = {**auth, "Idempotency-Key": uuid.uuid4().hex}
+    url = f"/api/v1/boards/{board_id}/stickers"
+    body = {"x": 1, "y": 2, "text": "cors"}
+
+    first = await client.post(
+        url, json=body, headers=headers | {"Origin": "http://localhost:3000"}
+    )
+    retry = await client.post(
+        url, json=body, headers=headers | {"Origin": "https://mirumir.i3cheese.ru"}
+    )
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert retry.json() == first.json()
+    assert retry.headers["content-type"] == first.headers["content-type"]
+    assert retry.headers.get_list("access-control-allow-origin") == [
+        "https://mirumir.i3cheese.ru"
+    ]
+    # Лимит и время в БД относятся к оригиналу, повтор их не расходует
+    assert "x-ratelimit-remaining" in first.headers
+    assert "x-ratelimit-remaining" not in retry.headers
+    [server_timing] = retry.headers.get_list("server-timing")
+    assert server_timing.startswith('db;dur=0.0;desc="0 queries"')
@@ -0,0 +1,163 @@
+import json
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models.board import Board
+
+
+async def stream(lines: list[dict]):
+    for line in lines:
+        yield (json.dumps(line, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson_stream(
+    client: AsyncClient, monkeypatch, register_and_login
+):
+    """Доска и стикеры из NDJSON-потока записываются пачками."""
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 2)
+    _, auth = await register_and_login()
+    headers = {
+        **auth,
+        "Content-Type": "application/x-ndjson",
+    }
+    records = [{"title": "Imported", "backgroundColor": "#101010"}] + [
+        {"x": index, "y": -index, "text": f"s{index}", "layerLevel": index}
+        for index in range(5)
+    ]
+
+    response = await client.post(
+        "/api/v1/boards/import", content=stream(records), headers=headers
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["stickersImported"] == 5
+    assert data["board"]["title"] == "Imported"
+
+    board = await client.get(
+        f"/api/v1/boards/{data['board']['boardId']}",
+        headers=auth,
+    )
+    stickers = sorted(board.json()["stickers"], key=lambda s: s["layerLevel"])
+    assert [s["text"] for s in stickers] == ["s0", "s1", "s2", "s3", "s4"]
+    assert stickers[0]["width"] == 200
+    assert stickers[0]["color"] == "#FFEB3B"
+
+
+@pytest.mark.asyncio
+async def test_import_json_array(client: AsyncClient, register_and_login):
+    _, auth = await register_and_login()
+
+    response = await client.post(
+        "/api/v1/boards/import",
+        json=[{"title": "From JSON"}, {"x": 1, "y": 2}],
+        headers=auth,
+    )
+
+    assert response.status_code == 201
+    assert response.json()["stickersImported"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_record_rejects_whole_import(
+    client: AsyncClient, db: AsyncSession, monkeypatch, register_and_login
+):
+    """Ошибка в записи — 422 с её номером, доска не создаётся."""
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 2)
+    _, auth = await register_and_login()
+    title = f"Broken {uuid.uuid4().hex[:8]}"
+    records = [
+        {"title": title},
+        {"x": 1, "y": 1},
+        {"x": 2, "y": 2},
+        {"x": 3, "y": 3},
+        {"x": 4, "y": 4, "color": "red"},
+    ]
+
+    response = await client.post(
+        "/api/v1/boards/import",
+        content=stream(records),
+        headers={
+            **auth,
+            "Content-Type": "application/x-ndjson",
+        },
+    )
+
+    assert response.status_code == 422
+    detail = response.json()["detail"]
+    assert detail["error"] == "INVALID_IMPORT"
+    assert detail["message"].startswith("Запись 5: color")
+    assert (
+        await db.scalar(
+            select(func.count()).select_from(Board).where(Board.title == title)
+        )
+        == 0
+    )
+
+    unsupported = await client.post(
+        "/api/v1/boards/import",
+        content=b"title,x,y",
+        headers={**auth, "Content-Type": "text/csv"},
+    )
+    assert unsupported.status_code == 415
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("body", "content_type", "message"),
+    [
+        (b"", "application/x-ndjson", "Запись 1: Нет записи доски"),
+        (b"", "application/json", "Запись 1: Массив не закончен"),
+        (b'{"title": "Not array"}', "application/json", "Запись 1: Ожидался"),
+    ],
+)
+async def test_broken_board_record_is_422(
+    client: AsyncClient,
+    body: bytes,
+    content_type: str,
+    message: str,
+    register_and_login,
+):
+    """Ошибка формата ещё до записи доски — 422, а не 500."""
+    _, auth = await register_and_login()
+
+    response = await client.post(
+        "/api/v1/boards/import",
+        content=body,
+        headers={**auth, "Content-Type": content_type},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"]["message"].startswith(message)
+
+
+@pytest.mark.asyncio
+async def test_ndjson_line_with_several_objects_is_rejected(
+    client: AsyncClient, monkeypatch, register_and_login
+):
+    """Строка NDJSON с несколькими объектами не превращается в несколько стикеров."""
+    monkeypatch.setattr(settings, "IMPORT_MAX_STICKERS", 2)
+    _, auth = await register_and_login()
+    body = b'{"title": "Smuggled"}\n{"x": 1, "y": 1}\n' + b",".join(
+        [b'{"x": 2, "y": 2}'] * 3
+    )
+
+    response = await client.post(
+        "/api/v1/boards/import",
+        content=body,
+        headers={
+            **auth,
+            "Content-Type": "application/x-ndjson",
+        },
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"]["message"] == (
+        "Запись 3: Запись должна быть одним JSON-объектом"
+    )
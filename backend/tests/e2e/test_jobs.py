@@ -0,0 +1,146 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.config import settings
+from core.jobs import JobRunner, enqueue_job, job_handler
+from models.board import Board
+from models.job import Job, JobStatus
+from models.sticker import Sticker
+
+
+@job_handler("test.always_fails")
+async def always_fails(ctx) -> None:
+    raise RuntimeError("boom")
+
+
+@job_handler("test.slow_step")
+async def slow_step(ctx) -> dict:
+    await asyncio.sleep(0.5)
+    return {"done": True}
+
+
+def make_runner(db: AsyncSession) -> JobRunner:
+    return JobRunner(
+        session_factory=async_sessionmaker(db.bind, expire_on_commit=False)
+    )
+
+
+@pytest.mark.asyncio
+async def test_board_delete_runs_in_background(
+    client: AsyncClient, db: AsyncSession, monkeypatch, register_and_login
+):
+    """Удаление доски ставит задачу; стикеры удаляются порциями с прогрессом."""
+    monkeypatch.setattr(settings, "JOB_DELETE_CHUNK_SIZE", 2)
+    _, headers = await register_and_login()
+    board_response = await client.post(
+        "/api/v1/boards",
+        json={"title": f"Job Board {uuid.uuid4().hex[:8]}"},
+        headers=headers,
+    )
+    board_id = board_response.json()["boardId"]
+    for index in range(5):
+        await client.post(
+            f"/api/v1/boards/{board_id}/stickers",
+            json={"x": index, "y": index},
+            headers=headers,
+        )
+
+    response = await client.delete(f"/api/v1/boards/{board_id}", headers=headers)
+    assert response.status_code == 204
+    job_url = response.headers["location"]
+
+    job = (await client.get(job_url, headers=headers)).json()
+    assert job["kind"] == "board.delete"
+    assert job["status"] == "queued"
+
+    _, other_headers = await register_and_login()
+    other = await client.get(job_url, headers=other_headers)
+    assert other.status_code == 404
+
+    await make_runner(db).run_pending()
+
+    job = (await client.get(job_url, headers=headers)).json()
+    assert job["status"] == "succeeded"
+    assert job["progressDone"] == job["progressTotal"] == 5
+    assert job["result"] == {"boardId": board_id, "stickersDeleted": 5}
+    assert await db.get(Board, board_id, populate_existing=True) is None
+    assert (
+        await db.scalar(
+            select(func.count())
+            .select_from(Sticker)
+            .where(Sticker.board_id == board_id)
+        )
+        == 0
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_then_marked_failed(db: AsyncSession):
+    job = enqueue_job(db, "test.always_fails", {})
+    await db.commit()
+
+    await make_runner(db).run_pending()
+
+    await db.refresh(job)
+    assert job.status == JobStatus.FAILED
+    assert job.attempts == settings.JOB_MAX_ATTEMPTS
+    assert job.error == "RuntimeError: boom"
+    assert job.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_stale_running_job_is_resumed(db: AsyncSession):
+    """Задача упавшего процесса (старый heartbeat) снова берётся в работу."""
+    job = enqueue_job(db, "test.always_fails", {})
+    await db.commit()
+    await db.execute(
+        update(Job)
+        .where(Job.job_id == job.job_id)
+        .values(
+            status=JobStatus.RUNNING,
+            attempts=settings.JOB_MAX_ATTEMPTS - 1,
+            heartbeat_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+    )
+    await db.commit()
+
+    await make_runner(db).run_pending()
+
+    await db.refresh(job)
+    assert job.status == JobStatus.FAILED
+    assert job.attempts == settings.JOB_MAX_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_long_step_is_not_reclaimed(db: AsyncSession, monkeypatch):
+    """Шаг дольше JOB_STALE_SECONDS не отдаёт задачу ни другому воркеру, ни себе."""
+    # Задачи, оставленные в очереди другими тестами, забрал бы _claim(1)
+    await make_runner(db).run_pending()
+    monkeypatch.setattr(settings, "JOB_STALE_SECONDS", 0.2)
+    job = enqueue_job(db, "test.slow_step", {})
+    await db.commit()
+    runner = JobRunner(
+        session_factory=async_sessionmaker(db.bind, expire_on_commit=False),
+        heartbeat_interval=0.05,
+    )
+    other = make_runner(db)
+
+    [claimed] = await runner._claim(1)
+    assert claimed.job_id == job.job_id
+    task = asyncio.create_task(runner._execute(claimed))
+    runner._running[claimed.job_id] = task
+    await asyncio.sleep(0.35)
+
+    assert job.job_id not in [job.job_id for job in await other._claim(10)]
+    assert job.job_id not in [job.job_id for job in await runner._claim(10)]
+    await task
+
+    await db.refresh(job)
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.attempts == 1
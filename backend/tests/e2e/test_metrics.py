@@ -0,0 +1,27 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposes_route_latency(client: AsyncClient):
+    """После запроса к доске в /metrics есть ряд по шаблону маршрута."""
+    await client.get("/api/v1/boards/999999")
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert (
+        'http_requests_total{method="GET",route="/api/v1/boards/{board_id}",status="401"}'
+        in body
+    )
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    for name in (
+        "http_requests_in_flight",
+        "db_pool_checked_out",
+        "db_pool_checkout_seconds_count",
+        "bcrypt_queue_depth",
+        "live_connections",
+    ):
+        assert name in body
@@ -0,0 +1,79 @@
+from collections import deque
+
+import pytest
+from httpx import AsyncClient
+
+from core.config import settings
+from core.profiling import profile_store
+
+
+@pytest.fixture
+def profile_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_INTERVAL_MS", 1.0)
+    monkeypatch.setattr(profile_store, "_started", deque())
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_admin_request_is_profiled(
+    client: AsyncClient, monkeypatch, profile_dir, register_and_login
+):
+    """Запрос администратора с X-Profile профилируется, профиль можно скачать."""
+    login, headers = await register_and_login()
+    monkeypatch.setattr(settings, "ADMIN_LOGINS", [login])
+
+    response = await client.get("/api/v1/boards", headers={**headers, "X-Profile": "1"})
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+
+    listing = await client.get("/api/v1/admin/profiles", headers=headers)
+    assert listing.status_code == 200
+    profile = listing.json()["profiles"][0]
+    assert profile["profileId"] == profile_id
+    assert profile["path"] == "/api/v1/boards"
+    assert profile["statusCode"] == 200
+
+    collapsed = await client.get(
+        f"/api/v1/admin/profiles/{profile_id}", headers=headers
+    )
+    assert collapsed.status_code == 200
+    for line in collapsed.text.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack.startswith("ProfilingMiddleware.__call__")
+        assert int(count) > 0
+
+
+@pytest.mark.asyncio
+async def test_profiling_ignored_for_regular_user(
+    client: AsyncClient, profile_dir, register_and_login
+):
+    """Заголовок X-Profile от обычного пользователя ни на что не влияет."""
+    _, headers = await register_and_login()
+
+    response = await client.get(
+        "/api/v1/boards",
+        headers=headers | {"X-Profile": "1"},
+    )
+
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+    assert not any(profile_dir.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_profiling_rate_limited(
+    client: AsyncClient, monkeypatch, profile_dir, register_and_login
+):
+    """Сверх PROFILE_MAX_PER_MINUTE запросы идут без профилирования."""
+    login, headers = await register_and_login()
+    monkeypatch.setattr(settings, "ADMIN_LOGINS", [login])
+    monkeypatch.setattr(settings, "PROFILE_MAX_PER_MINUTE", 1)
+    headers = headers | {"X-Profile": "1"}
+
+    first = await client.get("/api/v1/boards", headers=headers)
+    second = await client.get("/api/v1/boards", headers=headers)
+
+    assert "X-Profile-Id" in first.headers
+    assert "X-Profile-Id" not in second.headers
+    assert second.headers["X-Profile-Skipped"] == "rate-limited"
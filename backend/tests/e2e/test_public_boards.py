@@ -0,0 +1,116 @@
+import gzip
+import json
+
+import pytest
+from httpx import AsyncClient
+
+
+async def create_public_board(client: AsyncClient, headers: dict) -> int:
+    response = await client.post(
+        "/api/v1/boards", json={"title": "Для всех"}, headers=headers
+    )
+    board_id = response.json()["boardId"]
+    response = await client.put(
+        f"/api/v1/boards/{board_id}", json={"isPublic": True}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    return board_id
+
+
+@pytest.mark.asyncio
+async def test_public_board_is_cached_until_sticker_write(
+    client: AsyncClient, count_queries, register_and_login
+):
+    """Публичная доска отдаётся без входа из памяти до записи в доску."""
+    _, headers = await register_and_login()
+    board_id = await create_public_board(client, headers)
+    url = f"/api/v1/boards/{board_id}/public"
+    identity = {"Accept-Encoding": "identity"}
+
+    with count_queries() as first:
+        response = await client.get(url, headers=identity)
+    assert response.status_code == 200, response.text
+    assert response.json()["permission"] == "view"
+    assert response.headers["Cache-Control"] == (
+        "public, max-age=10, stale-while-revalidate=60"
+    )
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert "Content-Encoding" not in response.headers
+    etag = response.headers["ETag"]
+    # Доска, владелец и стикеры
+    assert first.count == 3
+
+    with count_queries() as second:
+        response = await client.get(url, headers=identity | {"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert second.count == 0
+
+    await client.post(
+        f"/api/v1/boards/{board_id}/stickers",
+        json={"x": 0, "y": 0, "text": "новый"},
+        headers=headers,
+    )
+    response = await client.get(url, headers=identity | {"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [sticker["text"] for sticker in response.json()["stickers"]] == ["новый"]
+
+
+@pytest.mark.asyncio
+async def test_public_board_gzip_body_has_own_etag(
+    client: AsyncClient, register_and_login
+):
+    """Сжатое тело — отдельное представление со своим ETag."""
+    _, headers = await register_and_login()
+    board_id = await create_public_board(client, headers)
+    url = f"/api/v1/boards/{board_id}/public"
+
+    plain = await client.get(url, headers={"Accept-Encoding": "identity"})
+    async with client.stream("GET", url, headers={"Accept-Encoding": "gzip"}) as raw:
+        assert raw.headers["Content-Encoding"] == "gzip"
+        compressed = b"".join([chunk async for chunk in raw.aiter_raw()])
+    assert json.loads(gzip.decompress(compressed)) == plain.json()
+    assert raw.headers["ETag"] != plain.headers["ETag"]
+
+    response = await client.get(
+        url,
+        headers={"Accept-Encoding": "gzip", "If-None-Match": plain.headers["ETag"]},
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_public_board_hidden_after_closing(
+    client: AsyncClient, register_and_login
+):
+    """Закрытая доска недоступна без входа, закрыть её может только владелец."""
+    _, headers = await register_and_login()
+    editor_login, editor_headers = await register_and_login()
+    private_id = (
+        await client.post("/api/v1/boards", json={"title": "Своя"}, headers=headers)
+    ).json()["boardId"]
+    response = await client.get(f"/api/v1/boards/{private_id}/public")
+    assert response.status_code == 404
+
+    board_id = await create_public_board(client, headers)
+    url = f"/api/v1/boards/{board_id}/public"
+    assert (await client.get(url)).status_code == 200
+
+    await client.post(
+        f"/api/v1/boards/{board_id}/share",
+        json={"userLogin": editor_login, "permission": "edit"},
+        headers=headers,
+    )
+    response = await client.put(
+        f"/api/v1/boards/{board_id}",
+        json={"isPublic": False},
+        headers=editor_headers,
+    )
+    assert response.status_code == 403
+
+    response = await client.put(
+        f"/api/v1/boards/{board_id}", json={"isPublic": False}, headers=headers
+    )
+    assert response.status_code == 200
+    assert (await client.get(url)).status_code == 404
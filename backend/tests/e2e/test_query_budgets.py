@@ -0,0 +1,161 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.user import User
+
+# Потолки числа SQL-запросов на эндпоинт. Если изменение их превышает —
+# скорее всего, появился лишний запрос или N+1.
+# PATCH стикера: пользователь, доска с правом и один UPDATE ... RETURNING
+PATCH_STICKER_BUDGET = 3
+GET_BOARD_BUDGET = 4
+GET_BOARDS_BUDGET = 5
+SHARE_BATCH_BUDGET = 6
+
+
+async def create_board(client: AsyncClient, headers: dict) -> int:
+    response = await client.post(
+        "/api/v1/boards",
+        json={"title": f"Budget Board {uuid.uuid4().hex[:8]}"},
+        headers=headers,
+    )
+    return response.json()["boardId"]
+
+
+async def create_sticker(client: AsyncClient, headers: dict, board_id: int) -> int:
+    response = await client.post(
+        f"/api/v1/boards/{board_id}/stickers",
+        json={"x": 10, "y": 20, "text": "budget"},
+        headers=headers,
+    )
+    return response.json()["stickerId"]
+
+
+@pytest.mark.asyncio
+async def test_patch_sticker_query_budget(
+    client: AsyncClient, count_queries, register_and_login
+):
+    """Перемещение стикера укладывается в бюджет запросов."""
+    _, headers = await register_and_login()
+    board_id = await create_board(client, headers)
+    sticker_id = await create_sticker(client, headers, board_id)
+
+    with count_queries() as stats:
+        response = await client.patch(
+            f"/api/v1/boards/{board_id}/stickers/{sticker_id}",
+            json={"x": 150.0, "y": 250.0},
+            headers=headers,
+        )
+
+    assert response.status_code == 200
+    assert "db;dur=" in response.headers["Server-Timing"]
+    assert stats.count <= PATCH_STICKER_BUDGET
+
+
+@pytest.mark.asyncio
+async def test_get_board_query_count_does_not_grow_with_stickers(
+    client: AsyncClient, count_queries, register_and_login
+):
+    """Число запросов при открытии доски не зависит от числа стикеров."""
+    _, headers = await register_and_login()
+    board_id = await create_board(client, headers)
+    await create_sticker(client, headers, board_id)
+
+    with count_queries() as one_sticker:
+        await client.get(
+            f"/api/v1/boards/{board_id}",
+            headers=headers,
+        )
+
+    for _ in range(4):
+        await create_sticker(client, headers, board_id)
+
+    with count_queries() as many_stickers:
+        response = await client.get(
+            f"/api/v1/boards/{board_id}",
+            headers=headers,
+        )
+
+    assert len(response.json()["stickers"]) == 5
+    assert many_stickers.count == one_sticker.count
+    assert many_stickers.count <= GET_BOARD_BUDGET
+
+
+@pytest.mark.asyncio
+async def test_get_boards_has_no_n_plus_one(
+    client: AsyncClient, count_queries, register_and_login
+):
+    """Список досок (свои и расшаренные) не делает запросов на каждую доску."""
+    user_login, user_headers = await register_and_login()
+    _, owner_headers = await register_and_login()
+
+    await create_board(client, user_headers)
+    shared_board_id = await create_board(client, owner_headers)
+    await client.post(
+        f"/api/v1/boards/{shared_board_id}/share",
+        json={"userLogin": user_login, "permission": "view"},
+        headers=owner_headers,
+    )
+
+    with count_queries() as few_boards:
+        await client.get(
+            "/api/v1/boards",
+            headers=user_headers,
+        )
+
+    for _ in range(3):
+        await create_board(client, user_headers)
+        shared_board_id = await create_board(client, owner_headers)
+        await client.post(
+            f"/api/v1/boards/{shared_board_id}/share",
+            json={"userLogin": user_login, "permission": "edit"},
+            headers=owner_headers,
+        )
+
+    with count_queries() as many_boards:
+        response = await client.get(
+            "/api/v1/boards",
+            headers=user_headers,
+        )
+
+    assert len(response.json()["boards"]) == 8
+    assert many_boards.count == few_boards.count
+    assert many_boards.count <= GET_BOARDS_BUDGET
+
+
+@pytest.mark.asyncio
+async def test_share_batch_query_count_is_constant(
+    client: AsyncClient, db: AsyncSession, count_queries, register_and_login
+):
+    """Пакетная выдача доступа не делает запросов на каждый логин."""
+    _, owner_headers = await register_and_login()
+    board_id = await create_board(client, owner_headers)
+    prefix = f"budgetbatch_{uuid.uuid4().hex[:8]}"
+    logins = [f"{prefix}_{index}@example.com" for index in range(30)]
+    await db.execute(
+        insert(User), [{"login": login, "hash_password": "!"} for login in logins]
+    )
+    await db.commit()
+
+    async def share(batch: list[str]):
+        with count_queries() as stats:
+            response = await client.post(
+                f"/api/v1/boards/{board_id}/share:batch",
+                json={
+                    "shares": [
+                        {"userLogin": login, "permission": "view"} for login in batch
+                    ]
+                },
+                headers=owner_headers,
+            )
+        assert response.status_code == 200
+        return stats
+
+    few = await share(logins[:3])
+    many = await share(logins)
+
+    assert many.count == few.count
+    assert many.count <= SHARE_BATCH_BUDGET
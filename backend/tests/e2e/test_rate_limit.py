@@ -0,0 +1,98 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from core import rate_limit
+from core.config import settings
+from core.rate_limit import MemoryRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_sticker_writes_over_limit_get_429(
+    client: AsyncClient, count_queries, monkeypatch, register_and_login
+):
+    """Сверх лимита пользователя запрос получает 429 без обращения к БД."""
+    monkeypatch.setattr(rate_limit, "rate_limiter", MemoryRateLimiter(100))
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_PER_SECOND", 0.01)
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_BURST", 2)
+
+    _, headers = await register_and_login()
+    board_response = await client.post(
+        "/api/v1/boards",
+        json={"title": f"Rate Board {uuid.uuid4().hex[:8]}"},
+        headers=headers,
+    )
+    board_id = board_response.json()["boardId"]
+
+    statuses = []
+    for _ in range(2):
+        response = await client.post(
+            f"/api/v1/boards/{board_id}/stickers",
+            json={"x": 1, "y": 2},
+            headers=headers,
+        )
+        statuses.append(response.status_code)
+    assert statuses == [201, 201]
+    assert response.headers["x-ratelimit-limit"] == "2"
+    assert response.headers["x-ratelimit-remaining"] == "0"
+
+    with count_queries() as stats:
+        response = await client.post(
+            f"/api/v1/boards/{board_id}/stickers",
+            json={"x": 1, "y": 2},
+            headers=headers,
+        )
+
+    assert response.status_code == 429
+    assert response.json()["detail"]["error"] == "RATE_LIMITED"
+    assert int(response.headers["retry-after"]) >= 1
+    assert response.headers["x-ratelimit-scope"] == "user"
+    assert stats.count == 0
+
+
+@pytest.mark.asyncio
+async def test_board_bucket_spent_only_by_writers(
+    client: AsyncClient, monkeypatch, register_and_login
+):
+    """Запросы без доступа к доске не расходуют её лимит, а 429 — ничей."""
+    monkeypatch.setattr(rate_limit, "rate_limiter", MemoryRateLimiter(100))
+    monkeypatch.setattr(settings, "RATE_LIMIT_BOARD_PER_SECOND", 0.01)
+    monkeypatch.setattr(settings, "RATE_LIMIT_BOARD_BURST", 2)
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_PER_SECOND", 0.01)
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_BURST", 3)
+
+    _, owner_headers = await register_and_login()
+    _, stranger_headers = await register_and_login()
+    board_id = (
+        await client.post(
+            "/api/v1/boards", json={"title": "Лимит доски"}, headers=owner_headers
+        )
+    ).json()["boardId"]
+    url = f"/api/v1/boards/{board_id}/stickers"
+
+    for headers in ({"Authorization": "Bearer junk"}, stranger_headers) * 3:
+        response = await client.post(url, json={"x": 1, "y": 2}, headers=headers)
+        assert response.status_code in (401, 403)
+
+    statuses = [
+        (await client.post(url, json={"x": 1, "y": 2}, headers=owner_headers))
+        for _ in range(3)
+    ]
+    assert [response.status_code for response in statuses] == [201, 201, 429]
+    assert statuses[-1].headers["x-ratelimit-scope"] == "board"
+
+    # Отказ по корзине доски не списал токен пользователя: на другой доске
+    # у владельца остался ровно один
+    other_id = (
+        await client.post(
+            "/api/v1/boards", json={"title": "Другая"}, headers=owner_headers
+        )
+    ).json()["boardId"]
+    response = await client.post(
+        f"/api/v1/boards/{other_id}/stickers",
+        json={"x": 1, "y": 2},
+        headers=owner_headers,
+    )
+    assert response.status_code == 201
+    assert response.headers["x-ratelimit-remaining"] == "0"
@@ -0,0 +1,85 @@
+import pytest
+from httpx import AsyncClient
+
+
+async def create_board(
+    client: AsyncClient, headers: dict, title: str, description: str | None = None
+) -> int:
+    response = await client.post(
+        "/api/v1/boards",
+        json={"title": title, "description": description},
+        headers=headers,
+    )
+    return response.json()["boardId"]
+
+
+async def search(client: AsyncClient, headers: dict, q: str, **params) -> list[int]:
+    response = await client.get(
+        "/api/v1/boards", params={"q": q, **params}, headers=headers
+    )
+    assert response.status_code == 200
+    return [board["boardId"] for board in response.json()["boards"]]
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_title_matches_first(
+    client: AsyncClient, register_and_login
+):
+    """Совпадение в заголовке выше совпадения только в описании."""
+    _, headers = await register_and_login()
+    in_description = await create_board(
+        client, headers, "Планы", "Ретроспектива спринта"
+    )
+    in_title = await create_board(client, headers, "Ретроспектива команды")
+    await create_board(client, headers, "Бэклог", "Задачи на квартал")
+
+    assert await search(client, headers, "ретро") == [in_title, in_description]
+    # Слова ищутся с учётом морфологии и все должны встретиться
+    assert await search(client, headers, "ретроспективы команда") == [in_title]
+
+
+@pytest.mark.asyncio
+async def test_search_respects_access(client: AsyncClient, register_and_login):
+    """Поиск видит свои и расшаренные доски, но не чужие."""
+    user_login, user_headers = await register_and_login()
+    _, owner_headers = await register_and_login()
+    own = await create_board(client, user_headers, "Roadmap mine")
+    shared = await create_board(client, owner_headers, "Roadmap shared")
+    await create_board(client, owner_headers, "Roadmap private")
+    await client.post(
+        f"/api/v1/boards/{shared}/share",
+        json={"userLogin": user_login, "permission": "view"},
+        headers=owner_headers,
+    )
+
+    assert sorted(await search(client, user_headers, "roadmap")) == [own, shared]
+    assert await search(client, user_headers, "roadmap", filter="shared") == [shared]
+    assert await search(client, user_headers, "roadmap", filter="own") == [own]
+
+
+@pytest.mark.asyncio
+async def test_search_follows_board_updates(client: AsyncClient, register_and_login):
+    """Поисковый документ пересчитывается при изменении доски."""
+    _, headers = await register_and_login()
+    board_id = await create_board(client, headers, "Черновик")
+
+    await client.put(
+        f"/api/v1/boards/{board_id}",
+        json={"title": "Онбординг новичков"},
+        headers=headers,
+    )
+
+    assert await search(client, headers, "черновик") == []
+    assert await search(client, headers, "онборд") == [board_id]
+
+
+@pytest.mark.asyncio
+async def test_search_query_without_words(client: AsyncClient, register_and_login):
+    """Запрос из одних спецсимволов ничего не находит и не ломает tsquery."""
+    _, headers = await register_and_login()
+    await create_board(client, headers, "Anything")
+
+    assert await search(client, headers, "&|!:*()") == []
+
+    response = await client.get("/api/v1/boards", params={"q": ""}, headers=headers)
+    assert response.status_code == 422
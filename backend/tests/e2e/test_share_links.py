@@ -0,0 +1,103 @@
+import pytest
+from httpx import AsyncClient
+
+
+async def create_board(client: AsyncClient, headers: dict) -> int:
+    response = await client.post(
+        "/api/v1/boards", json={"title": "По ссылке"}, headers=headers
+    )
+    return response.json()["boardId"]
+
+
+@pytest.mark.asyncio
+async def test_share_link_opens_board_without_auth_queries(
+    client: AsyncClient, count_queries, register_and_login
+):
+    """Держатель ссылки читает доску без входа; снимок общий до записи в доску."""
+    _, headers = await register_and_login()
+    board_id = await create_board(client, headers)
+
+    response = await client.post(
+        f"/api/v1/boards/{board_id}/links",
+        json={"expiresInSeconds": 3600},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    link = response.json()
+    assert link["permission"] == "view"
+
+    with count_queries() as first:
+        response = await client.get(
+            f"/api/v1/boards/{board_id}", params={"link": link["token"]}
+        )
+    assert response.status_code == 200, response.text
+    assert response.json()["permission"] == "view"
+    assert response.json()["stickers"] == []
+    assert response.headers["Cache-Control"] == "public, max-age=30"
+    # Доска, владелец и стикеры — без пользователя и проверки прав
+    assert first.count == 3
+
+    with count_queries() as second:
+        response = await client.get(
+            f"/api/v1/boards/{board_id}", params={"link": link["token"]}
+        )
+    assert response.status_code == 200
+    assert second.count == 0
+
+    await client.post(
+        f"/api/v1/boards/{board_id}/stickers",
+        json={"x": 0, "y": 0, "text": "новый"},
+        headers=headers,
+    )
+    response = await client.get(
+        f"/api/v1/boards/{board_id}", params={"link": link["token"]}
+    )
+    assert [sticker["text"] for sticker in response.json()["stickers"]] == ["новый"]
+
+
+@pytest.mark.asyncio
+async def test_share_link_is_bound_to_board_and_revocable(
+    client: AsyncClient, register_and_login
+):
+    """Ссылка не открывает другую доску и перестаёт действовать после отзыва."""
+    _, headers = await register_and_login()
+    _, other_headers = await register_and_login()
+    board_id = await create_board(client, headers)
+    other_board_id = await create_board(client, headers)
+
+    response = await client.post(
+        f"/api/v1/boards/{board_id}/links", json={}, headers=other_headers
+    )
+    assert response.status_code == 403
+
+    link = (
+        await client.post(f"/api/v1/boards/{board_id}/links", json={}, headers=headers)
+    ).json()
+
+    response = await client.get(
+        f"/api/v1/boards/{other_board_id}", params={"link": link["token"]}
+    )
+    assert response.status_code == 401
+    assert response.json()["detail"]["error"] == "INVALID_SHARE_LINK"
+
+    links = (
+        await client.get(f"/api/v1/boards/{board_id}/links", headers=headers)
+    ).json()["links"]
+    assert [item["linkId"] for item in links] == [link["linkId"]]
+
+    response = await client.delete(
+        f"/api/v1/boards/{board_id}/links/{link['linkId']}", headers=headers
+    )
+    assert response.status_code == 204
+
+    response = await client.get(
+        f"/api/v1/boards/{board_id}", params={"link": link["token"]}
+    )
+    assert response.status_code == 401
+    links = (
+        await client.get(f"/api/v1/boards/{board_id}/links", headers=headers)
+    ).json()["links"]
+    assert links == []
+
+    response = await client.get(f"/api/v1/boards/{board_id}")
+    assert response.status_code == 401
@@ -1,6 +1,10 @@
 import pytest
 import uuid
 from httpx import AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.user import User
 
 
 @pytest.mark.asyncio
@@ -166,3 +170,255 @@ async def test_revoke_share(client: AsyncClient):
         headers={"Authorization": f"Bearer {owner_token}"},
     )
     assert len(shares_response.json()["shares"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_share_board_batch(client: AsyncClient, register_and_login):
+    """Пакетная выдача: создаёт и обновляет доступы, итог по каждому логину."""
+    owner_login, owner_headers = await register_and_login()
+    first_login, _ = await register_and_login()
+    second_login, _ = await register_and_login()
+    missing_login = f"missing_{uuid.uuid4().hex[:8]}@example.com"
+    board_response = await client.post(
+        "/api/v1/boards", json={"title": "Batch"}, headers=owner_headers
+    )
+    board_id = board_response.json()["boardId"]
+    await client.post(
+        f"/api/v1/boards/{board_id}/share",
+        json={"userLogin": first_login, "permission": "view"},
+        headers=owner_headers,
+    )
+
+    response = await client.post(
+        f"/api/v1/boards/{board_id}/share:batch",
+        json={
+            "shares": [
+                {"userLogin": first_login, "permission": "edit"},
+                {"userLogin": missing_login, "permission": "view"},
+                {"userLogin": second_login, "permission": "view"},
+                {"userLogin": owner_login, "permission": "edit"},
+            ]
+        },
+        headers=owner_headers,
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(r["userLogin"], r["status"]) for r in results] == [
+        (first_login, "updated"),
+        (missing_login, "user_not_found"),
+        (second_login, "created"),
+        (owner_login, "owner"),
+    ]
+    assert results[0]["permission"] == "edit"
+    assert results[2]["permission"] == "view"
+
+    shares_response = await client.get(
+        f"/api/v1/boards/{board_id}/share", headers=owner_headers
+    )
+    assert {
+        share["userLogin"]: share["permission"]
+        for share in shares_response.json()["shares"]
+    } == {first_login: "edit", second_login: "view"}
+
+
+@pytest.mark.asyncio
+async def test_share_board_batch_validation(client: AsyncClient, register_and_login):
+    """Повтор логина и уровень owner отклоняются целиком."""
+    _, owner_headers = await register_and_login()
+    user_login, _ = await register_and_login()
+    board_response = await client.post(
+        "/api/v1/boards", json={"title": "Batch"}, headers=owner_headers
+    )
+    board_id = board_response.json()["boardId"]
+
+    duplicate = await client.post(
+        f"/api/v1/boards/{board_id}/share:batch",
+        json={
+            "shares": [
+                {"userLogin": user_login, "permission": "view"},
+                {"userLogin": user_login, "permission": "edit"},
+            ]
+        },
+        headers=owner_headers,
+    )
+    owner_permission = await client.post(
+        f"/api/v1/boards/{board_id}/share:batch",
+        json={"shares": [{"userLogin": user_login, "permission": "owner"}]},
+        headers=owner_headers,
+    )
+
+    assert duplicate.status_code == 422
+    assert owner_permission.status_code == 400
+    assert owner_permission.json()["detail"]["error"] == "INVALID_PERMISSION"
+
+
+@pytest.mark.asyncio
+async def test_revoke_share_batch(client: AsyncClient, register_and_login):
+    """Пакетный отзыв: итог по каждому логину."""
+    owner_login, owner_headers = await register_and_login()
+    shared_login, _ = await register_and_login()
+    other_login, _ = await register_and_login()
+    missing_login = f"missing_{uuid.uuid4().hex[:8]}@example.com"
+    board_response = await client.post(
+        "/api/v1/boards", json={"title": "Batch"}, headers=owner_headers
+    )
+    board_id = board_response.json()["boardId"]
+    await client.post(
+        f"/api/v1/boards/{board_id}/share",
+        json={"userLogin": shared_login, "permission": "edit"},
+        headers=owner_headers,
+    )
+
+    response = await client.request(
+        "DELETE",
+        f"/api/v1/boards/{board_id}/share:batch",
+        json={"userLogins": [shared_login, other_login, missing_login, owner_login]},
+        headers=owner_headers,
+    )
+
+    assert response.status_code == 200
+    assert [r["status"] for r in response.json()["results"]] == [
+        "revoked",
+        "not_shared",
+        "user_not_found",
+        "owner",
+    ]
+    shares_response = await client.get(
+        f"/api/v1/boards/{board_id}/share", headers=owner_headers
+    )
+    assert shares_response.json()["shares"] == []
+
+
+@pytest.mark.asyncio
+async def test_share_board_reports_created_or_updated(
+    client: AsyncClient, count_queries, register_and_login
+):
+    """Повторная выдача обновляет доступ, created показывает, что произошло."""
+    _, owner_headers = await register_and_login()
+    user_login, _ = await register_and_login()
+    board_response = await client.post(
+        "/api/v1/boards", json={"title": "Upsert"}, headers=owner_headers
+    )
+    board_id = board_response.json()["boardId"]
+
+    first = await client.post(
+        f"/api/v1/boards/{board_id}/share",
+        json={"userLogin": user_login, "permission": "view"},
+        headers=owner_headers,
+    )
+    with count_queries() as stats:
+        second = await client.post(
+            f"/api/v1/boards/{board_id}/share",
+            json={"userLogin": user_login, "permission": "edit"},
+            headers=owner_headers,
+        )
+
+    assert first.status_code == second.status_code == 200
+    assert first.json()["created"] is True
+    assert second.json()["created"] is False
+    assert second.json()["permission"] == "edit"
+    # Пользователь и доска из зависимостей, один INSERT ... ON CONFLICT и
+    # пересчёт effective_permissions (блокировка и один оператор)
+    assert stats.count <= 5
+
+
+@pytest.mark.asyncio
+async def test_share_and_revoke_errors(client: AsyncClient, register_and_login):
+    """Неизвестный логин, владелец и отсутствующий доступ дают свои ошибки."""
+    owner_login, owner_headers = await register_and_login()
+    user_login, _ = await register_and_login()
+    missing_login = f"missing_{uuid.uuid4().hex[:8]}@example.com"
+    board_response = await client.post(
+        "/api/v1/boards", json={"title": "Errors"}, headers=owner_headers
+    )
+    board_id = board_response.json()["boardId"]
+
+    async def share(login: str):
+        return await client.post(
+            f"/api/v1/boards/{board_id}/share",
+            json={"userLogin": login, "permission": "view"},
+            headers=owner_headers,
+        )
+
+    async def revoke(login: str):
+        return await client.request(
+            "DELETE",
+            f"/api/v1/boards/{board_id}/share",
+            json={"userLogin": login},
+            headers=owner_headers,
+        )
+
+    assert (await share(missing_login)).json()["detail"]["error"] == "USER_NOT_FOUND"
+    assert (await share(owner_login)).json()["detail"]["error"] == "INVALID_REQUEST"
+    assert (await revoke(missing_login)).json()["detail"]["error"] == "USER_NOT_FOUND"
+    assert (await revoke(user_login)).json()["detail"]["error"] == "ACCESS_NOT_FOUND"
+    assert (await revoke(owner_login)).json()["detail"]["error"] == "INVALID_REQUEST"
+
+
+@pytest.mark.asyncio
+async def test_get_board_shares_pagination_and_filters(
+    client: AsyncClient, db: AsyncSession, register_and_login
+):
+    """Список участников по страницам, с фильтрами и общим числом."""
+    _, owner_headers = await register_and_login()
+    board_response = await client.post(
+        "/api/v1/boards", json={"title": "Org-wide"}, headers=owner_headers
+    )
+    board_id = board_response.json()["boardId"]
+    prefix = f"page_{uuid.uuid4().hex[:8]}"
+    logins = [f"{prefix}_{'a' if index < 4 else 'b'}{index}@x.io" for index in range(9)]
+    await db.execute(
+        insert(User), [{"login": login, "hash_password": "!"} for login in logins]
+    )
+    await db.commit()
+    await client.post(
+        f"/api/v1/boards/{board_id}/share:batch",
+        json={
+            "shares": [
+                {"userLogin": login, "permission": "edit" if index % 3 else "view"}
+                for index, login in enumerate(logins)
+            ]
+        },
+        headers=owner_headers,
+    )
+
+    async def list_shares(**params) -> dict:
+        response = await client.get(
+            f"/api/v1/boards/{board_id}/share", params=params, headers=owner_headers
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 4}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = await list_shares(**params)
+        seen.extend(share["userLogin"] for share in page["shares"])
+        assert page["total"] is None
+        cursor = page["nextCursor"]
+        if cursor is None:
+            break
+    assert sorted(seen) == sorted(logins)
+    assert len(seen) == len(logins)
+
+    edit = await list_shares(permission="edit", includeTotal="true")
+    assert edit["total"] == 6
+    assert {share["permission"] for share in edit["shares"]} == {"edit"}
+
+    by_prefix = await list_shares(loginPrefix=f"{prefix}_a", includeTotal="true")
+    assert by_prefix["total"] == 4
+    assert sorted(share["userLogin"] for share in by_prefix["shares"]) == logins[:4]
+
+    # Символы LIKE в префиксе ищутся буквально
+    assert (await list_shares(loginPrefix=f"{prefix}%"))["shares"] == []
+
+    invalid = await client.get(
+        f"/api/v1/boards/{board_id}/share",
+        params={"cursor": "garbage"},
+        headers=owner_headers,
+    )
+    assert invalid.status_code == 422
@@ -0,0 +1,130 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.board import Board
+
+
+async def create_board(client: AsyncClient, headers: dict, title: str) -> int:
+    response = await client.post(
+        "/api/v1/boards", json={"title": title}, headers=headers
+    )
+    return response.json()["boardId"]
+
+
+async def add_sticker(
+    client: AsyncClient, headers: dict, board_id: int, text: str
+) -> int:
+    response = await client.post(
+        f"/api/v1/boards/{board_id}/stickers",
+        json={"x": 0, "y": 0, "text": text},
+        headers=headers,
+    )
+    return response.json()["stickerId"]
+
+
+async def search(client: AsyncClient, headers: dict, q: str, **params) -> dict:
+    response = await client.get(
+        "/api/v1/search/stickers", params={"q": q, **params}, headers=headers
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_sticker_search_covers_accessible_boards(
+    client: AsyncClient, db: AsyncSession, register_and_login
+):
+    """Свои, расшаренные и публичные доски видны в поиске, чужие — нет."""
+    word = f"zx{uuid.uuid4().hex[:8]}"
+    user_login, user_headers = await register_and_login()
+    _, owner_headers = await register_and_login()
+
+    own_board = await create_board(client, user_headers, "Мои планы")
+    shared_board = await create_board(client, owner_headers, "Общая")
+    public_board = await create_board(client, owner_headers, "Публичная")
+    private_board = await create_board(client, owner_headers, "Закрытая")
+    await client.post(
+        f"/api/v1/boards/{shared_board}/share",
+        json={"userLogin": user_login, "permission": "view"},
+        headers=owner_headers,
+    )
+    await db.execute(
+        update(Board).where(Board.board_id == public_board).values(is_public=True)
+    )
+    await db.commit()
+
+    own = await add_sticker(client, user_headers, own_board, f"Бюджет {word} на Q3")
+    shared = await add_sticker(client, owner_headers, shared_board, f"{word} shared")
+    public = await add_sticker(client, owner_headers, public_board, f"{word} public")
+    await add_sticker(client, owner_headers, private_board, f"{word} private")
+
+    data = await search(client, user_headers, word)
+
+    hits = {hit["stickerId"]: hit for hit in data["results"]}
+    assert set(hits) == {own, shared, public}
+    assert hits[own]["boardId"] == own_board
+    assert hits[own]["boardTitle"] == "Мои планы"
+    assert hits[own]["snippet"] == f"Бюджет <mark>{word}</mark> на Q3"
+    assert data["nextCursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_sticker_search_paginates_with_cursor(
+    client: AsyncClient, register_and_login
+):
+    """Курсор проходит все результаты без повторов и пропусков."""
+    word = f"qw{uuid.uuid4().hex[:8]}"
+    _, headers = await register_and_login()
+    board_id = await create_board(client, headers, "Много")
+    # Разная релевантность: слово повторяется разное число раз
+    sticker_ids = {
+        await add_sticker(client, headers, board_id, " ".join([word] * (index % 3 + 1)))
+        for index in range(7)
+    }
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3} if cursor is None else {"limit": 3, "cursor": cursor}
+        data = await search(client, headers, word, **params)
+        seen.extend(hit["stickerId"] for hit in data["results"])
+        cursor = data["nextCursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(sticker_ids)
+    assert set(seen) == sticker_ids
+
+    response = await client.get(
+        "/api/v1/search/stickers",
+        params={"q": word, "cursor": "not-a-cursor"},
+        headers=headers,
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"]["error"] == "INVALID_CURSOR"
+
+
+@pytest.mark.asyncio
+async def test_sticker_search_follows_writes(client: AsyncClient, register_and_login):
+    """Индекс следует за изменением текста; удалённая доска пропадает."""
+    _, headers = await register_and_login()
+    board_id = await create_board(client, headers, "Черновик")
+    sticker_id = await add_sticker(client, headers, board_id, "старый <текст>")
+
+    await client.patch(
+        f"/api/v1/boards/{board_id}/stickers/{sticker_id}",
+        json={"text": "новогодний <корпоратив> & подарки"},
+        headers=headers,
+    )
+
+    assert (await search(client, headers, "старый"))["results"] == []
+    [hit] = (await search(client, headers, "корпоратив"))["results"]
+    assert hit["snippet"] == "новогодний &lt;<mark>корпоратив</mark>&gt; &amp; подарки"
+
+    await client.delete(f"/api/v1/boards/{board_id}", headers=headers)
+
+    assert (await search(client, headers, "корпоратив"))["results"] == []
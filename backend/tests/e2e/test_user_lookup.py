@@ -0,0 +1,90 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.endpoints import users
+from core import rate_limit
+from core.cache import TTLCache
+from core.config import settings
+from core.rate_limit import MemoryRateLimiter
+from models.user import User
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    lookup_cache = TTLCache("user_lookup_test", max_entries=100, ttl=60)
+    monkeypatch.setattr(users, "user_lookup_cache", lookup_cache)
+    return lookup_cache
+
+
+@pytest.mark.asyncio
+async def test_lookup_by_prefix(
+    client: AsyncClient,
+    db: AsyncSession,
+    fresh_cache,
+    count_queries,
+    register_and_login,
+):
+    """Логины по префиксу в порядке возрастания, без спрашивающего, из кэша."""
+    prefix = f"lk{uuid.uuid4().hex[:8]}"
+    _, headers = await register_and_login(f"{prefix}_me@example.com")
+    logins = [f"{prefix}_{name}@example.com" for name in ("c", "a", "b", "d")]
+    await db.execute(
+        insert(User), [{"login": login, "hash_password": "!"} for login in logins]
+    )
+    await db.execute(
+        insert(User).values(login=f"{prefix[:-1]}_other@example.com", hash_password="!")
+    )
+    await db.commit()
+
+    response = await client.get(
+        "/api/v1/users/lookup", params={"prefix": prefix, "limit": 3}, headers=headers
+    )
+
+    assert response.status_code == 200
+    assert [user["login"] for user in response.json()["users"]] == sorted(logins)[:3]
+
+    with count_queries() as stats:
+        cached = await client.get(
+            "/api/v1/users/lookup",
+            params={"prefix": prefix, "limit": 20},
+            headers=headers,
+        )
+    assert [user["login"] for user in cached.json()["users"]] == sorted(logins)
+    # Только проверка токена: подсказки взяты из кэша
+    assert stats.count == 1
+
+
+@pytest.mark.asyncio
+async def test_lookup_validation_and_rate_limit(
+    client: AsyncClient, fresh_cache, monkeypatch, register_and_login
+):
+    """Короткий префикс и лимит сверх потолка отклоняются; частые запросы — 429."""
+    monkeypatch.setattr(rate_limit, "rate_limiter", MemoryRateLimiter(100))
+    monkeypatch.setattr(settings, "RATE_LIMIT_LOOKUP_PER_SECOND", 0.01)
+    monkeypatch.setattr(settings, "RATE_LIMIT_LOOKUP_BURST", 3)
+    _, headers = await register_and_login(
+        f"lookuplimit_{uuid.uuid4().hex[:8]}@example.com"
+    )
+
+    short = await client.get(
+        "/api/v1/users/lookup", params={"prefix": "a"}, headers=headers
+    )
+    too_many = await client.get(
+        "/api/v1/users/lookup",
+        params={"prefix": "ab", "limit": settings.USER_LOOKUP_MAX_RESULTS + 1},
+        headers=headers,
+    )
+    assert short.status_code == too_many.status_code == 422
+
+    statuses = []
+    for index in range(2):
+        response = await client.get(
+            "/api/v1/users/lookup", params={"prefix": f"zz{index}"}, headers=headers
+        )
+        statuses.append(response.status_code)
+    assert statuses == [200, 429]
+    assert response.headers["x-ratelimit-scope"] == "lookup"
@@ -0,0 +1,5 @@
+#!/bin/sh
+# Разрешает потоковую репликацию для реплики из профиля replica.
+# Выполняется только при инициализации нового каталога данных.
+set -e
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
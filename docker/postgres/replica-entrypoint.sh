@@ -0,0 +1,17 @@
+#!/bin/sh
+# Поднимает реплику: при первом запуске копирует данные с основной БД
+# через pg_basebackup и запускает postgres в режиме standby.
+set -e
+
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+  until PGPASSWORD="$POSTGRES_PASSWORD" pg_basebackup \
+      -h "${PRIMARY_HOST:-postgres}" -U "$POSTGRES_USER" \
+      -D "$PGDATA" -R -X stream; do
+    echo "Waiting for primary..."
+    rm -rf "${PGDATA:?}"/*
+    sleep 2
+  done
+  chmod 0700 "$PGDATA"
+fi
+
+exec postgres